@@ -0,0 +1,10 @@
+"""Benchmarks for the color package.
+
+Each module can be run from the repository root, e.g.
+
+    python -m benchmarks.bench_array
+
+The suite module times the hot paths of Color, saves the results as JSON, and
+compares them with a saved baseline; see its documentation.
+
+"""
@@ -0,0 +1,50 @@
+"""Compare a ColorArray against a list of Color instances.
+
+Reports the memory held by each container and the time taken by the bulk
+hex, rgb, and hsv conversions.
+
+"""
+
+import random
+import timeit
+import tracemalloc
+
+from color import Color, ColorArray
+
+__author__ = 'Tyler Crompton'
+
+
+def _measure(factory):
+    tracemalloc.start()
+    result = factory()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, size
+
+
+def main(count=200000, repeat=3):
+    random.seed(0)
+    samples = [(random.randrange(256), random.randrange(256),
+                random.randrange(256)) for _ in range(count)]
+
+    colors, list_size = _measure(lambda: [Color(*rgb) for rgb in samples])
+    array, array_size = _measure(lambda: ColorArray(colors))
+
+    print('{} colors'.format(count))
+    print('{:<10}{:>14}{:>14}'.format('memory', 'list[Color]', 'ColorArray'))
+    print('{:<10}{:>13.1f}M{:>13.1f}M'.format(
+        'bytes', list_size / 2 ** 20, array_size / 2 ** 20))
+
+    print('{:<10}{:>14}{:>14}'.format('seconds', 'list[Color]', 'ColorArray'))
+    for name, per_color, bulk in (
+            ('hex', lambda: [color.hex for color in colors], array.to_hex),
+            ('rgb', lambda: [color.rgb for color in colors], array.to_rgb),
+            ('hsv', lambda: [color.hsv for color in colors], array.to_hsv)):
+        print('{:<10}{:>14.4f}{:>14.4f}'.format(
+            name, min(timeit.repeat(per_color, number=1, repeat=repeat)),
+            min(timeit.repeat(bulk, number=1, repeat=repeat))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Time the basic operations of Color against the previous core and tuples.
+
+LegacyColor reproduces the accessors of the previous core: a lambda property
+per sample, a chain of comparisons in __getitem__, and a generator in
+__iter__.
+
+"""
+
+import timeit
+
+from color import Color
+
+__author__ = 'Tyler Crompton'
+
+
+def _validate_sample(value, depth):
+    if value < 0 or value >= 16 ** (depth / 4):
+        raise ValueError(
+            'Value must be within 0 to {}.'.format(16 ** (depth / 4) - 1))
+
+
+class LegacyColor(tuple):
+    __slots__ = ()
+
+    red = property(lambda self: tuple.__getitem__(self, 0))
+    green = property(lambda self: tuple.__getitem__(self, 1))
+    blue = property(lambda self: tuple.__getitem__(self, 2))
+    depth = property(lambda self: tuple.__getitem__(self, 3))
+
+    def __new__(cls, red, green, blue, depth=24):
+        locals()['red'] = None
+        locals()['green'] = None
+        locals()['blue'] = None
+        locals()['depth'] = None
+
+        _validate_sample(red, depth / 3)
+        _validate_sample(green, depth / 3)
+        _validate_sample(blue, depth / 3)
+
+        return tuple.__new__(cls, (red, green, blue, depth))
+
+    def __getitem__(self, item):
+        if item == 0 or item == -3:
+            return self.red
+        if item == 1 or item == -2:
+            return self.green
+        if item == 2 or item == -1:
+            return self.blue
+
+        raise IndexError('tuple index out of range')
+
+    def __iter__(self):
+        yield self[0]
+        yield self[1]
+        yield self[2]
+
+
+STATEMENTS = (
+    ('attribute', 'color.red; color.green; color.blue'),
+    ('index', 'color[0]; color[1]; color[-1]'),
+    ('unpack', 'r, g, b = color'),
+    ('construct', 'cls(30, 144, 255)'),
+)
+
+
+def main(number=200000, repeat=5):
+    print('{:<12}{:>12}{:>12}{:>12}'.format('', 'legacy', 'Color', 'tuple'))
+    for name, statement in STATEMENTS:
+        times = []
+        for cls in (LegacyColor, Color, None):
+            if cls is None:
+                if name == 'attribute':
+                    times.append('{:>12}'.format('-'))
+                    continue
+                setup = 'color = (30, 144, 255); cls = lambda *rgb: rgb'
+            else:
+                setup = 'color = cls(30, 144, 255)'
+            seconds = min(timeit.repeat(statement, setup, number=number,
+                                        repeat=repeat, globals={'cls': cls}))
+            times.append('{:>10.1f}ns'.format(seconds / number * 1e9))
+        print('{:<12}'.format(name) + ''.join(times))
+
+
+if __name__ == '__main__':
+    main()
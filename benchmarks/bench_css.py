@@ -0,0 +1,71 @@
+"""Compare Color.from_css with pre-parsing the CSS and calling Color.
+
+The pre-parser is the kind of thing that callers had to write before
+Color.from_css existed. It handles hexadecimal colors, keywords, and rgb()
+and hsl() with commas, which is less than Color.from_css does.
+
+"""
+
+import random
+import timeit
+from colorsys import hls_to_rgb
+
+from color import Color
+from color.css import parse
+
+__author__ = 'Tyler Crompton'
+
+
+def pre_parse(text):
+    text = text.strip().lower()
+    if text.startswith('#'):
+        return Color(text)
+    if text.startswith(('rgb(', 'rgba(', 'hsl(', 'hsla(')):
+        name, _, arguments = text.rstrip(')').partition('(')
+        values = [value.strip() for value in arguments.split(',')][:3]
+        if name.startswith('rgb'):
+            return Color(*(round(float(value[:-1]) * 2.55)
+                           if value.endswith('%') else int(value)
+                           for value in values))
+        hue, saturation, lightness = (float(value.rstrip('%'))
+                                      for value in values)
+        return Color(*(round(value * 255) for value in hls_to_rgb(
+            hue / 360, lightness / 100, saturation / 100)))
+
+    return Color.from_name(text)
+
+
+def main(count=100000, distinct=2000, repeat=3):
+    random.seed(0)
+    names = ['red', 'DodgerBlue', 'papayawhip', 'lightgoldenrodyellow']
+    palette = []
+    for _ in range(distinct):
+        r, g, b = (random.randrange(256) for _ in range(3))
+        palette.append(random.choice((
+            '#{:02x}{:02x}{:02x}'.format(r, g, b),
+            'rgb({}, {}, {})'.format(r, g, b),
+            'rgba({}, {}, {}, 0.5)'.format(r, g, b),
+            'hsl({}, {}%, {}%)'.format(r, g * 100 // 255, b * 100 // 255),
+            random.choice(names))))
+    strings = [random.choice(palette) for _ in range(count)]
+
+    def uncached():
+        return [parse.__wrapped__(string) for string in strings]
+
+    def cached():
+        parse.cache_clear()
+        return [Color.from_css(string) for string in strings]
+
+    print('{} strings, {} distinct'.format(count, distinct))
+    for name, function in (
+            ('pre-parse, Color()', lambda: [pre_parse(string)
+                                            for string in strings]),
+            ('Color.from_css, uncached', uncached),
+            ('Color.from_css', cached)):
+        seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+        print('{:<26}{:>8.4f}s{:>12.0f}/s'.format(name, seconds,
+                                                  count / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Measure the cost per pixel of each dithering method.
+
+Prints the time per pixel of reducing a 30-bit gradient to 12 bits with each
+method, next to plain rescaling.
+
+"""
+
+from timeit import Timer
+
+from color import Color, ColorArray, gradient_array
+from color.depth import rescale_many
+from color.dither import METHODS, dither
+
+__author__ = 'Tyler Crompton'
+
+
+def main(width=512, height=64):
+    row = list(gradient_array(Color(0, 0, 0, 30), Color(1023, 512, 0, 30),
+                              width))
+    image = ColorArray(row * height)
+    pixels = width * height
+
+    print('{}x{} image, 30 to 12 bits'.format(width, height))
+    cases = [('rescale', lambda: [rescale_many(channel, 30, 12)
+                                  for channel in (image.red, image.green,
+                                                  image.blue)])]
+    cases.extend((method, lambda method=method: dither(image, width, 12,
+                                                       method))
+                 for method in METHODS)
+    for name, function in cases:
+        number, seconds = Timer(function).autorange()
+        print('{:<16}{:>10.1f} ns/pixel'.format(
+            name, seconds / number / pixels * 1e9))
+
+
+if __name__ == '__main__':
+    main()
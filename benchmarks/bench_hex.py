@@ -0,0 +1,53 @@
+"""Compare the ways of parsing and formatting hexadecimal strings.
+
+Times one Color per string, the same with the hexadecimal cache enabled, and
+Color.parse_hex_many, then Color.hex against the bulk ColorArray.to_hex.
+
+"""
+
+import io
+import random
+import timeit
+
+from color import Color, cache
+
+__author__ = 'Tyler Crompton'
+
+
+def main(count=200000, distinct=5000, repeat=3):
+    random.seed(0)
+    palette = ['#{:06x}'.format(random.randrange(1 << 24))
+               for _ in range(distinct)]
+    strings = [random.choice(palette) for _ in range(count)]
+
+    def per_string():
+        return [Color(string) for string in strings]
+
+    def cached():
+        cache.enable(distinct)
+        try:
+            return per_string()
+        finally:
+            cache.disable()
+
+    print('{} strings, {} distinct'.format(count, distinct))
+    for name, function in (
+            ('Color(string)', per_string),
+            ('Color(string), cached', cached),
+            ('Color.parse_hex_many', lambda: Color.parse_hex_many(strings))):
+        print('{:<24}{:>10.4f}s'.format(
+            name, min(timeit.repeat(function, number=1, repeat=repeat))))
+
+    colors = per_string()
+    array = Color.parse_hex_many(strings)
+    for name, function in (
+            ('[color.hex]', lambda: [color.hex for color in colors]),
+            ('ColorArray.to_hex()', array.to_hex),
+            ('ColorArray.to_hex(stream)', lambda: array.to_hex(io.StringIO())),
+            ('ColorArray.to_hex(bytes)', lambda: array.to_hex(bytearray()))):
+        print('{:<26}{:>8.4f}s'.format(
+            name, min(timeit.repeat(function, number=1, repeat=repeat))))
+
+
+if __name__ == '__main__':
+    main()
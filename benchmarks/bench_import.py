@@ -0,0 +1,64 @@
+"""Measure the time it takes to import the color package.
+
+Prints the best of several cold imports, each in a new interpreter, as
+reported by python -X importtime, and the modules of the package that were
+imported. The bytecode is cached in a temporary directory, as it would be in
+an installed package, so compiling the sources is not part of the time.
+
+    python -m benchmarks.bench_import
+
+The suite module runs the same measurement as its 'import' case.
+
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+__author__ = 'Tyler Crompton'
+
+
+def _run(code, prefix):
+    environment = dict(os.environ, PYTHONPYCACHEPREFIX=prefix)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          env=environment, capture_output=True, text=True,
+                          check=True)
+
+
+def import_time(module='color', repeat=5):
+    """Return the best time of importing the module, in microseconds."""
+
+    code = 'import ' + module
+    with tempfile.TemporaryDirectory() as prefix:
+        _run(code, prefix)
+        times = []
+        for _ in range(repeat):
+            for line in _run(code, prefix).stderr.splitlines():
+                fields = line.split('|')
+                if len(fields) == 3 and fields[2].strip() == module:
+                    times.append(int(fields[1]))
+
+    return min(times)
+
+
+def imported_modules(module='color'):
+    """Return the names of the modules of the package that an import loads."""
+
+    with tempfile.TemporaryDirectory() as prefix:
+        output = _run('import sys, {0}\nprint(*sorted(name for name in '
+                      'sys.modules if name.partition(".")[0] == "{0}"))'.format(
+                          module), prefix).stdout
+
+    return output.split()
+
+
+def main():
+    print('import color{:>10,}us'.format(import_time()))
+    print('modules     ', ' '.join(imported_modules()))
+
+
+if __name__ == '__main__':
+    main()
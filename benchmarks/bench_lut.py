@@ -0,0 +1,41 @@
+"""Compare applying a transform directly and through a 3D LUT.
+
+Prints the time per pixel of a chain of color space conversions evaluated for
+every color, and of the same chain baked into a LUT with each interpolation.
+
+"""
+
+import random
+from timeit import Timer
+
+from color import Color, ColorArray
+from color.lut import INTERPOLATIONS, LUT
+
+__author__ = 'Tyler Crompton'
+
+
+def grade(color):
+    """Warm up, desaturate, and brighten a color through Lab."""
+
+    l, a, b = color.lab
+
+    return Color.from_lab(min(l * 1.1, 100), a * 0.8 + 4, b * 0.8 + 8)
+
+
+def main(count=100000, size=33):
+    random.seed(0)
+    colors = ColorArray.frombuffer(random.randbytes(count * 3))
+
+    print('{:,} random colors, {}-point LUTs'.format(count, size))
+    cases = [('direct', lambda: ColorArray(map(grade, colors)))]
+    for interpolation in INTERPOLATIONS:
+        lut = LUT.bake(grade, size, interpolation)
+        cases.append((interpolation, lambda lut=lut: lut.apply(colors)))
+    for name, function in cases:
+        number, seconds = Timer(function).autorange()
+        print('{:<16}{:>10.1f} ns/pixel'.format(
+            name, seconds / number / count * 1e9))
+
+
+if __name__ == '__main__':
+    main()
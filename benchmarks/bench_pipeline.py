@@ -0,0 +1,34 @@
+"""Compare recoloring a frame in this process and in a pool of processes.
+
+Prints the throughput of each transform with one process and with one per
+CPU.
+
+"""
+
+import os
+import random
+
+from color.pipeline import DepthReduction, HSVShift, PaletteMap, recolor
+
+__author__ = 'Tyler Crompton'
+
+
+def main(width=1920, height=1080):
+    random.seed(0)
+    frame = random.randbytes(width * height * 3)
+    palette = [tuple(random.randrange(256) for _ in range(3))
+               for _ in range(16)]
+    processes = os.cpu_count() or 1
+
+    print('{}x{} frame, {} CPUs'.format(width, height, processes))
+    for name, transform in (('HSVShift', HSVShift(0.25, 0.8, 0.9)),
+                            ('PaletteMap', PaletteMap(palette)),
+                            ('DepthReduction', DepthReduction(12))):
+        for count in sorted({1, processes}):
+            status = recolor(bytearray(frame), transform, processes=count)
+            print('{:<16}{:>3} process(es){:>14,.0f} pixels/s'.format(
+                name, count, status.pixels_per_second))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""Time the hot paths of Color and compare the results with a baseline.
+
+Run it from the repository root:
+
+    python -m benchmarks.suite --json before.json
+    python -m benchmarks.suite --compare before.json
+
+Each case is a timeit statement, timed in the best of several repeats of an
+automatically sized loop, and reported in nanoseconds per execution. With
+--json, the results are written as JSON along with the Python version and
+platform. With --compare, every case that is slower than in the baseline by
+more than the threshold is flagged as a regression, and the exit status is 1
+if there are any.
+
+The 'import' case is the time it takes to import the package in a new
+interpreter, measured by benchmarks.bench_import, so that changes that slow
+down startup are caught as well.
+
+The same cases run under pytest-benchmark, if it is installed:
+
+    python -m pytest benchmarks
+
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from .bench_import import import_time
+
+__author__ = 'Tyler Crompton'
+
+
+SETUP = '''
+import pickle
+from color import Color
+color = Color(30, 144, 255)
+pickled = pickle.dumps(color, pickle.HIGHEST_PROTOCOL)
+'''
+
+# Each case is a name and a statement that is run after SETUP.
+CASES = (
+    ('construct_rgb', 'Color(30, 144, 255)'),
+    ('construct_rgb_depth', 'Color(1023, 512, 0, 30)'),
+    ('construct_tuple', 'Color((30, 144, 255))'),
+    ('construct_tuple_depth', 'Color((1023, 512, 0), 30)'),
+    ('construct_hex', "Color('#1e90ff')"),
+    ('construct_hex_bare', "Color('1e90ff')"),
+    ('construct_name', "Color.from_name('dodger blue')"),
+    ('construct_css', "Color.from_css('rgb(30 144 255)')"),
+    ('construct_css_hex', "Color.from_css('#1e90ff')"),
+    ('construct_int', 'Color.from_int(0x1e90ff)'),
+    ('hex', 'color.hex'),
+    ('hsv', 'color.hsv'),
+    ('delta_e', "color.delta_e(Color.RED, 'cie76')"),
+    ('blend', 'color.blend(Color.RED)'),
+    ('constant', 'Color.DODGER_BLUE'),
+    ('attributes', 'color.red; color.green; color.blue; color.depth'),
+    ('iter', 'red, green, blue = color'),
+    ('getitem', 'color[0]; color[1]; color[2]'),
+    ('getitem_negative', 'color[-1]'),
+    ('getitem_slice', 'color[1:]'),
+    ('pickle_dumps', 'pickle.dumps(color, pickle.HIGHEST_PROTOCOL)'),
+    ('pickle_loads', 'pickle.loads(pickled)'),
+    ('hash', 'hash(color)'),
+)
+
+
+def case_function(statement):
+    """Return a function of no arguments that runs the statement once."""
+
+    namespace = {}
+    exec(SETUP, namespace)
+    exec('def run():\n' + ''.join(
+        '    ' + line + '\n' for line in statement.splitlines()), namespace)
+
+    return namespace['run']
+
+
+def time_case(statement, repeat=5):
+    """Return the best time of the statement, in nanoseconds per run."""
+
+    timer = timeit.Timer(statement, SETUP)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def compare(results, baseline, threshold=0.1):
+    """Return the (name, baseline, result, ratio) of each regression.
+
+    A case regresses if it takes more than 1 + threshold times as long as in
+    the baseline. Cases that are only in one of the two are ignored.
+
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            ratio = result / baseline[name]
+            if ratio > 1 + threshold:
+                regressions.append((name, baseline[name], result, ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite',
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', metavar='case',
+                        help='the cases to run; all of them by default')
+    parser.add_argument('--json', metavar='FILE',
+                        help='write the results to FILE')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results with those in FILE')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the slowdown that counts as a regression '
+                             '(default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='the number of repeats (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.names) - {name for name, _ in CASES} - {'import'}
+    if unknown:
+        parser.error('unknown cases: {}'.format(', '.join(sorted(unknown))))
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+
+    results = {}
+    for name, statement in CASES + (('import', None),):
+        if args.names and name not in args.names:
+            continue
+        if statement is None:
+            results[name] = import_time(repeat=args.repeat) * 1000
+        else:
+            results[name] = time_case(statement, args.repeat)
+        line = '{:<24}{:>10.1f}ns'.format(name, results[name])
+        if name in baseline:
+            line += '{:>10.1f}ns{:>+8.1%}'.format(
+                baseline[name], results[name] / baseline[name] - 1)
+        print(line)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'unit': 'ns',
+                'results': results,
+            }, file, indent=2, sort_keys=True)
+            file.write('\n')
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print('REGRESSION {}: {:.1f}ns -> {:.1f}ns ({:.2f}x)'.format(
+            name, before, after, ratio))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Run the cases of the benchmark suite under pytest-benchmark.
+
+The module is skipped if pytest-benchmark is not installed.
+
+"""
+
+import pytest
+
+from benchmarks.suite import CASES, case_function
+
+__author__ = 'Tyler Crompton'
+
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('statement', [statement for _, statement in CASES],
+                         ids=[name for name, _ in CASES])
+def test_case(benchmark, statement):
+    benchmark(case_function(statement))
@@ -6,32 +6,116 @@ The Color class provides nearly every thing one could want to do with colors.
 
 from collections import OrderedDict
 from colorsys import rgb_to_hsv
-
-__all__ = ('Color',)
+from itertools import islice
+
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    def _tuplegetter(index, doc):
+        return property(lambda self: tuple.__getitem__(self, index), doc=doc)
+
+from . import cache as _cache
+from .cache import derived as _derived
+from .depth import _maximum, rescale as _rescale
+from .hsv import hsv_to_rgb_many
+from .spaces import (lab_to_rgb, oklab_to_rgb, rgb_to_lab, rgb_to_oklab,
+                     rgb_to_xyz, xyz_to_rgb)
+
+__all__ = ('Color', 'ColorArray', 'extract_palette', 'gradient',
+           'gradient_array', 'pairwise_delta_e', 'scan')
 __author__ = 'Tyler Crompton'
 
 
-# noinspection PyPep8Naming
-class _classproperty(property):
-    # noinspection PyMethodOverriding
-    def __get__(self, instance, owner):
-        return self.fget.__get__(None, owner)(owner)
-
-
 def _validate_sample(value, depth):
     if value < 0 or value >= 16 ** (depth / 4):
         raise ValueError(
             'Value must be within 0 to {}.'.format(16 ** (depth / 4) - 1))
 
 
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+
+# Colors index and iterate over their red, green, and blue samples only.
+_INDEXES = (0, 1, 2)
+_RGB = slice(3)
+_WHOLE = slice(None)
+
+
+def _parse_hex(cls, value):
+    value = value[1:] if value.startswith('#') else value
+    if len(value) % 3:
+        raise ValueError('Invalid number of characters')
+    triplet_length = len(value) // 3
+
+    # Plain hexadecimal digits can neither be negative nor out of range, so
+    # the whole string is converted at once and there is nothing to validate.
+    if value and not value.strip(_HEX_DIGITS):
+        bits = triplet_length * 4
+        mask = (1 << bits) - 1
+        value = int(value, 16)
+        return cls._make((value >> bits * 2, value >> bits & mask,
+                          value & mask, bits * 3))
+
+    red = int(value[:triplet_length], 16)
+    green = int(value[triplet_length:triplet_length * 2], 16)
+    blue = int(value[triplet_length * 2:triplet_length * 3], 16)
+    depth = len(value) * 4
+
+    _validate_sample(red, depth / 3)
+    _validate_sample(green, depth / 3)
+    _validate_sample(blue, depth / 3)
+
+    return cls._make((red, green, blue, depth))
+
+
+# Colors parsed from strings are kept in the cache of derived values when it
+# is enabled, so parsing a cached string returns the same instance.
+_hex_parser = _derived(_parse_hex)
+
+# The modules that Color methods delegate to are imported on first use, so
+# that importing Color does not import them, and are kept here so that later
+# calls do not pay for an import statement.
+_array = _composite = _css = _difference = _nearest = None
+
+_HEX_CHUNK_SIZE = 1 << 16
+_HEX_BYTES = tuple('{:02x}'.format(value) for value in range(256))
+_HEX_FORMATS = {}
+
+
+def _hex_format(depth):
+    """Return the string that formats a color of the depth as hexadecimal."""
+
+    try:
+        return _HEX_FORMATS[depth]
+    except KeyError:
+        pass
+
+    if depth % 12:
+        raise TypeError('The hexadecimal represention cannot be generated '
+                        'for colors with a non-duodecimal depth.')
+
+    # Yo, dawg.
+    return _HEX_FORMATS.setdefault(
+        depth, '#{{:0{0}x}}{{:0{0}x}}{{:0{0}x}}'.format(depth // 12))
+
+
+def _write_text(out, text):
+    """Write text to a text stream or append it to a bytearray."""
+
+    if isinstance(out, bytearray):
+        out += text.encode('ascii')
+    else:
+        out.write(text)
+
+
 class Color(tuple):
     """A class to represent a color.
 
     Valid color values are hexadecimal or RGB values. If an RGB values is used,
     the color depth can be optionally provided.
 
-    Since this class is intended to be mutable, the class property "constants"
-    return a new instance with each access.
+    The named color constants (e.g. Color.RED) are created once, when the
+    module is imported, and every access returns the same instance. Aliases,
+    such as GRAY and GREY, are the same instance as well.
 
     In all honesty, this class is so hacky, that I discourage using this. I've
     poured magic sauce on everything. Lasciate ogne speranza, voi ch'entrate.
@@ -40,54 +124,146 @@ class Color(tuple):
 
     __slots__ = ()
 
-    red = property(lambda self: tuple.__getitem__(self, 0),
-                   doc='Gets the red sample.')
-    green = property(lambda self: tuple.__getitem__(self, 1),
-                     doc='Gets the green sample.')
-    blue = property(lambda self: tuple.__getitem__(self, 2),
-                    doc='Gets the blue simple.')
-    depth = property(lambda self: tuple.__getitem__(self, 3),
-                     doc='Get the color depth.')
+    red = _tuplegetter(0, 'Gets the red sample.')
+    green = _tuplegetter(1, 'Gets the green sample.')
+    blue = _tuplegetter(2, 'Gets the blue simple.')
+    depth = _tuplegetter(3, 'Get the color depth.')
+
+    # Creates an instance from a (red, green, blue, depth) tuple without
+    # validating it, for samples that are known to be valid.
+    _make = classmethod(tuple.__new__)
 
     def __new__(cls, *args):
         """Create new instance of Color(red, green, blue)"""
 
-        locals()['red'] = None
-        locals()['green'] = None
-        locals()['blue'] = None
-        locals()['depth'] = None
-
-        if len(args) == 1:
+        if len(args) == 3:
+            red, green, blue = args
+            depth = 24
+        elif len(args) == 1:
             try:
-                value = args[0][1:] if args[0].startswith('#') else args[0]
+                args[0].startswith
             except AttributeError:
-                return tuple.__new__(cls, (args[0][0], args[0][1], args[0][2],
-                                           24))
-            if len(value) % 3:
-                raise ValueError('Invalid number of characters')
-            triplet_length = len(value) // 3
-            red = int(value[:triplet_length], 16)
-            green = int(value[triplet_length:triplet_length * 2], 16)
-            blue = int(value[triplet_length * 2:triplet_length * 3], 16)
-            depth = len(value) * 3
+                return cls._make((args[0][0], args[0][1], args[0][2], 24))
+            return _hex_parser(cls, args[0])
         elif len(args) == 2:
             if args[1] <= 0:
                 raise ValueError('The depth must be a positive integer.')
-            return tuple.__new__(cls, (args[0][0], args[0][1], args[0][2],
-                                       args[1]))
-        elif len(args) == 3:
-            red, green, blue = args
-            depth = 24
+            return cls._make((args[0][0], args[0][1], args[0][2], args[1]))
         else:
             red, green, blue, depth = args
             if depth <= 0:
                 raise ValueError('The depth must be a positive integer.')
 
-        _validate_sample(red, depth / 3)
-        _validate_sample(green, depth / 3)
-        _validate_sample(blue, depth / 3)
+        limit = 2 ** (depth / 3)
+        if not (0 <= red < limit and 0 <= green < limit and
+                0 <= blue < limit):
+            _validate_sample(red, depth / 3)
+            _validate_sample(green, depth / 3)
+            _validate_sample(blue, depth / 3)
+
+        return cls._make((red, green, blue, depth))
 
-        return tuple.__new__(cls, (red, green, blue, depth))
+    @staticmethod
+    def set_hex_cache_size(maxsize):
+        """Cache the colors created from hexadecimal strings.
+
+        This is the same as color.cache.enable(maxsize), or
+        color.cache.disable() if maxsize is 0, so values derived from colors
+        are cached too. Constructing a Color from a cached string again
+        returns the same instance.
+
+        """
+
+        if maxsize:
+            _cache.enable(maxsize)
+        else:
+            _cache.disable()
+
+    @staticmethod
+    def hex_cache_info():
+        """Return the statistics of the cache, or None if it is disabled."""
+
+        return _cache.info()
+
+    @classmethod
+    def parse_hex_many(cls, strings):
+        """Return a ColorArray of the colors of the hexadecimal strings.
+
+        Every string must have the same number of digits, with or without a
+        leading '#'.
+
+        """
+
+        global _array
+        if _array is None:
+            from . import array as _array
+
+        return _array.ColorArray.from_hex(strings)
+
+    @classmethod
+    def from_name(cls, name):
+        """Return the named color, e.g. Color.from_name('dodger blue')
+
+        Case, whitespace, hyphens and underscores are ignored, so 'DODGER_BLUE'
+        and 'dodgerblue' are accepted as well.
+
+        """
+
+        try:
+            return _COLORS_BY_NAME[_normalize_name(name)]
+        except KeyError:
+            raise ValueError('Unknown color name: {}.'.format(repr(name)))
+
+    @classmethod
+    def from_css(cls, text):
+        """Return the color of a CSS color string.
+
+        Hexadecimal colors, keywords, and the rgb(), rgba(), hsl(), hsla(),
+        hwb(), lab(), lch(), oklab(), and oklch() functions are accepted, e.g.
+        Color.from_css('rgb(30 144 255 / 50%)'). The alpha is ignored, and the
+        color is 24-bit.
+
+        """
+
+        global _css
+        if _css is None:
+            from . import css as _css
+
+        return _css.parse(text)
+
+    @property
+    def name(self):
+        """Gets the name of the matching constant, or None if there is none."""
+
+        if self.depth != 24:
+            return None
+
+        return _NAMES_BY_RGB.get(self.red << 16 | self.green << 8 | self.blue)
+
+    def nearest_name(self, metric='euclidean'):
+        """Return the name of the closest constant.
+
+        The metric is 'euclidean' (the distance in RGB space), 'redmean' (a
+        weighted RGB distance that better matches perception), or 'cie76' (the
+        distance in CIELAB space).
+
+        """
+
+        global _nearest
+        if _nearest is None:
+            from . import nearest as _nearest
+
+        return _nearest.nearest_name(self, metric)
+
+    @classmethod
+    def nearest_names(cls, colors, metric='euclidean'):
+        """Return the name of the closest constant to each of the colors."""
+
+        global _nearest
+        if _nearest is None:
+            from . import nearest as _nearest
+
+        return _nearest.nearest_names(colors, metric)
 
     def __repr__(self):
         return 'Color({}, {}, {}, {})'.format(repr(self.red), repr(self.green),
@@ -105,39 +281,130 @@ class Color(tuple):
         })
 
     def __getitem__(self, item):
-        if item == 0 or item == -3:
-            return self.red
-        if item == 1 or item == -2:
-            return self.green
-        if item == 2 or item == -1:
-            return self.blue
+        if item.__class__ is slice:
+            return tuple.__getitem__(self, _RGB)[item]
 
-        raise IndexError('tuple index out of range')
+        return tuple.__getitem__(self, _INDEXES[item])
 
     def __iter__(self):
-        yield self[0]
-        yield self[1]
-        yield self[2]
-
-    def __getnewargs__(self):
-        """Return self as a plain tuple.  Used by copy and pickle."""
-
-        return tuple(self)
+        return tuple.__iter__(tuple.__getitem__(self, _RGB))
 
-    def __getstate__(self):
-        """Exclude the OrderedDict from pickling"""
+    def __reduce__(self):
+        """Return the samples and the depth.  Used by copy and pickle."""
 
-        return None
+        return self.__class__, tuple.__getitem__(self, _WHOLE)
 
     @property
+    @_derived
     def hex(self):
-        if self.depth % 12:
-            raise TypeError('The hexadecimal represention cannot be generated '
-                            'for colors with a non-duodecimal depth.')
+        red, green, blue, depth = tuple.__iter__(self)
+        if depth == 24:
+            return '#' + _HEX_BYTES[red] + _HEX_BYTES[green] + _HEX_BYTES[blue]
+
+        return _hex_format(depth).format(red, green, blue)
+
+    @classmethod
+    def to_hex_many(cls, colors, out=None, sep='\n'):
+        """Return or write the hexadecimal representation of each color.
+
+        If out is None, a list is returned. Otherwise, each representation
+        followed by sep is written to out, which is either a text stream or a
+        bytearray.
+
+        """
 
-        # Yo, dawg.
-        return '#{{:0{0}x}}{{:0{0}x}}{{:0{0}x}}'.format(
-            self.depth // 12).format(self.red, self.green, self.blue)
+        global _array
+        if _array is None:
+            from . import array as _array
+
+        if isinstance(colors, _array.ColorArray):
+            return colors.to_hex(out, sep)
+
+        strings = map(cls.hex.fget, colors)
+        if out is None:
+            return list(strings)
+
+        while True:
+            chunk = list(islice(strings, _HEX_CHUNK_SIZE))
+            if not chunk:
+                break
+            _write_text(out, sep.join(chunk) + sep)
+
+    def to_depth(self, depth):
+        """Return the color rescaled to another depth.
+
+        Both depths must be multiples of 3. Samples are rounded to the
+        nearest integer, e.g. Color(1023, 512, 0, 30).to_depth(24) is
+        Color(255, 128, 0, 24).
+
+        """
+
+        return type(self)._make((
+            _rescale(self.red, self.depth, depth),
+            _rescale(self.green, self.depth, depth),
+            _rescale(self.blue, self.depth, depth), depth))
+
+    def to_int(self, alpha=0):
+        """Return the samples packed into an integer.
+
+        Each sample takes depth / 3 bits, with red the most significant, so a
+        24-bit color is 0xRRGGBB and a 30-bit color is packed 10-10-10. The
+        alpha, if any, is put above the samples, e.g. Color.RED.to_int(0xff)
+        is 0xffff0000.
+
+        """
+
+        red, green, blue, depth = tuple.__iter__(self)
+        _maximum(depth)
+        bits = depth // 3
+
+        return alpha << depth | red << bits * 2 | green << bits | blue
+
+    @classmethod
+    def from_int(cls, value, depth=24):
+        """Return the color of an integer packed as to_int packs it.
+
+        Any bits above the samples, such as the alpha of 0xAARRGGBB, are
+        ignored.
+
+        """
+
+        mask = _maximum(depth)
+        bits = depth // 3
+
+        return cls._make((value >> bits * 2 & mask, value >> bits & mask,
+                          value & mask, depth))
+
+    @classmethod
+    def from_ints(cls, ints, depth=24):
+        """Return a ColorArray of the colors of packed integers.
+
+        See ColorArray.from_ints.
+
+        """
+
+        global _array
+        if _array is None:
+            from . import array as _array
+
+        return _array.ColorArray.from_ints(ints, depth)
+
+    @classmethod
+    def to_ints(cls, colors, alpha=0):
+        """Return an array of the colors packed into integers.
+
+        See ColorArray.to_ints.
+
+        """
+
+        global _array
+        if _array is None:
+            from . import array as _array
+
+        if not isinstance(colors, _array.ColorArray):
+            colors = _array.ColorArray(colors)
+
+        return colors.to_ints(alpha)
 
     @property
     def rgb(self):
@@ -145,754 +412,133 @@ class Color(tuple):
 
     @property
     def hue(self):
-        return rgb_to_hsv(self.red, self.green, self.blue)[0]
+        return self.hsv[0]
 
     @property
     def saturation(self):
-        return rgb_to_hsv(self.red, self.green, self.blue)[1]
+        return self.hsv[1]
 
     @property
     def value(self):
-        return rgb_to_hsv(self.red, self.green, self.blue)[2]
+        return self.hsv[2]
 
     @property
+    @_derived
     def hsv(self):
         return rgb_to_hsv(self.red, self.green, self.blue)
 
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ALICE_BLUE(cls):
-        return cls(240, 248, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ANTIQUE_WHITE(cls):
-        return cls(250, 235, 215)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def AQUA(cls):
-        return cls(0, 255, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def AQUA_MARINE(cls):
-        return cls(127, 255, 212)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def AZURE(cls):
-        return cls(240, 255, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BEIGE(cls):
-        return cls(245, 245, 220)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BISQUE(cls):
-        return cls(255, 228, 196)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BLACK(cls):
-        return cls(0, 0, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BLANCHED_ALMOND(cls):
-        return cls(255, 235, 205)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BLUE(cls):
-        return cls(0, 0, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BLUE_VIOLET(cls):
-        return cls(138, 43, 226)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BROWN(cls):
-        return cls(165, 42, 42)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def BURLY_WOOD(cls):
-        return cls(222, 184, 135)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CADET_BLUE(cls):
-        return cls(95, 158, 160)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CHARTREUSE(cls):
-        return cls(127, 255, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CHOCOLATE(cls):
-        return cls(210, 105, 30)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CORAL(cls):
-        return cls(255, 127, 80)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CORNFLOWER_BLUE(cls):
-        return cls(100, 149, 237)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CORN_SILK(cls):
-        return cls(255, 248, 220)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CRIMSON(cls):
-        return cls(220, 20, 60)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def CYAN(cls):
-        return cls(0, 255, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_BLUE(cls):
-        return cls(0, 0, 139)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_CYAN(cls):
-        return cls(0, 139, 139)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_GOLDENROD(cls):
-        return cls(184, 134, 11)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_GRAY(cls):
-        return cls(169, 169, 169)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_GREY(cls):
-        return cls(169, 169, 169)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_GREEN(cls):
-        return cls(0, 100, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_KHAKI(cls):
-        return cls(189, 183, 107)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_MAGENTA(cls):
-        return cls(139, 0, 139)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_OLIVE_GREEN(cls):
-        return cls(85, 107, 47)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_ORANGE(cls):
-        return cls(255, 140, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_ORCHID(cls):
-        return cls(153, 50, 204)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_RED(cls):
-        return cls(139, 0, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_SALMON(cls):
-        return cls(233, 150, 122)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_SEA_GREEN(cls):
-        return cls(143, 188, 143)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_SLATE_BLUE(cls):
-        return cls(72, 61, 139)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_SLATE_GRAY(cls):
-        return cls(47, 79, 79)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_SLATE_GREY(cls):
-        return cls(47, 79, 79)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_TURQUOISE(cls):
-        return cls(0, 206, 209)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DARK_VIOLET(cls):
-        return cls(148, 0, 211)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DEEP_PINK(cls):
-        return cls(255, 20, 147)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DEEP_SKY_BLUE(cls):
-        return cls(0, 191, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DIM_GRAY(cls):
-        return cls(105, 105, 105)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DIM_GREY(cls):
-        return cls(105, 105, 105)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def DODGER_BLUE(cls):
-        return cls(30, 144, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def FIRE_BRICK(cls):
-        return cls(178, 34, 34)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def FLORAL_WHITE(cls):
-        return cls(255, 250, 240)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def FOREST_GREEN(cls):
-        return cls(34, 139, 34)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def FUCHSIA(cls):
-        return cls(255, 0, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GAINSBORO(cls):
-        return cls(220, 220, 220)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GHOST_WHITE(cls):
-        return cls(248, 248, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GOLD(cls):
-        return cls(255, 215, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GOLDENROD(cls):
-        return cls(218, 165, 32)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GRAY(cls):
-        return cls(128, 128, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GREY(cls):
-        return cls(128, 128, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GREEN(cls):
-        return cls(0, 128, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def GREEN_YELLOW(cls):
-        return cls(173, 255, 47)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def HONEYDEW(cls):
-        return cls(240, 255, 240)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def HOT_PINK(cls):
-        return cls(255, 105, 180)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def INDIAN_RED(cls):
-        return cls(205, 92, 92)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def INDIGO(cls):
-        return cls(75, 0, 130)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def IVORY(cls):
-        return cls(255, 255, 240)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def KHAKI(cls):
-        return cls(240, 230, 140)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LAVENDER(cls):
-        return cls(230, 230, 250)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LAVENDER_BLUSH(cls):
-        return cls(255, 240, 245)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LAWN_GREEN(cls):
-        return cls(124, 252, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LEMON_CHIFFON(cls):
-        return cls(255, 250, 205)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_BLUE(cls):
-        return cls(173, 216, 230)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_CORAL(cls):
-        return cls(240, 128, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_CYAN(cls):
-        return cls(224, 255, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_GOLDENROD_YELLOW(cls):
-        return cls(250, 250, 210)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_GRAY(cls):
-        return cls(211, 211, 211)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_GREY(cls):
-        return cls(211, 211, 211)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_GREEN(cls):
-        return cls(144, 238, 144)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_PINK(cls):
-        return cls(255, 182, 193)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_SALMON(cls):
-        return cls(255, 160, 122)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_SEA_GREEN(cls):
-        return cls(32, 178, 170)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_SKY_BLUE(cls):
-        return cls(135, 206, 250)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_SLATE_GRAY(cls):
-        return cls(119, 136, 153)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_SLATE_GREY(cls):
-        return cls(119, 136, 153)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_STEEL_BLUE(cls):
-        return cls(176, 196, 222)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIGHT_YELLOW(cls):
-        return cls(255, 255, 224)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIME(cls):
-        return cls(0, 255, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LIME_GREEN(cls):
-        return cls(50, 205, 50)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def LINEN(cls):
-        return cls(250, 240, 230)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MAGENTA(cls):
-        return cls(255, 0, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MAROON(cls):
-        return cls(128, 0, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_AQUA_MARINE(cls):
-        return cls(102, 205, 170)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_BLUE(cls):
-        return cls(0, 0, 205)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_ORCHID(cls):
-        return cls(186, 85, 211)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_PURPLE(cls):
-        return cls(147, 112, 216)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_SEA_GREEN(cls):
-        return cls(60, 179, 113)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_SLATE_BLUE(cls):
-        return cls(123, 104, 238)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_SPRING_GREEN(cls):
-        return cls(0, 250, 154)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_TURQUOISE(cls):
-        return cls(72, 209, 204)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MEDIUM_VIOLET_RED(cls):
-        return cls(199, 21, 133)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MIDNIGHT_BLUE(cls):
-        return cls(25, 25, 112)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MINT_CREAM(cls):
-        return cls(245, 255, 250)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MISTY_ROSE(cls):
-        return cls(255, 228, 225)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def MOCCASIN(cls):
-        return cls(255, 228, 181)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def NAVAJO_WHITE(cls):
-        return cls(255, 222, 173)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def NAVY(cls):
-        return cls(0, 0, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def OLD_LACE(cls):
-        return cls(253, 245, 230)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def OLIVE(cls):
-        return cls(128, 128, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def OLIVE_DRAB(cls):
-        return cls(107, 142, 35)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ORANGE(cls):
-        return cls(255, 165, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ORANGE_RED(cls):
-        return cls(255, 69, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ORCHID(cls):
-        return cls(218, 112, 214)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PALE_GOLDENROD(cls):
-        return cls(238, 232, 170)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PALE_GREEN(cls):
-        return cls(152, 251, 152)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PALE_TURQUOISE(cls):
-        return cls(175, 238, 238)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PALE_VIOLET_RED(cls):
-        return cls(216, 112, 147)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PAPAYA_WHIP(cls):
-        return cls(255, 239, 213)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PEACH_PUFF(cls):
-        return cls(255, 218, 185)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PERU(cls):
-        return cls(205, 133, 63)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PINK(cls):
-        return cls(255, 192, 203)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PLUM(cls):
-        return cls(221, 160, 221)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def POWDER_BLUE(cls):
-        return cls(176, 224, 230)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def PURPLE(cls):
-        return cls(128, 0, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def RED(cls):
-        return cls(255, 0, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ROSY_BROWN(cls):
-        return cls(188, 143, 143)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def ROYAL_BLUE(cls):
-        return cls(65, 105, 225)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SADDLE_BROWN(cls):
-        return cls(139, 69, 19)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SALMON(cls):
-        return cls(250, 128, 114)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SANDY_BROWN(cls):
-        return cls(244, 164, 96)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SEA_GREEN(cls):
-        return cls(46, 139, 87)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SEA_SHELL(cls):
-        return cls(255, 245, 238)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SIENNA(cls):
-        return cls(160, 82, 45)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SILVER(cls):
-        return cls(192, 192, 192)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SKY_BLUE(cls):
-        return cls(135, 206, 235)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SLATE_BLUE(cls):
-        return cls(106, 90, 205)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SLATE_GRAY(cls):
-        return cls(112, 128, 144)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SLATE_GREY(cls):
-        return cls(112, 128, 144)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SNOW(cls):
-        return cls(255, 250, 250)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def SPRING_GREEN(cls):
-        return cls(0, 255, 127)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def STEEL_BLUE(cls):
-        return cls(70, 130, 180)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def TAN(cls):
-        return cls(210, 180, 140)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def TEAL(cls):
-        return cls(0, 128, 128)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def THISTLE(cls):
-        return cls(216, 191, 216)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def TOMATO(cls):
-        return cls(255, 99, 71)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def TURQUOISE(cls):
-        return cls(64, 224, 208)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def VIOLET(cls):
-        return cls(238, 130, 238)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def WHEAT(cls):
-        return cls(245, 222, 179)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def WHITE(cls):
-        return cls(255, 255, 255)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def WHITE_SMOKE(cls):
-        return cls(245, 245, 245)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def YELLOW(cls):
-        return cls(255, 255, 0)
-
-    # noinspection PyPep8Naming,PyMethodParameters,PyCallingNonCallable
-    @_classproperty
-    def YELLOW_GREEN(cls):
-        return cls(154, 205, 50)
+    @property
+    @_derived
+    def xyz(self):
+        """Gets the CIE XYZ coordinates, with Y = 1 for white."""
+
+        return rgb_to_xyz(self.red, self.green, self.blue, self.depth)
+
+    @property
+    @_derived
+    def lab(self):
+        """Gets the CIELAB (L*, a*, b*) coordinates under D65."""
+
+        return rgb_to_lab(self.red, self.green, self.blue, self.depth)
+
+    @property
+    @_derived
+    def oklab(self):
+        """Gets the OKLab (L, a, b) coordinates."""
+
+        return rgb_to_oklab(self.red, self.green, self.blue, self.depth)
+
+    @classmethod
+    def from_xyz(cls, x, y, z, depth=24):
+        """Return the color of the CIE XYZ coordinates.
+
+        This is the inverse of xyz. Colors outside of the sRGB gamut are
+        clamped to it.
+
+        """
+
+        return cls._make(xyz_to_rgb(x, y, z, depth) + (depth,))
+
+    @classmethod
+    def from_lab(cls, l, a, b, depth=24):
+        """Return the color of the CIELAB coordinates.
+
+        This is the inverse of lab. Colors outside of the sRGB gamut are
+        clamped to it.
+
+        """
+
+        return cls._make(lab_to_rgb(l, a, b, depth) + (depth,))
+
+    @classmethod
+    def from_oklab(cls, l, a, b, depth=24):
+        """Return the color of the OKLab coordinates.
+
+        This is the inverse of oklab. Colors outside of the sRGB gamut are
+        clamped to it.
+
+        """
+
+        return cls._make(oklab_to_rgb(l, a, b, depth) + (depth,))
+
+    def delta_e(self, other, method='ciede2000'):
+        """Return the perceived difference between the color and another.
+
+        The method is 'cie76', 'cie94', or 'ciede2000'.
+
+        """
+
+        global _difference
+        if _difference is None:
+            from . import difference as _difference
+
+        return _difference.delta_e(self, other, method)
+
+    def blend(self, source, mode='normal', opacity=1.0, linear=False):
+        """Return the source color blended onto the color.
+
+        The mode is 'normal', 'multiply', 'screen', 'overlay', or
+        'linear_light', and the result is composited over the color with the
+        opacity of the source. If linear is true, the samples are blended as
+        linear light. See color.composite.
+
+        """
+
+        global _composite
+        if _composite is None:
+            from . import composite as _composite
+
+        return _composite.blend(self, source, mode, opacity, linear)
+
+    @classmethod
+    def hsv_many(cls, colors):
+        """Return a list of the (hue, saturation, value) of each color."""
+
+        global _array
+        if _array is None:
+            from . import array as _array
+
+        if isinstance(colors, _array.ColorArray):
+            return colors.to_hsv()
+
+        return [rgb_to_hsv(color[0], color[1], color[2]) for color in colors]
+
+    @classmethod
+    def from_hsv_many(cls, triplets, depth=24):
+        """Return a list of colors from (hue, saturation, value) triplets.
+
+        This is the inverse of hsv_many. The samples are rounded to the
+        nearest integer.
+
+        """
+
+        triplets = list(triplets)
+        red, green, blue = hsv_to_rgb_many(
+            [triplet[0] for triplet in triplets],
+            [triplet[1] for triplet in triplets],
+            [triplet[2] for triplet in triplets])
+
+        return [cls(*rgb, depth) for rgb in zip(red, green, blue)]
 
     def __contains__(self, item):
         return NotImplemented
@@ -926,3 +572,205 @@ class Color(tuple):
 
     def index(self, value, start=None, stop=None):
         return NotImplemented
+
+
+# The SVG 1.1 color keyword names, in the spelling of the Color constants.
+_NAMED_COLORS = (
+    ('ALICE_BLUE', 240, 248, 255),
+    ('ANTIQUE_WHITE', 250, 235, 215),
+    ('AQUA', 0, 255, 255),
+    ('AQUA_MARINE', 127, 255, 212),
+    ('AZURE', 240, 255, 255),
+    ('BEIGE', 245, 245, 220),
+    ('BISQUE', 255, 228, 196),
+    ('BLACK', 0, 0, 0),
+    ('BLANCHED_ALMOND', 255, 235, 205),
+    ('BLUE', 0, 0, 255),
+    ('BLUE_VIOLET', 138, 43, 226),
+    ('BROWN', 165, 42, 42),
+    ('BURLY_WOOD', 222, 184, 135),
+    ('CADET_BLUE', 95, 158, 160),
+    ('CHARTREUSE', 127, 255, 0),
+    ('CHOCOLATE', 210, 105, 30),
+    ('CORAL', 255, 127, 80),
+    ('CORNFLOWER_BLUE', 100, 149, 237),
+    ('CORN_SILK', 255, 248, 220),
+    ('CRIMSON', 220, 20, 60),
+    ('CYAN', 0, 255, 255),
+    ('DARK_BLUE', 0, 0, 139),
+    ('DARK_CYAN', 0, 139, 139),
+    ('DARK_GOLDENROD', 184, 134, 11),
+    ('DARK_GRAY', 169, 169, 169),
+    ('DARK_GREY', 169, 169, 169),
+    ('DARK_GREEN', 0, 100, 0),
+    ('DARK_KHAKI', 189, 183, 107),
+    ('DARK_MAGENTA', 139, 0, 139),
+    ('DARK_OLIVE_GREEN', 85, 107, 47),
+    ('DARK_ORANGE', 255, 140, 0),
+    ('DARK_ORCHID', 153, 50, 204),
+    ('DARK_RED', 139, 0, 0),
+    ('DARK_SALMON', 233, 150, 122),
+    ('DARK_SEA_GREEN', 143, 188, 143),
+    ('DARK_SLATE_BLUE', 72, 61, 139),
+    ('DARK_SLATE_GRAY', 47, 79, 79),
+    ('DARK_SLATE_GREY', 47, 79, 79),
+    ('DARK_TURQUOISE', 0, 206, 209),
+    ('DARK_VIOLET', 148, 0, 211),
+    ('DEEP_PINK', 255, 20, 147),
+    ('DEEP_SKY_BLUE', 0, 191, 255),
+    ('DIM_GRAY', 105, 105, 105),
+    ('DIM_GREY', 105, 105, 105),
+    ('DODGER_BLUE', 30, 144, 255),
+    ('FIRE_BRICK', 178, 34, 34),
+    ('FLORAL_WHITE', 255, 250, 240),
+    ('FOREST_GREEN', 34, 139, 34),
+    ('FUCHSIA', 255, 0, 255),
+    ('GAINSBORO', 220, 220, 220),
+    ('GHOST_WHITE', 248, 248, 255),
+    ('GOLD', 255, 215, 0),
+    ('GOLDENROD', 218, 165, 32),
+    ('GRAY', 128, 128, 128),
+    ('GREY', 128, 128, 128),
+    ('GREEN', 0, 128, 0),
+    ('GREEN_YELLOW', 173, 255, 47),
+    ('HONEYDEW', 240, 255, 240),
+    ('HOT_PINK', 255, 105, 180),
+    ('INDIAN_RED', 205, 92, 92),
+    ('INDIGO', 75, 0, 130),
+    ('IVORY', 255, 255, 240),
+    ('KHAKI', 240, 230, 140),
+    ('LAVENDER', 230, 230, 250),
+    ('LAVENDER_BLUSH', 255, 240, 245),
+    ('LAWN_GREEN', 124, 252, 0),
+    ('LEMON_CHIFFON', 255, 250, 205),
+    ('LIGHT_BLUE', 173, 216, 230),
+    ('LIGHT_CORAL', 240, 128, 128),
+    ('LIGHT_CYAN', 224, 255, 255),
+    ('LIGHT_GOLDENROD_YELLOW', 250, 250, 210),
+    ('LIGHT_GRAY', 211, 211, 211),
+    ('LIGHT_GREY', 211, 211, 211),
+    ('LIGHT_GREEN', 144, 238, 144),
+    ('LIGHT_PINK', 255, 182, 193),
+    ('LIGHT_SALMON', 255, 160, 122),
+    ('LIGHT_SEA_GREEN', 32, 178, 170),
+    ('LIGHT_SKY_BLUE', 135, 206, 250),
+    ('LIGHT_SLATE_GRAY', 119, 136, 153),
+    ('LIGHT_SLATE_GREY', 119, 136, 153),
+    ('LIGHT_STEEL_BLUE', 176, 196, 222),
+    ('LIGHT_YELLOW', 255, 255, 224),
+    ('LIME', 0, 255, 0),
+    ('LIME_GREEN', 50, 205, 50),
+    ('LINEN', 250, 240, 230),
+    ('MAGENTA', 255, 0, 255),
+    ('MAROON', 128, 0, 0),
+    ('MEDIUM_AQUA_MARINE', 102, 205, 170),
+    ('MEDIUM_BLUE', 0, 0, 205),
+    ('MEDIUM_ORCHID', 186, 85, 211),
+    ('MEDIUM_PURPLE', 147, 112, 216),
+    ('MEDIUM_SEA_GREEN', 60, 179, 113),
+    ('MEDIUM_SLATE_BLUE', 123, 104, 238),
+    ('MEDIUM_SPRING_GREEN', 0, 250, 154),
+    ('MEDIUM_TURQUOISE', 72, 209, 204),
+    ('MEDIUM_VIOLET_RED', 199, 21, 133),
+    ('MIDNIGHT_BLUE', 25, 25, 112),
+    ('MINT_CREAM', 245, 255, 250),
+    ('MISTY_ROSE', 255, 228, 225),
+    ('MOCCASIN', 255, 228, 181),
+    ('NAVAJO_WHITE', 255, 222, 173),
+    ('NAVY', 0, 0, 128),
+    ('OLD_LACE', 253, 245, 230),
+    ('OLIVE', 128, 128, 0),
+    ('OLIVE_DRAB', 107, 142, 35),
+    ('ORANGE', 255, 165, 0),
+    ('ORANGE_RED', 255, 69, 0),
+    ('ORCHID', 218, 112, 214),
+    ('PALE_GOLDENROD', 238, 232, 170),
+    ('PALE_GREEN', 152, 251, 152),
+    ('PALE_TURQUOISE', 175, 238, 238),
+    ('PALE_VIOLET_RED', 216, 112, 147),
+    ('PAPAYA_WHIP', 255, 239, 213),
+    ('PEACH_PUFF', 255, 218, 185),
+    ('PERU', 205, 133, 63),
+    ('PINK', 255, 192, 203),
+    ('PLUM', 221, 160, 221),
+    ('POWDER_BLUE', 176, 224, 230),
+    ('PURPLE', 128, 0, 128),
+    ('RED', 255, 0, 0),
+    ('ROSY_BROWN', 188, 143, 143),
+    ('ROYAL_BLUE', 65, 105, 225),
+    ('SADDLE_BROWN', 139, 69, 19),
+    ('SALMON', 250, 128, 114),
+    ('SANDY_BROWN', 244, 164, 96),
+    ('SEA_GREEN', 46, 139, 87),
+    ('SEA_SHELL', 255, 245, 238),
+    ('SIENNA', 160, 82, 45),
+    ('SILVER', 192, 192, 192),
+    ('SKY_BLUE', 135, 206, 235),
+    ('SLATE_BLUE', 106, 90, 205),
+    ('SLATE_GRAY', 112, 128, 144),
+    ('SLATE_GREY', 112, 128, 144),
+    ('SNOW', 255, 250, 250),
+    ('SPRING_GREEN', 0, 255, 127),
+    ('STEEL_BLUE', 70, 130, 180),
+    ('TAN', 210, 180, 140),
+    ('TEAL', 0, 128, 128),
+    ('THISTLE', 216, 191, 216),
+    ('TOMATO', 255, 99, 71),
+    ('TURQUOISE', 64, 224, 208),
+    ('VIOLET', 238, 130, 238),
+    ('WHEAT', 245, 222, 179),
+    ('WHITE', 255, 255, 255),
+    ('WHITE_SMOKE', 245, 245, 245),
+    ('YELLOW', 255, 255, 0),
+    ('YELLOW_GREEN', 154, 205, 50),
+)
+_COLORS_BY_NAME = {}
+_NAMES_BY_RGB = {}
+
+
+def _normalize_name(name):
+    return ''.join(name.split()).replace('_', '').replace('-', '').lower()
+
+
+def _register_named_colors():
+    colors = {}
+    for name, red, green, blue in _NAMED_COLORS:
+        packed = red << 16 | green << 8 | blue
+        if packed not in colors:
+            colors[packed] = Color._make((red, green, blue, 24))
+            _NAMES_BY_RGB[packed] = name
+        setattr(Color, name, colors[packed])
+        _COLORS_BY_NAME[_normalize_name(name)] = colors[packed]
+
+
+_register_named_colors()
+
+
+# The rest of the package is only imported when it is first used, so that
+# importing Color does not import every module.
+_LAZY = {
+    'ColorArray': 'array',
+    'extract_palette': 'quantize',
+    'gradient': 'gradients',
+    'gradient_array': 'gradients',
+    'pairwise_delta_e': 'difference',
+    'scan': 'scanner',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError('module {} has no attribute {}'.format(
+            repr(__name__), repr(name)))
+
+    # This is from .module import name.
+    value = getattr(__import__(module, globals(), None, (name,), 1), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,573 @@
+"""This module includes the ColorArray class.
+
+The ColorArray class stores a large number of colors in contiguous typed
+buffers instead of one Color instance per element.
+
+"""
+
+import mmap as _mmap
+import sys
+from array import array
+from colorsys import rgb_to_hsv
+from itertools import repeat
+from operator import and_, lshift, or_, rshift, sub
+
+from . import (_HEX_CHUNK_SIZE, _HEX_DIGITS, Color, _hex_format, _parse_hex,
+               _validate_sample, _write_text)
+from .depth import (_maximum, _typecode, rescale, rescale_many,
+                    rescale_table)
+from .hsv import hsv_to_rgb_many, rgb_to_hsv_many
+from .spaces import (lab_to_rgb_many, oklab_to_rgb_many, rgb_to_lab_many,
+                     rgb_to_oklab_many, rgb_to_xyz_many, xyz_to_rgb_many)
+
+__all__ = ('ColorArray',)
+__author__ = 'Tyler Crompton'
+
+
+def _channel(values, depth):
+    """Return a memoryview of a validated typed buffer holding the values."""
+
+    if values:
+        _validate_sample(min(values), depth / 3)
+        _validate_sample(max(values), depth / 3)
+
+    return memoryview(array(_typecode(depth), values))
+
+
+def _interleave(red, green, blue):
+    """Return the 8-bit samples of the channels as one bytearray."""
+
+    samples = bytearray(len(red) * 3)
+    samples[0::3] = red
+    samples[1::3] = green
+    samples[2::3] = blue
+
+    return samples
+
+
+# The interleaved layouts map to the number of bytes per pixel. The packed
+# layouts map to the typecode of a pixel, the shift and width of each channel
+# in bits, and the depth of the decoded colors.
+_INTERLEAVED_LAYOUTS = {'RGB888': 3, 'RGBA8888': 4}
+_PACKED_LAYOUTS = {
+    'RGB565': ('H', ((11, 5), (5, 6), (0, 5)), 24),
+    'RGB101010': ('I', ((20, 10), (10, 10), (0, 10)), 30),
+}
+
+
+class ColorArray(object):
+    """A class to represent a fixed-length sequence of colors.
+
+    The red, green, and blue samples are stored in three typed buffers, and
+    every color in the array shares a single depth. Indexing returns a Color;
+    slicing returns a ColorArray that shares the buffers of the original, so
+    no samples are copied.
+
+    """
+
+    __slots__ = ('_red', '_green', '_blue', '_depth')
+
+    def __init__(self, colors=(), depth=None):
+        """Create new instance of ColorArray(colors, depth)
+
+        The colors may be Color instances or (red, green, blue) triples. If
+        the depth is omitted, it is taken from the first Color, or 24 is used.
+
+        """
+
+        colors = list(colors)
+        if depth is None:
+            depth = colors[0].depth if colors and isinstance(
+                colors[0], Color) else 24
+        if depth <= 0:
+            raise ValueError('The depth must be a positive integer.')
+        for color in colors:
+            if isinstance(color, Color) and color.depth != depth:
+                raise ValueError('Every color must have a depth of {}.'.format(
+                    depth))
+
+        self._red = _channel([color[0] for color in colors], depth)
+        self._green = _channel([color[1] for color in colors], depth)
+        self._blue = _channel([color[2] for color in colors], depth)
+        self._depth = depth
+
+    @classmethod
+    def frombuffer(cls, buffer, layout='RGB888', byteorder=sys.byteorder):
+        """Create a ColorArray that wraps the pixels of an existing buffer.
+
+        The buffer is any object that supports the buffer protocol. Its
+        memory is shared, not copied, and changes to one are seen by the
+        other. The layout is one of:
+
+        'RGB888' and 'RGBA8888'
+            8-bit samples, one byte each, with the alpha ignored. The colors
+            have a depth of 24.
+        'RGB565'
+            16-bit pixels with 5, 6, and 5 bits of red, green, and blue. The
+            samples are scaled to a depth of 24 whenever a color is read.
+        'RGB101010'
+            32-bit pixels with 10 bits per sample in the low 30 bits. The
+            colors have a depth of 30.
+
+        The packed layouts are read in the given byte order. If it is not
+        the native one, the pixels have to be copied once.
+
+        """
+
+        samples = memoryview(buffer).cast('B')
+        if layout in _INTERLEAVED_LAYOUTS:
+            step = _INTERLEAVED_LAYOUTS[layout]
+            if len(samples) % step:
+                raise ValueError('The buffer does not hold a whole number of '
+                                 'pixels.')
+            return cls._from_channels(samples[0::step], samples[1::step],
+                                      samples[2::step], 24)
+
+        try:
+            typecode, _, depth = _PACKED_LAYOUTS[layout]
+        except KeyError:
+            raise ValueError('Unknown layout: {}.'.format(repr(layout)))
+        if len(samples) % array(typecode).itemsize:
+            raise ValueError('The buffer does not hold a whole number of '
+                             'pixels.')
+        if byteorder != sys.byteorder:
+            pixels = array(typecode, samples.tobytes())
+            pixels.byteswap()
+            samples = memoryview(pixels).cast('B')
+
+        return _PackedColorArray(samples.cast(typecode), layout)
+
+    @classmethod
+    def from_file(cls, path, layout='RGB888', mmap=True,
+                  byteorder=sys.byteorder):
+        """Create a ColorArray of the pixels of a raw image file.
+
+        If mmap is true, the file is memory-mapped read-only, so pixels are
+        only read from disk as they are used; otherwise, the file is read
+        into memory. See frombuffer for the layouts.
+
+        """
+
+        with open(path, 'rb') as file:
+            if not mmap:
+                return cls.frombuffer(bytearray(file.read()), layout,
+                                      byteorder)
+            try:
+                buffer = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                buffer = b''
+
+        return cls.frombuffer(buffer, layout, byteorder)
+
+    @classmethod
+    def from_hex(cls, strings):
+        """Create a ColorArray from hexadecimal strings.
+
+        Every string must have the same number of digits, with or without a
+        leading '#'. The strings that Color accepts are accepted, and invalid
+        strings raise the same errors as Color does.
+
+        """
+
+        strings = list(strings)
+        if not strings:
+            return cls()
+
+        digits = ''.join(strings)
+        prefixed = list(map(str.startswith, strings, repeat('#')))
+        if True in prefixed:
+            digits = digits.replace('#', '', prefixed.count(True))
+        widths = set(map(sub, map(len, strings), prefixed))
+        width = widths.pop()
+
+        if widths or width % 3 or not width or digits.strip(_HEX_DIGITS):
+            # Strings that Color accepts but the fast path does not, such as
+            # ones with surrounding whitespace, are parsed one at a time.
+            colors = [_parse_hex(Color, string) for string in strings]
+            depth = colors[0].depth
+            for color in colors:
+                if color.depth != depth:
+                    raise ValueError('Every string must have the same number '
+                                     'of digits.')
+            return cls(colors, depth)
+
+        depth = width * 4
+        if width == 6:
+            samples = bytearray.fromhex(digits)
+        elif width == 12:
+            samples = array('H', bytes.fromhex(digits))
+            if sys.byteorder == 'little':
+                samples.byteswap()
+        else:
+            triplet_length = width // 3
+            samples = array(_typecode(depth), map(
+                int, map(digits.__getitem__, map(
+                    slice, range(0, len(digits), triplet_length),
+                    range(triplet_length, len(digits) + 1, triplet_length))),
+                repeat(16)))
+        samples = memoryview(samples)
+
+        return cls._from_channels(samples[0::3], samples[1::3], samples[2::3],
+                                  depth)
+
+    @classmethod
+    def from_ints(cls, ints, depth=24):
+        """Create a ColorArray from integers packed as Color.to_int packs them.
+
+        The integers are an iterable or a buffer, such as array('I'). Bits
+        above the samples, such as the alpha of 0xAARRGGBB, are ignored. 24-bit
+        colors are copied out of a buffer of 32-bit integers a channel at a
+        time, without reading the integers one by one.
+
+        """
+
+        mask = _maximum(depth)
+        bits = depth // 3
+        try:
+            view = memoryview(ints)
+        except TypeError:
+            view = None
+        else:
+            if (depth == 24 and view.itemsize == 4 and view.format in 'iIlL'
+                    and view.c_contiguous):
+                samples = view.cast('B')
+                if sys.byteorder == 'little':
+                    return cls._from_channels(bytearray(samples[2::4]),
+                                              bytearray(samples[1::4]),
+                                              bytearray(samples[0::4]), 24)
+                return cls._from_channels(bytearray(samples[1::4]),
+                                          bytearray(samples[2::4]),
+                                          bytearray(samples[3::4]), 24)
+
+        if view is None:
+            ints = list(ints)
+        typecode = _typecode(depth)
+
+        return cls._from_channels(
+            array(typecode, map(and_, map(rshift, ints, repeat(bits * 2)),
+                                repeat(mask))),
+            array(typecode, map(and_, map(rshift, ints, repeat(bits)),
+                                repeat(mask))),
+            array(typecode, map(and_, ints, repeat(mask))), depth)
+
+    @classmethod
+    def from_hsv(cls, hues, saturations, values, depth=24):
+        """Create a ColorArray from buffers of hues, saturations and values.
+
+        This is the inverse of to_hsv. The samples are rounded to the nearest
+        integer.
+
+        """
+
+        red, green, blue = hsv_to_rgb_many(hues, saturations, values)
+
+        return cls._from_channels(_channel(red, depth), _channel(green, depth),
+                                  _channel(blue, depth), depth)
+
+    @classmethod
+    def from_xyz(cls, x, y, z, depth=24):
+        """Create a ColorArray from buffers of CIE XYZ coordinates."""
+
+        return cls._from_samples(xyz_to_rgb_many(x, y, z, depth), depth)
+
+    @classmethod
+    def from_lab(cls, l, a, b, depth=24):
+        """Create a ColorArray from buffers of CIELAB coordinates."""
+
+        return cls._from_samples(lab_to_rgb_many(l, a, b, depth), depth)
+
+    @classmethod
+    def from_oklab(cls, l, a, b, depth=24):
+        """Create a ColorArray from buffers of OKLab coordinates."""
+
+        return cls._from_samples(oklab_to_rgb_many(l, a, b, depth), depth)
+
+    @classmethod
+    def _from_samples(cls, samples, depth):
+        """Wrap lists of red, green, and blue samples known to be valid."""
+
+        typecode = _typecode(depth)
+
+        return cls._from_channels(array(typecode, samples[0]),
+                                  array(typecode, samples[1]),
+                                  array(typecode, samples[2]), depth)
+
+    @classmethod
+    def _from_channels(cls, red, green, blue, depth):
+        """Wrap three existing channel buffers without validating them."""
+
+        self = object.__new__(cls)
+        self._red = memoryview(red)
+        self._green = memoryview(green)
+        self._blue = memoryview(blue)
+        self._depth = depth
+
+        return self
+
+    red = property(lambda self: self._red,
+                   doc='Gets a view of the red samples.')
+    green = property(lambda self: self._green,
+                     doc='Gets a view of the green samples.')
+    blue = property(lambda self: self._blue,
+                    doc='Gets a view of the blue samples.')
+    depth = property(lambda self: self._depth,
+                     doc='Get the color depth.')
+
+    @property
+    def nbytes(self):
+        """Gets the number of bytes spanned by the sample buffers."""
+
+        return self._red.nbytes + self._green.nbytes + self._blue.nbytes
+
+    def __repr__(self):
+        return 'ColorArray({}, {})'.format(repr(list(self)),
+                                           repr(self._depth))
+
+    def __len__(self):
+        return len(self._red)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._from_channels(self._red[item], self._green[item],
+                                       self._blue[item], self._depth)
+
+        return Color._make((self._red[item], self._green[item],
+                            self._blue[item], self._depth))
+
+    def _color(self, value):
+        """Return a color or a triple as a Color of the depth of the array."""
+
+        if isinstance(value, Color):
+            if value.depth != self._depth:
+                raise ValueError('Every color must have a depth of {}.'.format(
+                    self._depth))
+            return value
+
+        return Color(value[0], value[1], value[2], self._depth)
+
+    def _colors(self, key, values):
+        """Return the colors assigned to a slice, checking their number."""
+
+        colors = [self._color(value) for value in values]
+        if len(colors) != len(range(*key.indices(len(self)))):
+            raise ValueError('There must be as many colors as the slice '
+                             'holds.')
+
+        return colors
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            colors = self._colors(key, value)
+            for channel, index in ((self._red, 0), (self._green, 1),
+                                   (self._blue, 2)):
+                channel[key] = array(channel.format,
+                                     [color[index] for color in colors])
+            return
+
+        value = self._color(value)
+        self._red[key] = value.red
+        self._green[key] = value.green
+        self._blue[key] = value.blue
+
+    def __iter__(self):
+        depth = self._depth
+        make = Color._make
+        for red, green, blue in zip(self._red, self._green, self._blue):
+            yield make((red, green, blue, depth))
+
+    def __eq__(self, other):
+        if not isinstance(other, ColorArray):
+            return NotImplemented
+
+        return (self._depth == other._depth and self._red == other._red and
+                self._green == other._green and self._blue == other._blue)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def to_hex(self, out=None, sep='\n'):
+        """Return or write the hexadecimal representation of each color.
+
+        If out is None, a list is returned. Otherwise, each representation
+        followed by sep is written to out, which is either a text stream or a
+        bytearray, a chunk at a time and without a string per color.
+
+        """
+
+        form = _hex_format(self._depth)
+        red, green, blue = self._red, self._green, self._blue
+        if out is None:
+            if self._depth == 24 and red:
+                return ('#' + _interleave(red, green, blue).hex(' ', 3)
+                        .replace(' ', ' #')).split(' ')
+            return list(map(form.format, red, green, blue))
+
+        for start in range(0, len(red), _HEX_CHUNK_SIZE):
+            chunk = slice(start, start + _HEX_CHUNK_SIZE)
+            if self._depth == 24:
+                text = '#' + _interleave(red[chunk], green[chunk],
+                                         blue[chunk]).hex(':', 3).replace(
+                    ':', sep + '#') + sep
+            else:
+                text = sep.join(map(form.format, red[chunk], green[chunk],
+                                    blue[chunk])) + sep
+            _write_text(out, text)
+
+    def to_depth(self, depth):
+        """Return a new ColorArray with the colors rescaled to the depth.
+
+        Each channel is converted through a lookup table built once for the
+        pair of depths.
+
+        """
+
+        source = self._depth
+
+        return ColorArray._from_channels(
+            rescale_many(self._red, source, depth),
+            rescale_many(self._green, source, depth),
+            rescale_many(self._blue, source, depth), depth)
+
+    def to_ints(self, alpha=0):
+        """Return an array of the colors packed as Color.to_int packs them.
+
+        The array has the smallest unsigned typecode that fits the depth and
+        the alpha, e.g. 'I' for 0xRRGGBB and 0xAARRGGBB.
+
+        """
+
+        depth = self._depth
+        _maximum(depth)
+        bits = depth // 3
+        red, green, blue = self._red, self._green, self._blue
+        typecode = _typecode((depth + alpha.bit_length()) * 3)
+
+        if depth == 24 and array(typecode).itemsize == 4:
+            samples = bytearray(len(red) * 4)
+            if sys.byteorder == 'little':
+                samples[2::4], samples[1::4], samples[0::4] = red, green, blue
+                samples[3::4] = bytes((alpha,)) * len(red)
+            else:
+                samples[1::4], samples[2::4], samples[3::4] = red, green, blue
+                samples[0::4] = bytes((alpha,)) * len(red)
+            return array(typecode, samples)
+
+        ints = map(or_, map(or_, map(lshift, red, repeat(bits * 2)),
+                            map(lshift, green, repeat(bits))), blue)
+        if alpha:
+            ints = map(or_, ints, repeat(alpha << depth))
+
+        return array(typecode, ints)
+
+    def to_rgb(self):
+        """Return a list of the (red, green, blue) triple of each color."""
+
+        return list(zip(self._red, self._green, self._blue))
+
+    def to_hsv(self):
+        """Return a list of the (hue, saturation, value) of each color."""
+
+        return list(map(rgb_to_hsv, self._red, self._green, self._blue))
+
+    def to_hsv_buffers(self):
+        """Return arrays of the hues, saturations, and values.
+
+        This avoids creating a tuple per color and is the faster of the two.
+
+        """
+
+        return rgb_to_hsv_many(self._red, self._green, self._blue)
+
+    def to_xyz_buffers(self):
+        """Return arrays of the CIE X, Y, and Z coordinates."""
+
+        return rgb_to_xyz_many(self._red, self._green, self._blue, self._depth)
+
+    def to_lab_buffers(self):
+        """Return arrays of the CIELAB L*, a*, and b* coordinates."""
+
+        return rgb_to_lab_many(self._red, self._green, self._blue, self._depth)
+
+    def to_oklab_buffers(self):
+        """Return arrays of the OKLab L, a, and b coordinates."""
+
+        return rgb_to_oklab_many(self._red, self._green, self._blue,
+                                 self._depth)
+
+
+class _PackedColorArray(ColorArray):
+    """A ColorArray whose samples stay packed in the pixels of a buffer.
+
+    The samples are decoded from the pixels whenever they are read and
+    encoded whenever a color is stored. Every operation of the array decodes
+    each channel at most once, but every access to red, green, or blue
+    decodes the whole channel again, so a channel that is indexed in a loop
+    should be read once beforehand.
+
+    """
+
+    __slots__ = ('_pixels', '_layout')
+
+    def __init__(self, pixels, layout):
+        self._pixels = pixels
+        self._layout = layout
+        self._depth = _PACKED_LAYOUTS[layout][2]
+
+    def _decode(self, channel):
+        shift, width = _PACKED_LAYOUTS[self._layout][1][channel]
+        samples = map(and_, map(rshift, self._pixels, repeat(shift)),
+                      repeat((1 << width) - 1))
+        if width * 3 != self._depth:
+            samples = map(rescale_table(width * 3, self._depth).__getitem__,
+                          samples)
+
+        return memoryview(array(_typecode(self._depth), samples))
+
+    _red = property(lambda self: self._decode(0))
+    _green = property(lambda self: self._decode(1))
+    _blue = property(lambda self: self._decode(2))
+
+    @property
+    def nbytes(self):
+        return self._pixels.nbytes
+
+    def __len__(self):
+        return len(self._pixels)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return _PackedColorArray(self._pixels[item], self._layout)
+
+        pixel = self._pixels[item]
+        samples = []
+        for shift, width in _PACKED_LAYOUTS[self._layout][1]:
+            sample = pixel >> shift & (1 << width) - 1
+            if width * 3 != self._depth:
+                sample = rescale(sample, width * 3, self._depth)
+            samples.append(sample)
+
+        return Color._make((samples[0], samples[1], samples[2], self._depth))
+
+    def _pack(self, color, pixel):
+        # The pixels belong to the caller, so the bits outside of the
+        # channels, e.g. the top two of RGB101010, are kept as they are.
+        for sample, (shift, width) in zip(color,
+                                          _PACKED_LAYOUTS[self._layout][1]):
+            if width * 3 != self._depth:
+                sample = rescale(sample, self._depth, width * 3)
+            pixel = pixel & ~((1 << width) - 1 << shift) | sample << shift
+
+        return pixel
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self._pixels[key] = array(self._pixels.format, map(
+                self._pack, self._colors(key, value), self._pixels[key]))
+        else:
+            self._pixels[key] = self._pack(self._color(value),
+                                           self._pixels[key])
@@ -0,0 +1,249 @@
+"""This module includes a compact binary format for colors.
+
+A stream starts with a header: the magic bytes b'CLR', the version of the
+format, a byte of flags, and the depth as an unsigned 16-bit integer. Every
+color is then a fixed-width record, the color packed as Color.to_int packs
+it, in depth / 8 bytes rounded up, most significant byte first. 24-bit colors
+are three bytes, 0xRRGGBB, and 30-bit colors are four.
+
+A single color is its header and its record. A collection is its header and
+a sequence of blocks, each an unsigned 32-bit count of records followed by
+the records, and ends with an empty block, so it can be written and read a
+block at a time without knowing its length up front. If it is run-length
+encoded, every record is preceded by the unsigned 16-bit number of times the
+color repeats.
+
+    >>> data = dumps([Color.RED] * 1000 + [Color.BLUE], rle=True)
+    >>> len(data)
+    25
+    >>> loads(data)[-2:]
+    ColorArray([Color(255, 0, 0, 24), Color(0, 0, 255, 24)], 24)
+
+All integers are big-endian.
+
+"""
+
+import io
+import struct
+import sys
+from array import array
+from itertools import groupby, islice, repeat
+
+from . import Color
+from .array import ColorArray, _interleave
+from .depth import _maximum, _typecode
+
+__all__ = ('VERSION', 'dump', 'dumps', 'iter_load', 'load', 'loads')
+__author__ = 'Tyler Crompton'
+
+
+VERSION = 1
+
+_MAGIC = b'CLR'
+_HEADER = struct.Struct('>3sBBH')
+_COUNT = struct.Struct('>I')
+_RUN = struct.Struct('>H')
+_RLE = 1
+_SINGLE = 2
+
+_MAXIMUM_RUN = (1 << 16) - 1
+
+
+def _width(depth):
+    """Return the number of bytes in a record of the depth."""
+
+    _maximum(depth)
+
+    return -(-depth // 8)
+
+
+def _records(colors):
+    """Return the records of a ColorArray as bytes."""
+
+    depth = colors.depth
+    width = _width(depth)
+    if depth == 24:
+        return _interleave(colors.red, colors.green, colors.blue)
+
+    ints = colors.to_ints()
+    if ints.itemsize == width:
+        if sys.byteorder == 'little':
+            ints.byteswap()
+        return ints.tobytes()
+
+    return b''.join(map(int.to_bytes, ints, repeat(width), repeat('big')))
+
+
+def _colors(records, depth):
+    """Return a ColorArray of the colors of records."""
+
+    width = _width(depth)
+    if depth == 24:
+        samples = memoryview(records)
+        return ColorArray._from_channels(
+            bytearray(samples[0::3]), bytearray(samples[1::3]),
+            bytearray(samples[2::3]), 24)
+
+    typecode = _typecode(depth * 3)
+    if array(typecode).itemsize == width:
+        ints = array(typecode, records)
+        if sys.byteorder == 'little':
+            ints.byteswap()
+    else:
+        ints = list(map(int.from_bytes, map(
+            records.__getitem__, map(slice, range(0, len(records), width),
+                                     range(width, len(records) + 1, width))),
+            repeat('big')))
+
+    return ColorArray.from_ints(ints, depth)
+
+
+def _encode_runs(records, width):
+    """Return the records with the length of each run before them."""
+
+    runs = bytearray()
+    chunks = map(records.__getitem__, map(
+        slice, range(0, len(records), width),
+        range(width, len(records) + 1, width)))
+    count = 0
+    for record, group in groupby(chunks):
+        length = sum(1 for _ in group)
+        while length:
+            run = min(length, _MAXIMUM_RUN)
+            runs += _RUN.pack(run) + record
+            length -= run
+            count += 1
+
+    return count, runs
+
+
+def _decode_runs(runs, width):
+    """Return the records of run-length encoded records."""
+
+    return b''.join(record * count for count, record in struct.iter_unpack(
+        '>H{}s'.format(width), runs))
+
+
+def _read(file, size):
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError('The data is truncated.')
+
+    return data
+
+
+def _read_header(file):
+    magic, version, flags, depth = _HEADER.unpack(_read(file, _HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError('The data is not in the binary color format.')
+    if version > VERSION:
+        raise ValueError('Unsupported version: {}.'.format(version))
+
+    return flags, depth
+
+
+def dump(colors, file, rle=False, block_size=65536):
+    """Write a color or a collection of colors to a binary file.
+
+    The collection is any iterable of colors that share a depth, such as a
+    ColorArray, and is written block_size colors at a time. If rle is true,
+    runs of the same color are stored once.
+
+    """
+
+    if isinstance(colors, Color):
+        depth = colors.depth
+        file.write(_HEADER.pack(_MAGIC, VERSION, _SINGLE, depth) +
+                   colors.to_int().to_bytes(_width(depth), 'big'))
+        return
+
+    if block_size <= 0:
+        raise ValueError('The block size must be a positive integer.')
+
+    if isinstance(colors, ColorArray):
+        blocks = (colors[start:start + block_size]
+                  for start in range(0, len(colors), block_size))
+    else:
+        iterator = iter(colors)
+        blocks = iter(lambda: ColorArray(islice(iterator, block_size)), None)
+
+    block = next(blocks, None)
+    depth = colors.depth if isinstance(colors, ColorArray) else (
+        block.depth if block else 24)
+    width = _width(depth)
+    file.write(_HEADER.pack(_MAGIC, VERSION, _RLE if rle else 0, depth))
+
+    while block:
+        if block.depth != depth:
+            raise ValueError('Every color must have a depth of {}.'.format(
+                depth))
+        records = _records(block)
+        count = len(block)
+        if rle:
+            count, records = _encode_runs(records, width)
+        file.write(_COUNT.pack(count))
+        file.write(records)
+        block = next(blocks, None)
+
+    file.write(_COUNT.pack(0))
+
+
+def iter_load(file):
+    """Generate a ColorArray for each block of colors in a binary file.
+
+    Only one block is held in memory at a time.
+
+    """
+
+    flags, depth = _read_header(file)
+    width = _width(depth)
+    if flags & _SINGLE:
+        yield _colors(_read(file, width), depth)
+        return
+
+    record_size = width + _RUN.size if flags & _RLE else width
+    while True:
+        count, = _COUNT.unpack(_read(file, _COUNT.size))
+        if not count:
+            return
+        records = _read(file, count * record_size)
+        if flags & _RLE:
+            records = _decode_runs(records, width)
+        yield _colors(records, depth)
+
+
+def load(file):
+    """Read a color or a ColorArray from a binary file."""
+
+    flags, depth = _read_header(file)
+    width = _width(depth)
+    if flags & _SINGLE:
+        return Color.from_int(int.from_bytes(_read(file, width), 'big'), depth)
+
+    record_size = width + _RUN.size if flags & _RLE else width
+    records = bytearray()
+    while True:
+        count, = _COUNT.unpack(_read(file, _COUNT.size))
+        if not count:
+            break
+        if flags & _RLE:
+            records += _decode_runs(_read(file, count * record_size), width)
+        else:
+            records += _read(file, count * record_size)
+
+    return _colors(records, depth)
+
+
+def dumps(colors, rle=False, block_size=65536):
+    """Return the binary format of a color or a collection of colors."""
+
+    file = io.BytesIO()
+    dump(colors, file, rle, block_size)
+
+    return file.getvalue()
+
+
+def loads(data):
+    """Return the color or the ColorArray of binary data."""
+
+    return load(io.BytesIO(data))
@@ -0,0 +1,101 @@
+"""This module includes the cache of values derived from colors.
+
+Colors are immutable and cannot remember anything themselves, so conversions
+such as Color.hsv and Color.hex are normally recomputed on every access, and
+every hexadecimal string is parsed again. Once the cache is enabled, the
+result of each conversion and of each parsed string is kept, keyed on the
+conversion and its arguments, until it is evicted as the least recently used.
+Parsing a cached string again returns the same Color instance.
+
+    >>> from color import Color, cache
+    >>> cache.enable(maxsize=4096)
+    >>> Color.DODGER_BLUE.hsv
+    (0.5822222222222222, 0.8823529411764706, 255)
+    >>> cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=4096, currsize=1)
+
+The cache is a functools.lru_cache, so it is safe to use from several
+threads.
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+__all__ = ('CacheInfo', 'clear', 'derived', 'disable', 'enable', 'info')
+__author__ = 'Tyler Crompton'
+
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+# The name of each cached function maps to the function itself.
+_functions = {}
+_cache = None
+
+
+def _call(key):
+    return _functions[key[0]](*key[1:])
+
+
+def enable(maxsize=4096):
+    """Enable the cache, or start an empty one of another size."""
+
+    global _cache
+
+    if maxsize <= 0:
+        raise ValueError('The size must be a positive integer.')
+
+    if _cache is None or _cache.cache_info().maxsize != maxsize:
+        _cache = lru_cache(maxsize)(_call)
+
+
+def disable():
+    """Disable the cache and discard its contents."""
+
+    global _cache
+
+    _cache = None
+
+
+def clear():
+    """Discard the contents and statistics of the cache."""
+
+    if _cache is not None:
+        _cache.cache_clear()
+
+
+def info():
+    """Return the statistics of the cache, or None if it is disabled."""
+
+    return None if _cache is None else CacheInfo(*_cache.cache_info())
+
+
+def derived(function):
+    """Make a function of colors draw its result from the cache.
+
+    The arguments of the function are part of the key, so they must be
+    hashable. If the first argument is a color, the result is only cached if
+    the samples and the depth of the color are integers.
+
+    """
+
+    name = function.__module__ + '.' + function.__qualname__
+    _functions[name] = function
+
+    def wrapper(*args):
+        cache = _cache
+        # Samples such as 1.0 equal integers and would share their entries,
+        # although they can give different results, so colors with them
+        # bypass the cache. Their sum is not an int.
+        if cache is None or isinstance(args[0], tuple) and type(
+                sum(tuple.__iter__(args[0]))) is not int:
+            return function(*args)
+
+        return cache((name,) + args)
+
+    wrapper.__name__ = function.__name__
+    wrapper.__qualname__ = function.__qualname__
+    wrapper.__doc__ = function.__doc__
+    wrapper.__wrapped__ = function
+
+    return wrapper
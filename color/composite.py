@@ -0,0 +1,217 @@
+"""This module includes the blending and compositing of colors.
+
+A source color is blended onto a backdrop color with one of the separable
+blend modes of the W3C Compositing and Blending specification, then composited
+over it with the opacity of the source:
+
+    result = (1 - opacity) * backdrop + opacity * mode(backdrop, source)
+
+The modes are 'normal' (so the result is the source alpha-composited over the
+backdrop), 'multiply', 'screen', 'overlay', and 'linear_light'. The samples
+are blended as gamma-encoded values in the range 0 to 1, or, if linear is
+true, as linear light.
+
+    >>> blend(Color.RED, Color.BLUE, opacity=0.5)
+    Color(128, 0, 128, 24)
+    >>> blend(Color.RED, Color.BLUE, opacity=0.5, linear=True)
+    Color(188, 0, 188, 24)
+
+The result has the depth of the backdrop, and a source of another depth is
+rescaled to it first. blend_many does the same for whole collections of
+colors; for depths of up to 24, each channel is then blended through a table
+of every pair of samples, built once per mode and opacity.
+
+"""
+
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from operator import lshift, or_, truediv
+
+from . import Color
+from .array import ColorArray
+from .depth import _maximum, _typecode
+from .spaces import _encode, _linear, linear_table
+
+__all__ = ('MODES', 'blend', 'blend_many')
+__author__ = 'Tyler Crompton'
+
+
+# Tables are only built for samples of up to this many bits.
+_TABLE_BITS = 8
+
+# Smaller collections are blended without a table, since building one takes
+# longer than blending them.
+_TABLE_THRESHOLD = 8192
+
+
+def _normal(backdrop, source):
+    return source
+
+
+def _multiply(backdrop, source):
+    return backdrop * source
+
+
+def _screen(backdrop, source):
+    return backdrop + source - backdrop * source
+
+
+def _overlay(backdrop, source):
+    if backdrop <= 0.5:
+        return 2 * backdrop * source
+
+    return 1 - 2 * (1 - backdrop) * (1 - source)
+
+
+def _linear_light(backdrop, source):
+    return min(max(backdrop + 2 * source - 1, 0.0), 1.0)
+
+
+MODES = {
+    'normal': _normal,
+    'multiply': _multiply,
+    'screen': _screen,
+    'overlay': _overlay,
+    'linear_light': _linear_light,
+}
+
+
+def _mode(mode):
+    try:
+        return MODES[mode]
+    except KeyError:
+        raise ValueError('Unknown mode: {}.'.format(repr(mode)))
+
+
+def _check_opacity(opacity):
+    if not 0 <= opacity <= 1:
+        raise ValueError('The opacity must be within 0 to 1.')
+
+
+def _composite(function, backdrop, source, opacity):
+    return backdrop + opacity * (function(backdrop, source) - backdrop)
+
+
+def _decoder(depth, linear):
+    """Return a function from a sample to a value in the range 0 to 1."""
+
+    maximum = _maximum(depth)
+    if not linear:
+        return lambda sample: sample / maximum
+
+    table = linear_table(depth)
+    if table is None:
+        return lambda sample: _linear(sample, depth)
+
+    return table.__getitem__
+
+
+def _decode_many(samples, depth, linear):
+    if linear:
+        return map(_decoder(depth, linear), samples)
+
+    return map(truediv, samples, repeat(_maximum(depth)))
+
+
+def _encoder(depth, linear):
+    """Return a function from a value in the range 0 to 1 to a sample."""
+
+    maximum = _maximum(depth)
+    if linear:
+        return lambda value: _encode(value, maximum)
+
+    return lambda value: min(max(round(value * maximum), 0), maximum)
+
+
+def blend(backdrop, source, mode='normal', opacity=1.0, linear=False):
+    """Return the source color blended onto the backdrop color."""
+
+    function = _mode(mode)
+    _check_opacity(opacity)
+    depth = backdrop.depth
+    if source.depth != depth:
+        source = source.to_depth(depth)
+    decode = _decoder(depth, linear)
+    encode = _encoder(depth, linear)
+
+    return Color._make(tuple(
+        encode(_composite(function, decode(b), decode(s), opacity))
+        for b, s in zip(backdrop, source)) + (depth,))
+
+
+@lru_cache(maxsize=64)
+def _table(mode, opacity, depth, linear):
+    """Return the blended sample of every (backdrop << bits | source)."""
+
+    function = MODES[mode]
+    decode = _decoder(depth, linear)
+    encode = _encoder(depth, linear)
+    values = [decode(sample) for sample in range(_maximum(depth) + 1)]
+
+    return array(_typecode(depth), (
+        encode(_composite(function, backdrop, source, opacity))
+        for backdrop in values for source in values))
+
+
+def _as_array(colors):
+    return colors if isinstance(colors, ColorArray) else ColorArray(colors)
+
+
+def blend_many(backdrops, sources, mode='normal', opacity=1.0, linear=False):
+    """Return a ColorArray of each source color blended onto its backdrop.
+
+    The backdrops and sources are ColorArrays or iterables of colors of the
+    same length. The sources may also be a single color, which is blended
+    onto every backdrop. The opacity is a number or a sequence with one
+    opacity per color, such as an alpha channel scaled to 0 to 1.
+
+    """
+
+    function = _mode(mode)
+    backdrops = _as_array(backdrops)
+    depth = backdrops.depth
+    count = len(backdrops)
+
+    if isinstance(sources, Color):
+        if sources.depth != depth:
+            sources = sources.to_depth(depth)
+        channels = [repeat(sample) for sample in sources]
+    else:
+        sources = _as_array(sources)
+        if len(sources) != count:
+            raise ValueError('There must be as many sources as backdrops.')
+        if sources.depth != depth:
+            sources = sources.to_depth(depth)
+        channels = [sources.red, sources.green, sources.blue]
+
+    if isinstance(opacity, (int, float)):
+        _check_opacity(opacity)
+        opacities = None
+    else:
+        opacities = list(opacity)
+        if len(opacities) != count:
+            raise ValueError('There must be as many opacities as backdrops.')
+        if opacities:
+            _check_opacity(min(opacities))
+            _check_opacity(max(opacities))
+
+    bits = _maximum(depth).bit_length()
+    typecode = _typecode(depth)
+    backdrop_channels = [backdrops.red, backdrops.green, backdrops.blue]
+    result = []
+    if opacities is None and bits <= _TABLE_BITS and count >= _TABLE_THRESHOLD:
+        table = _table(mode, float(opacity), depth, linear)
+        for backdrop, source in zip(backdrop_channels, channels):
+            result.append(array(typecode, map(table.__getitem__, map(
+                or_, map(lshift, backdrop, repeat(bits)), source))))
+    else:
+        encode = _encoder(depth, linear)
+        for backdrop, source in zip(backdrop_channels, channels):
+            result.append(array(typecode, map(encode, map(
+                _composite, repeat(function),
+                _decode_many(backdrop, depth, linear),
+                _decode_many(source, depth, linear),
+                repeat(opacity) if opacities is None else opacities))))
+
+    return ColorArray._from_channels(result[0], result[1], result[2], depth)
@@ -0,0 +1,251 @@
+"""This module parses CSS colors.
+
+Hexadecimal colors, keywords, and the rgb(), rgba(), hsl(), hsla(), hwb(),
+lab(), lch(), oklab(), and oklch() functions of CSS Color Module Levels 3
+and 4 are understood, in both the legacy comma-separated and the modern
+space-separated syntax.
+
+    >>> parse('rgb(30 144 255 / 50%)')
+    Color(30, 144, 255, 24)
+    >>> parse('hsl(120deg 100% 25%)')
+    Color(0, 128, 0, 24)
+    >>> parse('DodgerBlue') is Color.DODGER_BLUE
+    True
+
+The colors are 24-bit. Since colors do not have an alpha channel, the alpha
+is checked but otherwise ignored, and colors outside of the sRGB gamut are
+clamped to it. The most recently parsed strings are cached, so parsing the
+same string again is a dictionary lookup.
+
+"""
+
+import re
+from colorsys import hls_to_rgb
+from functools import lru_cache
+from math import cos, degrees, radians, sin
+
+from . import Color, _COLORS_BY_NAME
+from .spaces import oklab_to_rgb, xyz_to_rgb
+
+__all__ = ('parse',)
+__author__ = 'Tyler Crompton'
+
+
+_COLOR = re.compile(r'''
+    \s*(?:
+        \#(?P<hex>[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})
+        | (?P<keyword>[a-z]+)
+        | (?P<function>rgba?|hsla?|hwb|lab|lch|oklab|oklch)
+          \(\s*(?P<arguments>[^()]*?)\s*\)
+    )\s*\Z''', re.IGNORECASE | re.VERBOSE)
+_NUMBER = re.compile(r'([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)(%|[a-z]*)\Z',
+                     re.IGNORECASE)
+_SEPARATOR = re.compile(r'\s*/\s*')
+
+# Keywords of CSS that are not constants of Color.
+_KEYWORDS = {
+    'rebeccapurple': Color._make((102, 51, 153, 24)),
+    'transparent': Color.BLACK,
+}
+
+_HUE_UNITS = {'': 1, 'deg': 1, 'grad': 0.9, 'rad': degrees(1), 'turn': 360}
+
+# The CIELAB of CSS is relative to D50, and is adapted to D65 with the Bradford
+# transform before it is converted to sRGB.
+_D50 = (0.3457 / 0.3585, 1.0, 0.2958 / 0.3585)
+_D50_TO_D65 = ((0.9554734527042182, -0.023098536874261423, 0.0632593086610217),
+               (-0.028369706963208136, 1.0099954580058226,
+                0.021041398966943008),
+               (0.012314001688319899, -0.020507696433477912,
+                1.3303659366080753))
+
+
+def _error(text):
+    return ValueError('Invalid CSS color: {}.'.format(repr(text)))
+
+
+def _arguments(text, arguments):
+    """Return the three (value, unit) pairs of the arguments.
+
+    The alpha, if any, is checked and dropped. 'none' is zero.
+
+    """
+
+    if ',' in arguments:
+        values = [value.strip() for value in arguments.split(',')]
+        if len(values) == 4:
+            alpha = values.pop()
+        elif len(values) == 3:
+            alpha = None
+        else:
+            raise _error(text)
+    else:
+        values = _SEPARATOR.split(arguments)
+        if len(values) > 2:
+            raise _error(text)
+        alpha = values[1] if len(values) == 2 else None
+        values = values[0].split()
+        if len(values) != 3:
+            raise _error(text)
+
+    if alpha is not None:
+        if _number(text, alpha)[1] not in ('', '%'):
+            raise _error(text)
+
+    return [_number(text, value) for value in values]
+
+
+def _number(text, value):
+    if value.lower() == 'none':
+        return 0.0, ''
+
+    match = _NUMBER.match(value)
+    if match is None:
+        raise _error(text)
+
+    return float(match.group(1)), match.group(2).lower()
+
+
+def _scale(text, value, unit, percent):
+    """Return the number, or the percentage times percent / 100."""
+
+    if unit == '%':
+        return value * percent / 100
+    if unit:
+        raise _error(text)
+
+    return value
+
+
+def _hue(text, value, unit):
+    try:
+        return value * _HUE_UNITS[unit] % 360
+    except KeyError:
+        raise _error(text)
+
+
+def _clamp(value):
+    return min(max(round(value * 255), 0), 255)
+
+
+def _from_unit_rgb(red, green, blue):
+    return Color._make((_clamp(red), _clamp(green), _clamp(blue), 24))
+
+
+def _rgb(text, arguments):
+    red, green, blue = (_scale(text, value, unit, 255) / 255
+                        for value, unit in arguments)
+
+    return _from_unit_rgb(red, green, blue)
+
+
+def _hsl(text, arguments):
+    (hue, hue_unit), saturation, lightness = arguments
+    saturation = min(max(_scale(text, *saturation, 100) / 100, 0), 1)
+    lightness = min(max(_scale(text, *lightness, 100) / 100, 0), 1)
+
+    return _from_unit_rgb(*hls_to_rgb(_hue(text, hue, hue_unit) / 360,
+                                      lightness, saturation))
+
+
+def _hwb(text, arguments):
+    (hue, hue_unit), whiteness, blackness = arguments
+    whiteness = min(max(_scale(text, *whiteness, 100) / 100, 0), 1)
+    blackness = min(max(_scale(text, *blackness, 100) / 100, 0), 1)
+    if whiteness + blackness >= 1:
+        gray = whiteness / (whiteness + blackness)
+        return _from_unit_rgb(gray, gray, gray)
+
+    scale = 1 - whiteness - blackness
+
+    return _from_unit_rgb(*(value * scale + whiteness for value in hls_to_rgb(
+        _hue(text, hue, hue_unit) / 360, 0.5, 1)))
+
+
+def _lab_to_color(l, a, b):
+    fy = (l + 16) / 116
+    xyz = [white * (t ** 3 if t > 6 / 29 else 3 * (6 / 29) ** 2 * (t - 4 / 29))
+           for white, t in zip(_D50, (fy + a / 500, fy, fy - b / 200))]
+
+    return Color._make(xyz_to_rgb(*(
+        sum(map(float.__mul__, row, xyz)) for row in _D50_TO_D65)) + (24,))
+
+
+def _lab(text, arguments):
+    lightness, a, b = arguments
+
+    return _lab_to_color(max(_scale(text, *lightness, 100), 0),
+                         _scale(text, *a, 125), _scale(text, *b, 125))
+
+
+def _lch(text, arguments):
+    lightness, chroma, (hue, hue_unit) = arguments
+    chroma = max(_scale(text, *chroma, 150), 0)
+    hue = radians(_hue(text, hue, hue_unit))
+
+    return _lab_to_color(max(_scale(text, *lightness, 100), 0),
+                         chroma * cos(hue), chroma * sin(hue))
+
+
+def _oklab(text, arguments):
+    lightness, a, b = arguments
+
+    return Color._make(oklab_to_rgb(
+        max(_scale(text, *lightness, 1), 0), _scale(text, *a, 0.4),
+        _scale(text, *b, 0.4)) + (24,))
+
+
+def _oklch(text, arguments):
+    lightness, chroma, (hue, hue_unit) = arguments
+    chroma = max(_scale(text, *chroma, 0.4), 0)
+    hue = radians(_hue(text, hue, hue_unit))
+
+    return Color._make(oklab_to_rgb(
+        max(_scale(text, *lightness, 1), 0), chroma * cos(hue),
+        chroma * sin(hue)) + (24,))
+
+
+_FUNCTIONS = {
+    'rgb': _rgb,
+    'rgba': _rgb,
+    'hsl': _hsl,
+    'hsla': _hsl,
+    'hwb': _hwb,
+    'lab': _lab,
+    'lch': _lch,
+    'oklab': _oklab,
+    'oklch': _oklch,
+}
+
+
+@lru_cache(maxsize=1024)
+def parse(text):
+    """Return the color of the CSS color string.
+
+    ValueError is raised if the string is not a color, or is a color that
+    depends on its context, e.g. 'currentcolor'.
+
+    """
+
+    match = _COLOR.match(text)
+    if match is None:
+        raise _error(text)
+
+    kind = match.lastgroup
+    if kind == 'hex':
+        value = match.group('hex')
+        if len(value) < 6:
+            value = ''.join(digit * 2 for digit in value[:3])
+        value = int(value[:6], 16)
+        return Color._make((value >> 16, value >> 8 & 0xff, value & 0xff,
+                            24))
+
+    if kind == 'keyword':
+        keyword = match.group('keyword').lower()
+        try:
+            return _COLORS_BY_NAME.get(keyword) or _KEYWORDS[keyword]
+        except KeyError:
+            raise _error(text)
+
+    return _FUNCTIONS[match.group('function').lower()](
+        text, _arguments(text, match.group('arguments')))
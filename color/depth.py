@@ -0,0 +1,85 @@
+"""This module includes the conversion of samples between color depths.
+
+A sample of a color with a depth of d has d / 3 bits, and rescaling maps the
+largest sample of one depth onto the largest sample of the other, rounding
+to the nearest integer with ties rounded up.
+
+"""
+
+from array import array
+from itertools import repeat
+
+__all__ = ('rescale', 'rescale_many', 'rescale_table')
+__author__ = 'Tyler Crompton'
+
+
+# Lookup tables are only built for samples of up to this many bits.
+_TABLE_BITS = 16
+
+_TYPECODES = sorted((array(typecode).itemsize * 8, typecode)
+                    for typecode in 'BHILQ')
+_tables = {}
+
+
+def _typecode(depth):
+    """Return the smallest unsigned typecode that can hold a sample."""
+
+    bits = -(-depth // 3)
+    for size, typecode in _TYPECODES:
+        if size >= bits:
+            return typecode
+
+    raise ValueError('The depth is too large to be stored in a typed buffer.')
+
+
+def _maximum(depth):
+    if depth <= 0:
+        raise ValueError('The depth must be a positive integer.')
+    if depth % 3:
+        raise ValueError('The depth must be a multiple of 3.')
+
+    return (1 << depth // 3) - 1
+
+
+def rescale(value, source, target):
+    """Return a sample of a color with the source depth at the target depth."""
+
+    source = _maximum(source)
+
+    return (2 * value * _maximum(target) + source) // (2 * source)
+
+
+def rescale_table(source, target):
+    """Return the array mapping each sample of the source depth to the target.
+
+    The tables are built once per pair of depths. None is returned if the
+    samples of the source depth are too wide to tabulate.
+
+    """
+
+    try:
+        return _tables[source, target]
+    except KeyError:
+        pass
+
+    if source // 3 > _TABLE_BITS:
+        _maximum(target)
+        return None
+
+    high = _maximum(source)
+    target_high = _maximum(target)
+
+    return _tables.setdefault((source, target), array(_typecode(target), (
+        (2 * value * target_high + high) // (2 * high)
+        for value in range(high + 1))))
+
+
+def rescale_many(samples, source, target):
+    """Return an array of the samples rescaled from the source depth."""
+
+    table = rescale_table(source, target)
+    if table is None:
+        return array(_typecode(target), map(rescale, samples, repeat(source),
+                                            repeat(target)))
+
+    return array(table.typecode, map(table.__getitem__, samples))
@@ -0,0 +1,193 @@
+"""This module includes the CIE color difference (delta E) formulas.
+
+The formulas take CIELAB coordinates, such as Color.lab, and are available
+under the names 'cie76', 'cie94' (with the graphic arts weights), and
+'ciede2000'. pairwise_delta_e computes the differences between every color
+of one collection and every color of another, one block of rows at a time.
+
+"""
+
+from array import array
+from itertools import repeat
+from math import atan2, cos, degrees, dist, exp, hypot, radians, sin, sqrt
+
+from . import Color
+from .array import ColorArray
+
+__all__ = ('METHODS', 'cie76', 'cie94', 'ciede2000', 'delta_e',
+           'iter_pairwise_delta_e', 'pairwise_delta_e')
+__author__ = 'Tyler Crompton'
+
+
+def cie76(lab1, lab2):
+    """Return the CIE 1976 difference, the distance in CIELAB space."""
+
+    return dist(lab1, lab2)
+
+
+# Each formula is split into the terms that depend on one color only and
+# the rest, so that the terms of a color are computed once per matrix rather
+# than once per pair.
+
+
+def _cie94_terms(lab):
+    l, a, b = lab
+    c = hypot(a, b)
+
+    # The weights only apply to the reference color.
+    return l, a, b, c, 1 + 0.045 * c, (1 + 0.015 * c) ** 2
+
+
+def _cie94(terms1, terms2):
+    l1, a1, b1, c1, s_c, s_h_squared = terms1
+    l2, a2, b2, c2, _, _ = terms2
+    delta_c = c1 - c2
+    delta_h_squared = max((a1 - a2) ** 2 + (b1 - b2) ** 2 - delta_c ** 2, 0)
+
+    return sqrt((l1 - l2) ** 2 + (delta_c / s_c) ** 2 +
+                delta_h_squared / s_h_squared)
+
+
+def cie94(lab1, lab2):
+    """Return the CIE 1994 difference, with the graphic arts weights.
+
+    This difference is not symmetric; lab1 is the reference color.
+
+    """
+
+    return _cie94(_cie94_terms(lab1), _cie94_terms(lab2))
+
+
+def _hue(b, a):
+    return 0.0 if a == b == 0 else degrees(atan2(b, a)) % 360
+
+
+def _ciede2000_terms(lab):
+    l, a, b = lab
+
+    # The hue depends on both colors through g, so only the chroma is known.
+    return l, a, b, hypot(a, b)
+
+
+def _ciede2000(terms1, terms2):
+    l1, a1, b1, c1 = terms1
+    l2, a2, b2, c2 = terms2
+    mean_c = (c1 + c2) / 2
+    g = 0.5 * (1 - sqrt(mean_c ** 7 / (mean_c ** 7 + 25 ** 7)))
+    a1 *= 1 + g
+    a2 *= 1 + g
+    c1 = hypot(a1, b1)
+    c2 = hypot(a2, b2)
+    h1 = _hue(b1, a1)
+    h2 = _hue(b2, a2)
+
+    if c1 * c2 == 0:
+        delta_h = 0.0
+        mean_h = h1 + h2
+    else:
+        delta_h = h2 - h1
+        if delta_h > 180:
+            delta_h -= 360
+        elif delta_h < -180:
+            delta_h += 360
+        mean_h = (h1 + h2) / 2
+        if abs(h1 - h2) > 180:
+            mean_h += 180 if h1 + h2 < 360 else -180
+
+    delta_h = 2 * sqrt(c1 * c2) * sin(radians(delta_h / 2))
+    mean_l = (l1 + l2) / 2
+    mean_c = (c1 + c2) / 2
+    t = (1 - 0.17 * cos(radians(mean_h - 30)) + 0.24 * cos(radians(2 * mean_h))
+         + 0.32 * cos(radians(3 * mean_h + 6)) -
+         0.20 * cos(radians(4 * mean_h - 63)))
+    s_l = 1 + 0.015 * (mean_l - 50) ** 2 / sqrt(20 + (mean_l - 50) ** 2)
+    s_c = 1 + 0.045 * mean_c
+    s_h = 1 + 0.015 * mean_c * t
+    r_t = (-sin(radians(60 * exp(-((mean_h - 275) / 25) ** 2))) * 2 *
+           sqrt(mean_c ** 7 / (mean_c ** 7 + 25 ** 7)))
+
+    return sqrt(((l2 - l1) / s_l) ** 2 + ((c2 - c1) / s_c) ** 2 +
+                (delta_h / s_h) ** 2 +
+                r_t * ((c2 - c1) / s_c) * (delta_h / s_h))
+
+
+def ciede2000(lab1, lab2):
+    """Return the CIEDE2000 difference."""
+
+    return _ciede2000(_ciede2000_terms(lab1), _ciede2000_terms(lab2))
+
+
+METHODS = {
+    'cie76': cie76,
+    'cie94': cie94,
+    'ciede2000': ciede2000,
+}
+
+# The per-color terms and the difference of the terms of each formula that
+# has them. Other methods are computed from the coordinates.
+_TERMS = {
+    cie94: (_cie94_terms, _cie94),
+    ciede2000: (_ciede2000_terms, _ciede2000),
+}
+
+
+def _method(method):
+    try:
+        return METHODS[method]
+    except KeyError:
+        raise ValueError('Unknown method: {}.'.format(repr(method)))
+
+
+def delta_e(color1, color2, method='ciede2000'):
+    """Return the difference between two colors."""
+
+    return _method(method)(color1.lab, color2.lab)
+
+
+def _lab(colors):
+    if not isinstance(colors, ColorArray):
+        colors = list(colors)
+        if all(isinstance(color, Color) for color in colors):
+            return [color.lab for color in colors]
+        colors = ColorArray(colors)
+
+    return list(zip(*colors.to_lab_buffers()))
+
+
+def iter_pairwise_delta_e(colors1, colors2, method='ciede2000',
+                          block_size=1024):
+    """Generate the rows of the matrix of differences a block at a time.
+
+    Each item is a list of up to block_size rows, one array of differences
+    per color of colors1, so only one block of the matrix is held at once.
+
+    """
+
+    function = _method(method)
+    lab1 = _lab(colors1)
+    lab2 = _lab(colors2)
+    if function in _TERMS:
+        terms, function = _TERMS[function]
+        lab1 = list(map(terms, lab1))
+        lab2 = list(map(terms, lab2))
+
+    for start in range(0, len(lab1), block_size):
+        yield [array('d', map(function, repeat(lab), lab2))
+               for lab in lab1[start:start + block_size]]
+
+
+def pairwise_delta_e(colors1, colors2, method='ciede2000', block_size=1024):
+    """Return the matrix of differences as a list of arrays.
+
+    The item at [i][j] is the difference between colors1[i] and colors2[j].
+    The whole matrix is held in memory, at 8 bytes per difference, e.g.
+    about 20 GB for 50,000 by 50,000 colors. Use iter_pairwise_delta_e to
+    process matrices that large a block at a time.
+
+    """
+
+    rows = []
+    for block in iter_pairwise_delta_e(colors1, colors2, method, block_size):
+        rows.extend(block)
+
+    return rows
@@ -0,0 +1,162 @@
+"""This module reduces the depth of images with dithering.
+
+Rescaling samples to a smaller depth rounds each of them on its own, which
+turns smooth gradients into bands. Dithering spreads the rounding errors
+over neighboring pixels instead, with either an ordered Bayer matrix or the
+error diffusion of Floyd-Steinberg or Atkinson.
+
+An image is a sequence of rows, each a ColorArray of the same width and
+depth, and is processed a row at a time, so only the rows of errors that are
+still being diffused are kept in memory.
+
+    >>> rows = [ColorArray([(512, 512, 512)] * 2, 30)] * 2
+    >>> [row.to_rgb() for row in dither_rows(rows, 3, 'bayer', bayer_size=2)]
+    [[(0, 0, 0), (1, 1, 1)], [(1, 1, 1), (0, 0, 0)]]
+
+"""
+
+from array import array
+from itertools import cycle, repeat
+from operator import add, mul
+
+from .array import ColorArray
+from .depth import _maximum, _typecode
+
+__all__ = ('KERNELS', 'METHODS', 'bayer_matrix', 'dither', 'dither_rows')
+__author__ = 'Tyler Crompton'
+
+
+# The error diffusion kernels map to the (dx, dy, weight) of each neighbor
+# that receives a share of the error of a pixel.
+KERNELS = {
+    'floyd_steinberg': ((1, 0, 7 / 16), (-1, 1, 3 / 16), (0, 1, 5 / 16),
+                        (1, 1, 1 / 16)),
+    'atkinson': ((1, 0, 1 / 8), (2, 0, 1 / 8), (-1, 1, 1 / 8), (0, 1, 1 / 8),
+                 (1, 1, 1 / 8), (0, 2, 1 / 8)),
+}
+METHODS = ('bayer',) + tuple(KERNELS)
+
+# The error rows are padded on each side, so that the kernels never reach
+# past their ends.
+_PADDING = 2
+
+
+def bayer_matrix(size):
+    """Return the size by size Bayer matrix of thresholds from 0 to 1.
+
+    The size must be a power of 2.
+
+    """
+
+    if size <= 0 or size & size - 1:
+        raise ValueError('The size must be a power of 2.')
+
+    matrix = [[0]]
+    while len(matrix) < size:
+        matrix = ([[4 * value for value in row] +
+                   [4 * value + 2 for value in row] for row in matrix] +
+                  [[4 * value + 3 for value in row] +
+                   [4 * value + 1 for value in row] for row in matrix])
+
+    return [[(value + 0.5) / size ** 2 for value in row] for row in matrix]
+
+
+def _ordered(samples, scale, maximum, thresholds):
+    return map(min, map(int, map(add, map(mul, samples, repeat(scale)),
+                                 cycle(thresholds))), repeat(maximum))
+
+
+def _diffuse(samples, scale, maximum, kernel, errors):
+    """Return the quantized samples, diffusing their errors into the rows."""
+
+    current = errors[0]
+    samples_out = []
+    append = samples_out.append
+    for x, sample in enumerate(samples, _PADDING):
+        value = sample * scale + current[x]
+        quantized = int(value + 0.5) if value > 0 else 0
+        if quantized > maximum:
+            quantized = maximum
+        append(quantized)
+        error = value - quantized
+        if error:
+            for dx, dy, weight in kernel:
+                errors[dy][x + dx] += error * weight
+
+    return samples_out
+
+
+def dither_rows(rows, depth, method='floyd_steinberg', bayer_size=4):
+    """Generate each row of an image reduced to the depth, dithered.
+
+    The rows are ColorArrays, or iterables of colors, that share a width and
+    a depth. The method is 'bayer', 'floyd_steinberg', or 'atkinson'. The
+    Bayer matrix is bayer_size by bayer_size.
+
+    """
+
+    if method not in METHODS:
+        raise ValueError('Unknown method: {}.'.format(repr(method)))
+
+    maximum = _maximum(depth)
+    typecode = _typecode(depth)
+    if method == 'bayer':
+        matrix = bayer_matrix(bayer_size)
+    else:
+        kernel = KERNELS[method]
+        height = max(dy for _, dy, _ in kernel) + 1
+    width = source = errors = None
+
+    for y, row in enumerate(rows):
+        if not isinstance(row, ColorArray):
+            row = ColorArray(row)
+        if width is None:
+            width = len(row)
+            source = row.depth
+            scale = maximum / _maximum(source)
+            if method != 'bayer':
+                errors = [[[0.0] * (width + 2 * _PADDING)
+                           for _ in range(height)] for _ in range(3)]
+        elif len(row) != width or row.depth != source:
+            raise ValueError('Every row must have {} colors of a depth of '
+                             '{}.'.format(width, source))
+
+        channels = (row.red, row.green, row.blue)
+        if method == 'bayer':
+            thresholds = matrix[y % bayer_size]
+            result = [array(typecode, _ordered(channel, scale, maximum,
+                                               thresholds))
+                      for channel in channels]
+        else:
+            result = []
+            for channel, channel_errors in zip(channels, errors):
+                result.append(array(typecode, _diffuse(
+                    channel, scale, maximum, kernel, channel_errors)))
+                channel_errors.append(channel_errors.pop(0))
+                channel_errors[-1][:] = repeat(0.0, width + 2 * _PADDING)
+
+        yield ColorArray._from_channels(result[0], result[1], result[2], depth)
+
+
+def dither(colors, width, depth, method='floyd_steinberg', bayer_size=4):
+    """Return a ColorArray of an image reduced to the depth, dithered.
+
+    The colors are the pixels of the image, row by row, in a ColorArray, and
+    the image is width pixels wide.
+
+    """
+
+    if width <= 0 or len(colors) % width:
+        raise ValueError('The colors do not make up whole rows.')
+
+    rows = (colors[start:start + width]
+            for start in range(0, len(colors), width))
+    red = array(_typecode(depth))
+    green = array(red.typecode)
+    blue = array(red.typecode)
+    for row in dither_rows(rows, depth, method, bayer_size):
+        red.extend(row.red)
+        green.extend(row.green)
+        blue.extend(row.blue)
+
+    return ColorArray._from_channels(red, green, blue, depth)
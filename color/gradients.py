@@ -0,0 +1,115 @@
+"""This module includes gradients between two colors.
+
+The stops are evenly spaced from the start color to the stop color,
+inclusive, and interpolated in RGB, HSV, CIELAB, or OKLab. Hues in HSV go
+the short way around the color wheel.
+
+    >>> list(gradient(Color.BLACK, Color.WHITE, 3))
+    [Color(0, 0, 0, 24), Color(128, 128, 128, 24), Color(255, 255, 255, 24)]
+
+gradient generates one Color per stop as it is needed, and gradient_array
+writes every stop straight into the buffers of a ColorArray, which can be
+used as a lookup table or packed with ColorArray.to_ints. Both give the same
+colors.
+
+"""
+
+from colorsys import hsv_to_rgb
+from itertools import repeat
+from operator import add, mod, mul, truediv
+
+from . import Color
+from .array import ColorArray
+from .hsv import hsv_to_rgb_many
+from .spaces import (lab_to_rgb, lab_to_rgb_many, oklab_to_rgb,
+                     oklab_to_rgb_many)
+
+__all__ = ('SPACES', 'gradient', 'gradient_array')
+__author__ = 'Tyler Crompton'
+
+
+SPACES = ('rgb', 'hsv', 'lab', 'oklab')
+
+
+def _endpoints(start, stop, n, space):
+    """Return the coordinates of the start, their deltas, and the depth."""
+
+    if space not in SPACES:
+        raise ValueError('Unknown space: {}.'.format(repr(space)))
+    if n <= 0:
+        raise ValueError('The number of stops must be a positive integer.')
+
+    depth = start.depth
+    if stop.depth != depth:
+        stop = stop.to_depth(depth)
+
+    if space == 'rgb':
+        origin, target = tuple(start), tuple(stop)
+    else:
+        origin, target = getattr(start, space), getattr(stop, space)
+
+    deltas = [b - a for a, b in zip(origin, target)]
+    if space == 'hsv':
+        # The hue of a gray is meaningless, so the other hue is kept.
+        if origin[1] == 0:
+            origin = (target[0],) + tuple(origin[1:])
+            deltas[0] = 0.0
+        elif target[1] == 0:
+            deltas[0] = 0.0
+        elif deltas[0] > 0.5:
+            deltas[0] -= 1.0
+        elif deltas[0] < -0.5:
+            deltas[0] += 1.0
+
+    return origin, deltas, depth
+
+
+def gradient(start, stop, n, space='rgb'):
+    """Generate n colors evenly spaced from start to stop.
+
+    The colors have the depth of start. The space is 'rgb', 'hsv', 'lab', or
+    'oklab'.
+
+    """
+
+    origin, deltas, depth = _endpoints(start, stop, n, space)
+    last = max(n - 1, 1)
+
+    for index in range(n):
+        t = index / last
+        x, y, z = (a + d * t for a, d in zip(origin, deltas))
+        if space == 'rgb':
+            samples = (round(x), round(y), round(z))
+        elif space == 'hsv':
+            r, g, b = hsv_to_rgb(x % 1.0, y, z)
+            samples = (round(r), round(g), round(b))
+        elif space == 'lab':
+            samples = lab_to_rgb(x, y, z, depth)
+        else:
+            samples = oklab_to_rgb(x, y, z, depth)
+        yield Color._make(samples + (depth,))
+
+
+def gradient_array(start, stop, n, space='rgb'):
+    """Return a ColorArray of the colors of gradient(start, stop, n, space).
+
+    The stops are computed a channel at a time, without a Color or a tuple
+    per stop.
+
+    """
+
+    origin, deltas, depth = _endpoints(start, stop, n, space)
+    last = max(n - 1, 1)
+    x, y, z = (map(add, repeat(a), map(mul, repeat(d), map(
+        truediv, range(n), repeat(last)))) for a, d in zip(origin, deltas))
+
+    if space == 'rgb':
+        samples = (map(round, x), map(round, y), map(round, z))
+    elif space == 'hsv':
+        samples = hsv_to_rgb_many(map(mod, x, repeat(1.0)), y, z)
+    elif space == 'lab':
+        samples = lab_to_rgb_many(x, y, z, depth)
+    else:
+        samples = oklab_to_rgb_many(x, y, z, depth)
+
+    return ColorArray._from_samples(samples, depth)
@@ -0,0 +1,85 @@
+"""This module includes the batch HSV conversion engine.
+
+The conversions perform exactly the same floating-point operations as
+colorsys.rgb_to_hsv and colorsys.hsv_to_rgb, so the results are identical to
+converting one color at a time, but a whole buffer is converted in a single
+call.
+
+"""
+
+from array import array
+
+__all__ = ('rgb_to_hsv_many', 'hsv_to_rgb_many')
+__author__ = 'Tyler Crompton'
+
+
+def rgb_to_hsv_many(red, green, blue):
+    """Return arrays of the hues, saturations, and values of the samples."""
+
+    hues = []
+    saturations = []
+    append_hue = hues.append
+    append_saturation = saturations.append
+    values = list(map(max, red, green, blue))
+
+    for r, g, b, maxc, minc in zip(red, green, blue, values,
+                                   map(min, red, green, blue)):
+        if minc == maxc:
+            append_hue(0.0)
+            append_saturation(0.0)
+            continue
+        rangec = maxc - minc
+        append_saturation(rangec / maxc)
+        if r == maxc:
+            h = (maxc - b) / rangec - (maxc - g) / rangec
+        elif g == maxc:
+            h = 2.0 + (maxc - r) / rangec - (maxc - b) / rangec
+        else:
+            h = 4.0 + (maxc - g) / rangec - (maxc - r) / rangec
+        append_hue((h / 6.0) % 1.0)
+
+    return array('d', hues), array('d', saturations), array('d', values)
+
+
+def hsv_to_rgb_many(hues, saturations, values):
+    """Return lists of the red, green, and blue samples, rounded to integers.
+
+    The values are on the same scale as the samples they produce, just as
+    Color.value is.
+
+    """
+
+    reds = []
+    greens = []
+    blues = []
+    append_red = reds.append
+    append_green = greens.append
+    append_blue = blues.append
+
+    for h, s, v in zip(hues, saturations, values):
+        if s == 0.0:
+            r = g = b = v
+        else:
+            i = int(h * 6.0)
+            f = (h * 6.0) - i
+            p = v * (1.0 - s)
+            q = v * (1.0 - s * f)
+            t = v * (1.0 - s * (1.0 - f))
+            i %= 6
+            if i == 0:
+                r, g, b = v, t, p
+            elif i == 1:
+                r, g, b = q, v, p
+            elif i == 2:
+                r, g, b = p, v, t
+            elif i == 3:
+                r, g, b = p, q, v
+            elif i == 4:
+                r, g, b = t, p, v
+            else:
+                r, g, b = v, p, q
+        append_red(round(r))
+        append_green(round(g))
+        append_blue(round(b))
+
+    return reds, greens, blues
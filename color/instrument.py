@@ -0,0 +1,246 @@
+"""This module counts and times the hot paths of the Color class.
+
+While instrumentation is enabled, Color.__new__ (by the form of its
+arguments), _validate_sample, Color.hex, and the HSV properties are counted
+and timed, accesses to the named constants are counted, and the hits and
+misses of the color cache and the CSS cache are tracked.
+
+    >>> with recording():
+    ...     _ = Color(30, 144, 255).hex
+    ...     _ = Color('#1e90ff').hsv
+    ...     _ = Color.RED
+    >>> stats = snapshot()
+    >>> stats.calls['Color.__new__[rgb]'].count
+    1
+    >>> stats.constants
+    {'RED': 1}
+
+Enabling instrumentation wraps those functions in place, and disabling it
+puts the originals back, so it costs nothing at all while it is disabled.
+The statistics are kept until they are reset, even after it is disabled.
+
+"""
+
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+from . import _NAMED_COLORS, Color, array as _array, cache as _cache, \
+    css as _css
+
+__all__ = ('CacheStats', 'Stats', 'Timing', 'disable', 'enable',
+           'is_enabled', 'recording', 'reset', 'snapshot')
+__author__ = 'Tyler Crompton'
+
+
+class Timing(namedtuple('Timing', ('count', 'seconds'))):
+    """The number of calls of a function and the total time spent in them."""
+
+    __slots__ = ()
+
+    @property
+    def mean(self):
+        """Gets the mean time of a call, in seconds."""
+
+        return self.seconds / self.count if self.count else 0.0
+
+
+class CacheStats(namedtuple('CacheStats', ('hits', 'misses'))):
+    """The number of hits and misses of a cache."""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Gets the fraction of lookups that were hits."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+
+Stats = namedtuple('Stats', ('calls', 'constants', 'caches'))
+
+_FORMS = {1: 'sequence', 2: 'sequence, depth', 3: 'rgb', 4: 'rgb, depth'}
+_PROPERTIES = ('hex', 'hsv', 'hue', 'saturation', 'value')
+
+# The modules that call _validate_sample by its global name.
+_VALIDATORS = (sys.modules[Color.__module__], _array)
+
+# The name of each function maps to its count and total nanoseconds.
+_timings = {}
+_constants = {}
+_baselines = {}
+_originals = None
+
+
+def _timed(name, function):
+    """Return a wrapper of the function that records its timing."""
+
+    def wrapper(*args):
+        start = perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            elapsed = perf_counter_ns() - start
+            try:
+                timing = _timings[name]
+            except KeyError:
+                timing = _timings[name] = [0, 0]
+            timing[0] += 1
+            timing[1] += elapsed
+
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+
+    return wrapper
+
+
+def _new(new):
+    """Return a wrapper of Color.__new__ that records each form separately."""
+
+    forms = {form: _timed('Color.__new__[{}]'.format(name), new)
+             for form, name in _FORMS.items()}
+    forms['hex'] = _timed('Color.__new__[hex]', new)
+
+    def __new__(cls, *args):
+        if len(args) == 1 and isinstance(args[0], str):
+            return forms['hex'](cls, *args)
+
+        return forms.get(len(args), new)(cls, *args)
+
+    __new__.__doc__ = new.__doc__
+
+    return __new__
+
+
+class _Constant(object):
+    """A descriptor that counts the accesses to a named constant."""
+
+    __slots__ = ('name', 'color')
+
+    def __init__(self, name, color):
+        self.name = name
+        self.color = color
+
+    def __get__(self, instance, owner):
+        _constants[self.name] = _constants.get(self.name, 0) + 1
+
+        return self.color
+
+
+def _caches():
+    """Return the cumulative hits and misses of each cache."""
+
+    caches = {}
+    for name, info in (('cache', _cache.info()),
+                       ('css', _css.parse.cache_info())):
+        if info is not None:
+            caches[name] = CacheStats(info.hits, info.misses)
+
+    return caches
+
+
+def is_enabled():
+    """Return whether instrumentation is enabled."""
+
+    return _originals is not None
+
+
+def enable():
+    """Start counting and timing the hot paths of the Color class."""
+
+    global _originals
+
+    if _originals is not None:
+        return
+
+    originals = {name: Color.__dict__[name]
+                 for name in ('__new__',) + _PROPERTIES}
+    originals.update((name, Color.__dict__[name])
+                     for name, _, _, _ in _NAMED_COLORS)
+    validate = _array._validate_sample
+
+    Color.__new__ = _new(Color.__new__)
+    for name in _PROPERTIES:
+        fget = originals[name].fget
+        setattr(Color, name, property(_timed('Color.' + name, fget),
+                                      doc=fget.__doc__))
+    for name, _, _, _ in _NAMED_COLORS:
+        setattr(Color, name, _Constant(name, originals[name]))
+    timed = _timed('_validate_sample', validate)
+    for module in _VALIDATORS:
+        module._validate_sample = timed
+
+    originals['_validate_sample'] = validate
+    _originals = originals
+
+
+def disable():
+    """Stop instrumenting, and restore the original functions."""
+
+    global _originals
+
+    if _originals is None:
+        return
+
+    originals, _originals = _originals, None
+    validate = originals.pop('_validate_sample')
+    for module in _VALIDATORS:
+        module._validate_sample = validate
+    for name, value in originals.items():
+        setattr(Color, name, value)
+
+
+def reset():
+    """Discard the statistics gathered so far."""
+
+    _timings.clear()
+    _constants.clear()
+    _baselines.clear()
+    _baselines.update(_caches())
+
+
+def snapshot():
+    """Return the Stats gathered since the last reset.
+
+    The calls map the name of each function to its Timing, the constants map
+    the name of each constant to its number of accesses, and the caches map
+    the name of each enabled cache to its CacheStats.
+
+    """
+
+    caches = {}
+    for name, current in _caches().items():
+        baseline = _baselines.get(name, CacheStats(0, 0))
+        if current.hits < baseline.hits or current.misses < baseline.misses:
+            # The cache was replaced or cleared since the last reset.
+            baseline = CacheStats(0, 0)
+        caches[name] = CacheStats(current.hits - baseline.hits,
+                                  current.misses - baseline.misses)
+
+    return Stats({name: Timing(count, nanoseconds / 1e9)
+                  for name, (count, nanoseconds) in _timings.items()},
+                 dict(_constants), caches)
+
+
+@contextmanager
+def recording(reset_stats=True):
+    """Enable instrumentation within a with statement.
+
+    The statistics are reset first unless reset_stats is false, and
+    instrumentation is disabled again at the end unless it was already
+    enabled.
+
+    """
+
+    enabled = is_enabled()
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable()
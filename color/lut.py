@@ -0,0 +1,318 @@
+"""This module includes 3D lookup tables of color transforms.
+
+A LUT samples a transform at the points of a size by size by size grid over
+the RGB cube, and applies it to a color by interpolating between the eight
+grid points around it. The transform is only evaluated while the LUT is
+baked, so applying a LUT costs the same for every pixel, however expensive
+the transform is.
+
+    >>> invert = LUT.bake(lambda color: Color(
+    ...     255 - color.red, 255 - color.green, 255 - color.blue), size=17)
+    >>> invert.lookup(Color.DODGER_BLUE)
+    Color(225, 111, 0, 24)
+
+The interpolation is 'trilinear', which weighs all eight grid points, or
+'tetrahedral', which weighs the four corners of the tetrahedron of the cube
+that holds the color and keeps grays on the diagonal of the cube.
+
+LUTs are read from and written to the .cube format of Adobe and Resolve with
+load and dump. A LUT is also a transform for color.pipeline.recolor.
+
+"""
+
+import io
+from array import array
+from itertools import product
+
+from . import Color
+from .array import ColorArray
+from .depth import _maximum
+
+__all__ = ('INTERPOLATIONS', 'LUT', 'dump', 'dumps', 'load', 'loads')
+__author__ = 'Tyler Crompton'
+
+
+INTERPOLATIONS = ('trilinear', 'tetrahedral')
+
+
+def _locate(position, last, stride):
+    """Return the offset of the grid point below a position and the fraction.
+
+    The position is clamped to the grid, which has last + 1 points.
+
+    """
+
+    if position <= 0:
+        return 0, 0.0
+    if position >= last:
+        return (last - 1) * stride, 1.0
+
+    index = int(position)
+
+    return index * stride, position - index
+
+
+class LUT(object):
+    """A class to represent a 3D lookup table.
+
+    The red, green, and blue outputs of the grid points are sequences of
+    size ** 3 numbers, nominally from 0 to 1, with the red input varying the
+    fastest and the blue input the slowest, as in a .cube file. The domain is
+    the range of inputs, per channel, that the grid spans.
+
+    """
+
+    __slots__ = ('size', 'red', 'green', 'blue', 'title', 'domain_min',
+                 'domain_max', 'interpolation')
+
+    def __init__(self, size, red, green, blue, title=None,
+                 domain_min=(0.0, 0.0, 0.0), domain_max=(1.0, 1.0, 1.0),
+                 interpolation='trilinear'):
+        if size < 2:
+            raise ValueError('The size must be at least 2.')
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError('Unknown interpolation: {}.'.format(
+                repr(interpolation)))
+
+        self.size = size
+        self.red = array('d', red)
+        self.green = array('d', green)
+        self.blue = array('d', blue)
+        if not len(self.red) == len(self.green) == len(self.blue) == size ** 3:
+            raise ValueError('There must be {} grid points.'.format(
+                size ** 3))
+        self.title = title
+        self.domain_min = tuple(map(float, domain_min))
+        self.domain_max = tuple(map(float, domain_max))
+        if any(low >= high for low, high in zip(self.domain_min,
+                                                 self.domain_max)):
+            raise ValueError('The domain must not be empty.')
+        self.interpolation = interpolation
+
+    @classmethod
+    def bake(cls, transform, size=33, interpolation='trilinear', depth=24):
+        """Create a LUT by evaluating a transform at every grid point.
+
+        The transform takes a Color and returns a Color of any depth. It is
+        called with colors of the given depth, whose samples are the grid
+        points rounded to the nearest integer. A depth of 48 places them
+        more precisely.
+
+        """
+
+        if size < 2:
+            raise ValueError('The size must be at least 2.')
+
+        maximum = _maximum(depth)
+        samples = [(2 * index * maximum + size - 1) // (2 * size - 2)
+                   for index in range(size)]
+        outputs = ([], [], [])
+        for blue, green, red in product(samples, repeat=3):
+            color = transform(Color._make((red, green, blue, depth)))
+            scale = _maximum(color.depth)
+            for output, sample in zip(outputs, color):
+                output.append(sample / scale)
+
+        return cls(size, outputs[0], outputs[1], outputs[2],
+                   interpolation=interpolation)
+
+    def _coordinates(self, maximum):
+        """Return the scale and offset mapping samples onto each grid axis."""
+
+        last = self.size - 1
+
+        return [(last / (high - low) / maximum, last * low / (high - low))
+                for low, high in zip(self.domain_min, self.domain_max)]
+
+    def _apply(self, red, green, blue, maximum):
+        """Return lists of the outputs of the samples, as samples.
+
+        Each distinct color is only interpolated once.
+
+        """
+
+        size = self.size
+        last = size - 1
+        (red_scale, red_offset), (green_scale, green_offset), \
+            (blue_scale, blue_offset) = self._coordinates(maximum)
+        tables = self.red, self.green, self.blue
+        tetrahedral = self.interpolation == 'tetrahedral'
+
+        # The offsets of the grid points around a color from the nearest one.
+        dx, dy, dz = 1, size, size * size
+        dxy, dxz, dyz, dxyz = dx + dy, dx + dz, dy + dz, dx + dy + dz
+
+        outputs = ([], [], [])
+        red_append, green_append, blue_append = (output.append
+                                                 for output in outputs)
+        red_axis, green_axis, blue_axis, cache = {}, {}, {}, {}
+        for key in zip(red, green, blue):
+            try:
+                r, g, b = cache[key]
+            except KeyError:
+                try:
+                    x, fx = red_axis[key[0]]
+                except KeyError:
+                    x, fx = red_axis[key[0]] = _locate(
+                        key[0] * red_scale - red_offset, last, dx)
+                try:
+                    y, fy = green_axis[key[1]]
+                except KeyError:
+                    y, fy = green_axis[key[1]] = _locate(
+                        key[1] * green_scale - green_offset, last, dy)
+                try:
+                    z, fz = blue_axis[key[2]]
+                except KeyError:
+                    z, fz = blue_axis[key[2]] = _locate(
+                        key[2] * blue_scale - blue_offset, last, dz)
+                base = x + y + z
+
+                values = []
+                if tetrahedral:
+                    # The path from the nearest grid point to the farthest
+                    # steps along the axes in the order of their fractions.
+                    if fx >= fy:
+                        if fy >= fz:
+                            f1, f2, f3, o1, o2 = fx, fy, fz, dx, dxy
+                        elif fx >= fz:
+                            f1, f2, f3, o1, o2 = fx, fz, fy, dx, dxz
+                        else:
+                            f1, f2, f3, o1, o2 = fz, fx, fy, dz, dxz
+                    elif fz >= fy:
+                        f1, f2, f3, o1, o2 = fz, fy, fx, dz, dyz
+                    elif fz >= fx:
+                        f1, f2, f3, o1, o2 = fy, fz, fx, dy, dyz
+                    else:
+                        f1, f2, f3, o1, o2 = fy, fx, fz, dy, dxy
+                    w0, w1, w2 = 1 - f1, f1 - f2, f2 - f3
+                    for table in tables:
+                        values.append(table[base] * w0 +
+                                      table[base + o1] * w1 +
+                                      table[base + o2] * w2 +
+                                      table[base + dxyz] * f3)
+                else:
+                    gx, gy, gz = 1 - fx, 1 - fy, 1 - fz
+                    w00, w10, w01, w11 = gy * gz, fy * gz, gy * fz, fy * fz
+                    for table in tables:
+                        values.append(
+                            (table[base] * gx + table[base + dx] * fx) * w00 +
+                            (table[base + dy] * gx +
+                             table[base + dxy] * fx) * w10 +
+                            (table[base + dz] * gx +
+                             table[base + dxz] * fx) * w01 +
+                            (table[base + dyz] * gx +
+                             table[base + dxyz] * fx) * w11)
+
+                r, g, b = cache[key] = [
+                    0 if value <= 0 else maximum if value >= 1 else
+                    int(value * maximum + 0.5) for value in values]
+            red_append(r)
+            green_append(g)
+            blue_append(b)
+
+        return outputs
+
+    def lookup(self, color):
+        """Return the output of a color, at the depth of the color."""
+
+        depth = color.depth
+        red, green, blue = self._apply((color[0],), (color[1],), (color[2],),
+                                       _maximum(depth))
+
+        return Color._make((red[0], green[0], blue[0], depth))
+
+    def apply(self, colors):
+        """Return a ColorArray of the outputs of a collection of colors.
+
+        The colors are a ColorArray or an iterable of colors that share a
+        depth, and the outputs have the same depth.
+
+        """
+
+        if not isinstance(colors, ColorArray):
+            colors = ColorArray(colors)
+
+        return ColorArray._from_samples(self._apply(
+            colors.red, colors.green, colors.blue, _maximum(colors.depth)),
+            colors.depth)
+
+    def __call__(self, red, green, blue):
+        """Return the outputs of 8-bit samples, as in a pipeline transform."""
+
+        return tuple(map(bytes, self._apply(red, green, blue, 255)))
+
+
+def _numbers(words, count, number):
+    if len(words) != count:
+        raise ValueError('Line {} must have {} values.'.format(number, count))
+    try:
+        return tuple(map(float, words))
+    except ValueError:
+        raise ValueError('Line {} has an invalid number.'.format(number))
+
+
+def load(file):
+    """Read a LUT from a .cube file opened in text mode."""
+
+    size = title = None
+    domain_min, domain_max = (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+    outputs = ([], [], [])
+    for number, line in enumerate(file, 1):
+        words = line.split()
+        if not words or words[0].startswith('#'):
+            continue
+
+        keyword = words[0]
+        if keyword == 'TITLE':
+            title = line.split(None, 1)[1].strip().strip('"')
+        elif keyword == 'LUT_3D_SIZE':
+            size = int(_numbers(words[1:], 1, number)[0])
+        elif keyword == 'DOMAIN_MIN':
+            domain_min = _numbers(words[1:], 3, number)
+        elif keyword == 'DOMAIN_MAX':
+            domain_max = _numbers(words[1:], 3, number)
+        elif keyword == 'LUT_3D_INPUT_RANGE':
+            low, high = _numbers(words[1:], 2, number)
+            domain_min, domain_max = (low,) * 3, (high,) * 3
+        elif keyword == 'LUT_1D_SIZE':
+            raise ValueError('1D LUTs are not supported.')
+        elif keyword[0].isalpha():
+            raise ValueError('Unknown keyword on line {}: {}.'.format(
+                number, keyword))
+        else:
+            for output, value in zip(outputs, _numbers(words, 3, number)):
+                output.append(value)
+
+    if size is None:
+        raise ValueError('The file has no LUT_3D_SIZE.')
+
+    return LUT(size, outputs[0], outputs[1], outputs[2], title, domain_min,
+               domain_max)
+
+
+def loads(text):
+    """Return the LUT of the text of a .cube file."""
+
+    return load(io.StringIO(text))
+
+
+def dump(lut, file):
+    """Write a LUT to a .cube file opened in text mode."""
+
+    if lut.title is not None:
+        file.write('TITLE "{}"\n'.format(lut.title))
+    file.write('LUT_3D_SIZE {}\n'.format(lut.size))
+    if lut.domain_min != (0.0, 0.0, 0.0) or lut.domain_max != (1.0, 1.0, 1.0):
+        file.write('DOMAIN_MIN {:.6f} {:.6f} {:.6f}\n'.format(*lut.domain_min))
+        file.write('DOMAIN_MAX {:.6f} {:.6f} {:.6f}\n'.format(*lut.domain_max))
+    file.writelines(map('{:.6f} {:.6f} {:.6f}\n'.format, lut.red, lut.green,
+                        lut.blue))
+
+
+def dumps(lut):
+    """Return the text of the .cube file of a LUT."""
+
+    file = io.StringIO()
+    dump(lut, file)
+
+    return file.getvalue()
@@ -0,0 +1,170 @@
+"""This module finds the named color closest to an arbitrary color.
+
+The named colors are placed in a k-d tree, one per distance metric, the
+first time the metric is used. A query then visits only a handful of the
+named colors instead of every one of them.
+
+"""
+
+from . import _NAMED_COLORS
+from .depth import rescale, rescale_table
+from .spaces import rgb_to_lab
+
+__all__ = ('METRICS', 'nearest_name', 'nearest_names')
+__author__ = 'Tyler Crompton'
+
+
+def _euclidean(a, b):
+    return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2)
+
+
+def _redmean(a, b):
+    mean = (a[0] + b[0]) / 2
+    return ((2 + mean / 256) * (a[0] - b[0]) ** 2 +
+            4 * (a[1] - b[1]) ** 2 +
+            (2 + (255 - mean) / 256) * (a[2] - b[2]) ** 2)
+
+
+class _Metric(object):
+    """A distance between two points in some three-dimensional space.
+
+    The transform maps 24-bit (red, green, blue) samples into the space. The
+    distance need not be a true metric, but for every axis, the distance
+    between two points must be at least the weight of the axis times the
+    square of their difference along it, so that the tree can be pruned.
+
+    """
+
+    __slots__ = ('transform', 'distance', 'weights')
+
+    def __init__(self, transform, distance, weights):
+        self.transform = transform
+        self.distance = distance
+        self.weights = weights
+
+
+METRICS = {
+    'euclidean': _Metric(tuple, _euclidean, (1, 1, 1)),
+    'redmean': _Metric(tuple, _redmean, (2, 4, 2)),
+    'cie76': _Metric(lambda rgb: rgb_to_lab(*rgb), _euclidean, (1, 1, 1)),
+}
+
+_trees = {}
+
+
+def _build(points, depth=0):
+    """Return a k-d tree node as (point, index, axis, left, right)."""
+
+    if not points:
+        return None
+
+    axis = depth % 3
+    points.sort(key=lambda point: point[0][axis])
+    median = len(points) // 2
+
+    return (points[median][0], points[median][1], axis,
+            _build(points[:median], depth + 1),
+            _build(points[median + 1:], depth + 1))
+
+
+def _tree(metric):
+    try:
+        return _trees[metric]
+    except KeyError:
+        pass
+
+    try:
+        transform = METRICS[metric].transform
+    except KeyError:
+        raise ValueError('Unknown metric: {}.'.format(repr(metric)))
+
+    points = []
+    seen = set()
+    for index, (_, red, green, blue) in enumerate(_NAMED_COLORS):
+        if (red, green, blue) not in seen:
+            seen.add((red, green, blue))
+            points.append((transform((red, green, blue)), index))
+    _trees[metric] = _build(points)
+
+    return _trees[metric]
+
+
+def _search(node, point, distance, weights, best):
+    """Return the (distance, index) of the named color closest to point."""
+
+    if node is None:
+        return best
+
+    candidate = (distance(point, node[0]), node[1])
+    if candidate < best:
+        best = candidate
+
+    axis = node[2]
+    difference = point[axis] - node[0][axis]
+    near, far = (node[3], node[4]) if difference < 0 else (node[4], node[3])
+    best = _search(near, point, distance, weights, best)
+    if weights[axis] * difference ** 2 <= best[0]:
+        best = _search(far, point, distance, weights, best)
+
+    return best
+
+
+def _rgb24(color):
+    """Return the samples of a color scaled to a depth of 24 bits."""
+
+    depth = color.depth
+    if depth == 24:
+        return color[0], color[1], color[2]
+
+    if depth % 3:
+        # Only depths of whole bits per sample can be rescaled exactly.
+        scale = 255 / (2 ** (depth / 3) - 1)
+        return (round(color[0] * scale), round(color[1] * scale),
+                round(color[2] * scale))
+
+    table = rescale_table(depth, 24)
+    if table is None:
+        return (rescale(color[0], depth, 24), rescale(color[1], depth, 24),
+                rescale(color[2], depth, 24))
+
+    return table[color[0]], table[color[1]], table[color[2]]
+
+
+def nearest_name(color, metric='euclidean'):
+    """Return the name of the constant closest to the color."""
+
+    tree = _tree(metric)
+    metric = METRICS[metric]
+    index = _search(tree, metric.transform(_rgb24(color)), metric.distance,
+                    metric.weights, (float('inf'), -1))[1]
+
+    return _NAMED_COLORS[index][0]
+
+
+def nearest_names(colors, metric='euclidean'):
+    """Return the name of the constant closest to each of the colors.
+
+    Each distinct color is only searched for once.
+
+    """
+
+    tree = _tree(metric)
+    metric = METRICS[metric]
+    transform = metric.transform
+    distance = metric.distance
+    weights = metric.weights
+    infinity = (float('inf'), -1)
+    names = []
+    append = names.append
+    found = {}
+
+    for color in colors:
+        try:
+            append(found[color])
+        except KeyError:
+            index = _search(tree, transform(_rgb24(color)), distance, weights,
+                            infinity)[1]
+            found[color] = _NAMED_COLORS[index][0]
+            append(found[color])
+
+    return names
@@ -0,0 +1,227 @@
+"""This module recolors large pixel buffers in a pool of processes.
+
+The pixels are 8-bit RGB or RGBA samples, as in ColorArray.frombuffer, and
+are split into tiles of consecutive pixels. Each tile is recolored by a
+transform in a worker process, and the result is written back in place.
+The workers read and write the pixels through shared memory, so the buffer
+itself is never pickled; only the name of the shared memory block and the
+bounds of a tile are sent to a worker.
+
+    >>> pixels = bytearray([255, 0, 0] * 4)
+    >>> recolor(pixels, HSVShift(hue=1 / 3), processes=1).pixels
+    4
+    >>> pixels[:3]
+    bytearray(b'\\x00\\xff\\x00')
+
+A transform is a picklable callable. It takes the red, green, and blue
+samples of a tile, as memoryviews, and returns the new red, green, and blue
+samples as bytes-like objects of the same length. HSVShift, PaletteMap, and
+DepthReduction are provided.
+
+"""
+
+import os
+from collections import namedtuple
+from itertools import repeat
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from operator import add, and_, lshift, mod, mul, or_, rshift
+from time import perf_counter
+
+from .array import _INTERLEAVED_LAYOUTS
+from .depth import rescale
+from .hsv import hsv_to_rgb_many, rgb_to_hsv_many
+
+__all__ = ('DepthReduction', 'HSVShift', 'PaletteMap', 'Progress', 'recolor')
+__author__ = 'Tyler Crompton'
+
+
+class Progress(namedtuple('Progress', ('pixels', 'total', 'tiles',
+                                       'seconds'))):
+    """The number of pixels and tiles recolored so far and the time taken."""
+
+    __slots__ = ()
+
+    @property
+    def pixels_per_second(self):
+        """Gets the throughput so far."""
+
+        return self.pixels / self.seconds if self.seconds else 0.0
+
+
+class HSVShift(object):
+    """Rotate the hue and scale the saturation and value of every pixel.
+
+    The hue is a fraction of a turn. The saturation and value are scaled by
+    factors that must not be negative, and are clamped to their maximums.
+
+    """
+
+    __slots__ = ('hue', 'saturation', 'value')
+
+    def __init__(self, hue=0.0, saturation=1.0, value=1.0):
+        if saturation < 0 or value < 0:
+            raise ValueError('The saturation and value factors must not be '
+                             'negative.')
+
+        self.hue = hue
+        self.saturation = saturation
+        self.value = value
+
+    def __call__(self, red, green, blue):
+        hues, saturations, values = rgb_to_hsv_many(red, green, blue)
+        red, green, blue = hsv_to_rgb_many(
+            map(mod, map(add, hues, repeat(self.hue)), repeat(1.0)),
+            map(min, map(mul, saturations, repeat(self.saturation)),
+                repeat(1.0)),
+            map(min, map(mul, values, repeat(self.value)), repeat(255)))
+
+        return bytes(red), bytes(green), bytes(blue)
+
+
+class PaletteMap(object):
+    """Replace every pixel with the closest color of a palette.
+
+    The palette is a sequence of 24-bit colors or (red, green, blue)
+    triples, and the distance is Euclidean. Each distinct color of a tile is
+    only looked up once.
+
+    """
+
+    __slots__ = ('palette',)
+
+    def __init__(self, palette):
+        self.palette = tuple((color[0], color[1], color[2])
+                             for color in palette)
+        if not self.palette:
+            raise ValueError('The palette must not be empty.')
+
+    def _nearest(self, packed):
+        r, g, b = packed >> 16, packed >> 8 & 0xff, packed & 0xff
+        red, green, blue = min(self.palette, key=lambda color: (
+            (color[0] - r) ** 2 + (color[1] - g) ** 2 + (color[2] - b) ** 2))
+
+        return red << 16 | green << 8 | blue
+
+    def __call__(self, red, green, blue):
+        packed = list(map(or_, map(or_, map(lshift, red, repeat(16)),
+                                   map(lshift, green, repeat(8))), blue))
+        mapping = {color: self._nearest(color) for color in set(packed)}
+        packed = list(map(mapping.__getitem__, packed))
+
+        return (bytes(map(rshift, packed, repeat(16))),
+                bytes(map(and_, map(rshift, packed, repeat(8)),
+                          repeat(0xff))),
+                bytes(map(and_, packed, repeat(0xff))))
+
+
+class DepthReduction(object):
+    """Reduce every sample to the precision of a smaller depth.
+
+    The samples stay 8-bit, but only take the values of the samples of the
+    depth, e.g. 16 levels per channel for a depth of 12.
+
+    """
+
+    __slots__ = ('depth', '_table')
+
+    def __init__(self, depth):
+        self.depth = depth
+        self._table = bytes(rescale(rescale(sample, 24, depth), depth, 24)
+                            for sample in range(256))
+
+    def __call__(self, red, green, blue):
+        return (bytes(red).translate(self._table),
+                bytes(green).translate(self._table),
+                bytes(blue).translate(self._table))
+
+
+def _apply(buffer, start, stop, step, transform):
+    """Recolor the pixels from the start byte to the stop byte in place."""
+
+    tile = buffer[start:stop]
+    channels = tile[0::step], tile[1::step], tile[2::step]
+    for channel, samples in zip(channels, transform(*channels)):
+        channel[:] = samples
+
+    return len(channels[0])
+
+
+def _work(task):
+    """Recolor a tile of a shared memory block in a worker process."""
+
+    name, start, stop, step, transform = task
+    shared = SharedMemory(name)
+    try:
+        return _apply(shared.buf, start, stop, step, transform)
+    finally:
+        shared.close()
+
+
+def recolor(buffer, transform, layout='RGB888', tile_size=1 << 18,
+            processes=None, progress=None):
+    """Recolor the pixels of a writable buffer in place and return Progress.
+
+    The layout is 'RGB888' or 'RGBA8888', and the alpha is left alone. The
+    buffer is split into tiles of tile_size pixels, which are recolored by
+    the given number of processes, all of the CPUs by default. Unless the
+    buffer is a SharedMemory, it is copied into one first and back after.
+    With one process or one tile, the pixels are recolored in this process.
+
+    If progress is given, it is called with a Progress whenever a tile is
+    done.
+
+    """
+
+    try:
+        step = _INTERLEAVED_LAYOUTS[layout]
+    except KeyError:
+        raise ValueError('Unknown layout: {}.'.format(repr(layout)))
+    if tile_size <= 0:
+        raise ValueError('The tile size must be a positive integer.')
+
+    shared = buffer if isinstance(buffer, SharedMemory) else None
+    view = memoryview(shared.buf if shared else buffer).cast('B')
+    if view.readonly:
+        raise TypeError('The buffer must be writable.')
+    if len(view) % step:
+        raise ValueError('The buffer does not hold a whole number of pixels.')
+
+    total = len(view) // step
+    tiles = [(start, min(start + tile_size * step, len(view)))
+             for start in range(0, len(view), tile_size * step)]
+    processes = processes or os.cpu_count() or 1
+    started = perf_counter()
+    status = Progress(0, total, 0, 0.0)
+
+    def advance(pixels):
+        nonlocal status
+        status = Progress(status.pixels + pixels, total, status.tiles + 1,
+                          perf_counter() - started)
+        if progress is not None:
+            progress(status)
+
+    if processes == 1 or len(tiles) <= 1:
+        for start, stop in tiles:
+            advance(_apply(view, start, stop, step, transform))
+        return status
+
+    owner = shared is None
+    if owner:
+        shared = SharedMemory(create=True, size=len(view))
+    try:
+        if owner:
+            shared.buf[:len(view)] = view
+        with Pool(min(processes, len(tiles))) as pool:
+            for pixels in pool.imap_unordered(_work, [
+                    (shared.name, start, stop, step, transform)
+                    for start, stop in tiles]):
+                advance(pixels)
+        if owner:
+            view[:] = shared.buf[:len(view)]
+    finally:
+        if owner:
+            shared.close()
+            shared.unlink()
+
+    return status
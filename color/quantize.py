@@ -0,0 +1,263 @@
+"""This module extracts palettes of dominant colors from raw pixel buffers.
+
+The pixels are read straight out of any object that supports the buffer
+protocol, e.g. bytes, bytearray, mmap, or array.array, as 8-bit RGB or RGBA
+samples. Large buffers are sampled at a fixed stride, and each distinct color
+is only considered once, weighted by the number of pixels that have it.
+
+    >>> extract_palette(bytes([255, 0, 0] * 3 + [0, 0, 255]), 2)
+    [Color(255, 0, 0, 24), Color(0, 0, 255, 24)]
+
+"""
+
+from collections import Counter
+from time import perf_counter
+
+from . import Color
+
+__all__ = ('METHODS', 'extract_palette')
+__author__ = 'Tyler Crompton'
+
+
+_LAYOUTS = {'RGB': 3, 'RGBA': 4}
+
+# The octree and k-means read the clock once per this many distinct colors.
+_CHUNK_SIZE = 256
+
+# The octree stops inserting colors once this share of its time is spent,
+# leaving the rest for the reduction and for freeing the tree.
+_INSERTION_SHARE = 0.9
+
+
+def _histogram(buffer, layout, sample):
+    """Return a Counter of the (red, green, blue) of the sampled pixels."""
+
+    try:
+        step = _LAYOUTS[layout]
+    except KeyError:
+        raise ValueError('Unknown layout: {}.'.format(repr(layout)))
+
+    samples = memoryview(buffer).cast('B')
+    if len(samples) % step:
+        raise ValueError('The buffer does not hold a whole number of pixels.')
+
+    pixels = len(samples) // step
+    if sample and pixels > sample:
+        step *= -(-pixels // sample)
+
+    return Counter(zip(samples[0::step], samples[1::step], samples[2::step]))
+
+
+def _mean(colors):
+    """Return the weighted mean of (rgb, count) pairs and the total count."""
+
+    red = green = blue = total = 0
+    for (r, g, b), count in colors:
+        red += r * count
+        green += g * count
+        blue += b * count
+        total += count
+
+    return (red / total, green / total, blue / total), total
+
+
+def _widest(box):
+    """Return the extent and the channel of the widest channel of a box."""
+
+    widest = None
+    for channel in range(3):
+        values = [rgb[channel] for rgb, _ in box]
+        extent = max(values) - min(values)
+        if widest is None or extent > widest[0]:
+            widest = extent, channel
+
+    return widest
+
+
+def _median_cut(histogram, colors, deadline, **_):
+    boxes = [list(histogram.items())]
+    # The widest channel of each box is only measured when the box is made.
+    extents = [_widest(boxes[0])]
+
+    while len(boxes) < colors and perf_counter() < deadline:
+        widest = None
+        for index, box in enumerate(boxes):
+            if len(box) >= 2 and (widest is None or
+                                  extents[index][0] > widest[0]):
+                widest = extents[index][0], index, extents[index][1]
+        if widest is None:
+            break
+
+        _, index, channel = widest
+        del extents[index]
+        box = sorted(boxes.pop(index), key=lambda item: item[0][channel])
+        half = sum(count for _, count in box) / 2
+        running = 0
+        for split, (_, count) in enumerate(box[:-1], 1):
+            running += count
+            if running >= half:
+                break
+        boxes.extend((box[:split], box[split:]))
+        extents.extend((_widest(box[:split]), _widest(box[split:])))
+
+    return [_mean(box) for box in boxes]
+
+
+class _Node(object):
+    __slots__ = ('red', 'green', 'blue', 'count', 'children')
+
+    def __init__(self):
+        self.red = self.green = self.blue = self.count = 0
+        self.children = None
+
+
+def _octree(histogram, colors, deadline, **_):
+    root = _Node()
+    levels = [[] for _ in range(8)]
+    leaves = 0
+    start = perf_counter()
+    deadline = start + (deadline - start) * _INSERTION_SHARE
+
+    for index, ((r, g, b), count) in enumerate(histogram.items()):
+        # The deadline only cuts the insertion short, since the reduction
+        # below is needed to honor the number of colors. The first chunk of
+        # colors is always inserted.
+        if index and not index % _CHUNK_SIZE and perf_counter() >= deadline:
+            break
+        red = r * count
+        green = g * count
+        blue = b * count
+        node = root
+        for level in range(8):
+            # Every node holds the sums of the colors below it.
+            node.red += red
+            node.green += green
+            node.blue += blue
+            node.count += count
+            if node.children is None:
+                node.children = [None] * 8
+                levels[level].append(node)
+            shift = 7 - level
+            child = (r >> shift & 1) << 2 | (g >> shift & 1) << 1 | (
+                b >> shift & 1)
+            if node.children[child] is None:
+                node.children[child] = _Node()
+                if level == 7:
+                    leaves += 1
+            node = node.children[child]
+        node.red += red
+        node.green += green
+        node.blue += blue
+        node.count += count
+
+    # No level has fewer nodes than the one above it. The nodes of the level
+    # below the deepest one with at most as many nodes as colors all become
+    # leaves, and then the least common nodes of that level are merged until
+    # there are few enough leaves. Only those two levels are visited.
+    if leaves > colors:
+        level = max(level for level in range(8)
+                    if len(levels[level]) <= colors)
+        if level < 7:
+            for node in levels[level + 1]:
+                node.children = None
+            leaves = len(levels[level + 1])
+        reducible = sorted(levels[level], key=lambda node: node.count,
+                           reverse=True)
+        while leaves > colors:
+            node = reducible.pop()
+            leaves -= 7 - node.children.count(None)
+            node.children = None
+
+    palette = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.children is None:
+            palette.append(((node.red / node.count, node.green / node.count,
+                             node.blue / node.count), node.count))
+        else:
+            stack.extend(child for child in node.children if child)
+
+    return palette
+
+
+def _kmeans(histogram, colors, deadline, max_iterations=20, tolerance=0.5):
+    items = list(histogram.items())
+    palette = _median_cut(histogram, colors, deadline)
+
+    for _ in range(max_iterations):
+        if perf_counter() >= deadline:
+            break
+
+        centroids = [rgb for rgb, _ in palette]
+        clusters = [[] for _ in centroids]
+        for position, item in enumerate(items):
+            # An iteration that runs out of time is discarded.
+            if (position and not position % _CHUNK_SIZE and
+                    perf_counter() >= deadline):
+                return palette
+            r, g, b = item[0]
+            nearest = min(range(len(centroids)), key=lambda index: (
+                (centroids[index][0] - r) ** 2 +
+                (centroids[index][1] - g) ** 2 +
+                (centroids[index][2] - b) ** 2))
+            clusters[nearest].append(item)
+
+        moved = 0
+        palette = []
+        for centroid, cluster in zip(centroids, clusters):
+            if cluster:
+                palette.append(_mean(cluster))
+                moved = max(moved, max(abs(a - b) for a, b in zip(
+                    centroid, palette[-1][0])))
+        if moved < tolerance:
+            break
+
+    return palette
+
+
+METHODS = {
+    'median_cut': _median_cut,
+    'octree': _octree,
+    'kmeans': _kmeans,
+}
+
+
+def extract_palette(buffer, colors=8, method='median_cut', layout='RGB',
+                    sample=65536, time_budget=None, max_iterations=20,
+                    tolerance=0.5):
+    """Return up to the given number of the dominant colors of the pixels.
+
+    The method is 'median_cut', 'octree', or 'kmeans'. At most sample pixels
+    are read; 0 or None reads them all. If a time budget, in seconds, is
+    given, median cut stops splitting and k-means stops iterating once it is
+    spent, returning the best palette found so far. The octree stops adding
+    distinct colors to the tree instead, and reduces the colors it has added.
+    The budget starts once the pixels are sampled, and a budget that is too
+    short for the first splits yields fewer colors. k-means also stops after
+    max_iterations, or once no centroid moves by more than the tolerance.
+
+    The colors are 24-bit and ordered from the most to the least common.
+
+    """
+
+    try:
+        function = METHODS[method]
+    except KeyError:
+        raise ValueError('Unknown method: {}.'.format(repr(method)))
+    if colors <= 0:
+        raise ValueError('The number of colors must be a positive integer.')
+
+    histogram = _histogram(buffer, layout, sample)
+    if not histogram:
+        return []
+
+    deadline = float('inf') if time_budget is None else (
+        perf_counter() + time_budget)
+
+    palette = function(histogram, colors, deadline,
+                       max_iterations=max_iterations, tolerance=tolerance)
+    palette.sort(key=lambda item: item[1], reverse=True)
+
+    return [Color._make((round(r), round(g), round(b), 24))
+            for (r, g, b), _ in palette]
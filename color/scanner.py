@@ -0,0 +1,79 @@
+"""This module finds hexadecimal color literals in streams of text.
+
+The stream is read a fixed-size chunk at a time, and only a few characters
+are carried over from one chunk to the next, so the memory used does not
+depend on the size of the input.
+
+    >>> import io
+    >>> list(scan(io.StringIO('a { color: #1e90ff; background: #fff }')))
+    [(11, Color(30, 144, 255, 24)), (32, Color(15, 15, 15, 12))]
+
+A literal is a '#' followed by 3, 6, 9, or 12 hexadecimal digits that is
+neither part of a longer word nor of an HTML character reference such as
+'&#123;'. Since the scan is purely lexical, CSS ID selectors that look like
+colors, e.g. '#bad', are reported as well.
+
+"""
+
+import re
+
+from . import Color
+
+__all__ = ('scan',)
+__author__ = 'Tyler Crompton'
+
+
+_PATTERN = r'(?<![\w&#])#(?:[0-9a-fA-F]{3}){1,4}(?![\w-])'
+_TEXT_PATTERN = re.compile(_PATTERN)
+_BYTES_PATTERN = re.compile(_PATTERN.encode('ascii'))
+
+# Matches that start within this many characters of the end of a chunk may
+# continue in the next one, so they are left for the next chunk. It is the
+# length of the longest literal and the character after it.
+_OVERLAP = 14
+
+
+def scan(stream, chunk_size=65536):
+    """Generate an (offset, Color) pair for each color literal in the stream.
+
+    The stream is a text or binary file object, and the offsets are in
+    characters or bytes, respectively.
+
+    """
+
+    if chunk_size <= _OVERLAP:
+        raise ValueError('The chunk size must be greater than {}.'.format(
+            _OVERLAP))
+
+    buffer = stream.read(chunk_size)
+    if isinstance(buffer, str):
+        pattern = _TEXT_PATTERN
+        decode = str
+    else:
+        pattern = _BYTES_PATTERN
+        decode = bytes.decode
+
+    # The buffer starts at this offset of the stream, and matches that start
+    # before position are reported already.
+    offset = 0
+    position = 0
+
+    while True:
+        chunk = stream.read(chunk_size)
+        # Streams may return less than was asked for, so the buffer is
+        # filled past the overlap before any of it is scanned.
+        while chunk and len(buffer) <= _OVERLAP:
+            buffer += chunk
+            chunk = stream.read(chunk_size)
+        cut = len(buffer) - _OVERLAP if chunk else len(buffer)
+        for match in pattern.finditer(buffer, position):
+            if match.start() >= cut:
+                break
+            yield offset + match.start(), Color(decode(match.group()))
+        if not chunk:
+            return
+
+        # Keep a character before the cut for the lookbehind.
+        offset += cut - 1
+        buffer = buffer[cut - 1:] + chunk
+        position = 1
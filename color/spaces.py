@@ -0,0 +1,275 @@
+"""This module includes conversions between sRGB and perceptual color spaces.
+
+The samples of a color are treated as gamma-encoded sRGB. They are first
+linearized, then converted to CIE XYZ (with a D65 white point and Y = 1 for
+white), CIELAB, or OKLab. Linearization goes through a table of the linear
+value of every sample of a depth, so no power is computed per sample.
+
+The *_many functions convert whole buffers of samples at once and return
+arrays; the inverse functions return lists of samples, rounded to the
+nearest integer and clamped to the range of the depth.
+
+"""
+
+from array import array
+from itertools import repeat
+from math import ceil
+
+__all__ = ('lab_to_rgb', 'lab_to_rgb_many', 'linear_table', 'oklab_to_rgb',
+           'oklab_to_rgb_many', 'rgb_to_lab', 'rgb_to_lab_many',
+           'rgb_to_oklab', 'rgb_to_oklab_many', 'rgb_to_xyz',
+           'rgb_to_xyz_many', 'xyz_to_rgb', 'xyz_to_rgb_many')
+__author__ = 'Tyler Crompton'
+
+
+# Linearization tables are only built for samples of up to this many bits.
+_TABLE_BITS = 16
+
+_WHITE = (0.95047, 1.0, 1.08883)
+_EPSILON = (6 / 29) ** 3
+_KAPPA = 3 * (6 / 29) ** 2
+
+_tables = {}
+
+
+def _linearize(value):
+    if value <= 0.04045:
+        return value / 12.92
+
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _encode(value, maximum):
+    """Return the sample of a linear value, rounded and clamped."""
+
+    if value <= 0.0031308:
+        value *= 12.92
+    else:
+        value = 1.055 * value ** (1 / 2.4) - 0.055
+
+    return min(max(round(value * maximum), 0), maximum)
+
+
+def linear_table(depth):
+    """Return the linear value of each sample of the depth, or None.
+
+    The tables are built once per depth. None is returned if the samples of
+    the depth are too wide to tabulate.
+
+    """
+
+    try:
+        return _tables[depth]
+    except KeyError:
+        pass
+
+    if depth <= 0:
+        raise ValueError('The depth must be a positive integer.')
+    if depth / 3 > _TABLE_BITS:
+        return None
+
+    # Samples of depths that are not multiples of 3 reach 2 ** (depth / 3) - 1
+    # rounded up, so the table covers every sample below 2 ** (depth / 3).
+    maximum = 2 ** (depth / 3) - 1
+
+    return _tables.setdefault(depth, array('d', (
+        _linearize(value / maximum)
+        for value in range(ceil(maximum + 1)))))
+
+
+def _linear(value, depth):
+    table = linear_table(depth)
+    if table is None:
+        return _linearize(value / (2 ** (depth / 3) - 1))
+
+    return table[value]
+
+
+def _linear_channels(red, green, blue, depth):
+    table = linear_table(depth)
+    if table is None:
+        maximum = 2 ** (depth / 3) - 1
+        return ([_linearize(value / maximum) for value in red],
+                [_linearize(value / maximum) for value in green],
+                [_linearize(value / maximum) for value in blue])
+
+    return (list(map(table.__getitem__, red)),
+            list(map(table.__getitem__, green)),
+            list(map(table.__getitem__, blue)))
+
+
+def _linear_to_xyz(r, g, b):
+    return (0.4124564 * r + 0.3575761 * g + 0.1804375 * b,
+            0.2126729 * r + 0.7151522 * g + 0.0721750 * b,
+            0.0193339 * r + 0.1191920 * g + 0.9503041 * b)
+
+
+def _xyz_to_linear(x, y, z):
+    return (3.2404542 * x - 1.5371385 * y - 0.4985314 * z,
+            -0.9692660 * x + 1.8760108 * y + 0.0415560 * z,
+            0.0556434 * x - 0.2040259 * y + 1.0572252 * z)
+
+
+def _f(t):
+    return t ** (1 / 3) if t > _EPSILON else t / _KAPPA + 4 / 29
+
+
+def _f_inverse(t):
+    return t ** 3 if t > 6 / 29 else _KAPPA * (t - 4 / 29)
+
+
+def _xyz_to_lab(x, y, z):
+    fx = _f(x / _WHITE[0])
+    fy = _f(y / _WHITE[1])
+    fz = _f(z / _WHITE[2])
+
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _lab_to_xyz(l, a, b):
+    fy = (l + 16) / 116
+
+    return (_WHITE[0] * _f_inverse(fy + a / 500), _WHITE[1] * _f_inverse(fy),
+            _WHITE[2] * _f_inverse(fy - b / 200))
+
+
+def _cbrt(value):
+    return value ** (1 / 3) if value >= 0 else -(-value) ** (1 / 3)
+
+
+def _linear_to_oklab(r, g, b):
+    l = _cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m = _cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s = _cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+
+    return (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+            1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+            0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+
+
+def _oklab_to_linear(l, a, b):
+    l, m, s = (l + 0.3963377774 * a + 0.2158037573 * b,
+               l - 0.1055613458 * a - 0.0638541728 * b,
+               l - 0.0894841775 * a - 1.2914855480 * b)
+    l, m, s = l ** 3, m ** 3, s ** 3
+
+    return (4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+            -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+            -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s)
+
+
+def _from_linear(r, g, b, depth):
+    maximum = int(2 ** (depth / 3) - 1)
+
+    return _encode(r, maximum), _encode(g, maximum), _encode(b, maximum)
+
+
+def rgb_to_xyz(red, green, blue, depth=24):
+    """Return the (X, Y, Z) of the samples."""
+
+    return _linear_to_xyz(_linear(red, depth), _linear(green, depth),
+                          _linear(blue, depth))
+
+
+def rgb_to_lab(red, green, blue, depth=24):
+    """Return the CIELAB (L*, a*, b*) of the samples."""
+
+    return _xyz_to_lab(*rgb_to_xyz(red, green, blue, depth))
+
+
+def rgb_to_oklab(red, green, blue, depth=24):
+    """Return the OKLab (L, a, b) of the samples."""
+
+    return _linear_to_oklab(_linear(red, depth), _linear(green, depth),
+                            _linear(blue, depth))
+
+
+def xyz_to_rgb(x, y, z, depth=24):
+    """Return the samples of the (X, Y, Z) at the depth."""
+
+    return _from_linear(*_xyz_to_linear(x, y, z), depth)
+
+
+def lab_to_rgb(l, a, b, depth=24):
+    """Return the samples of the CIELAB (L*, a*, b*) at the depth."""
+
+    return _from_linear(*_xyz_to_linear(*_lab_to_xyz(l, a, b)), depth)
+
+
+def oklab_to_rgb(l, a, b, depth=24):
+    """Return the samples of the OKLab (L, a, b) at the depth."""
+
+    return _from_linear(*_oklab_to_linear(l, a, b), depth)
+
+
+def _convert_many(red, green, blue, depth, conversion):
+    first = []
+    second = []
+    third = []
+    append_first = first.append
+    append_second = second.append
+    append_third = third.append
+
+    for r, g, b in zip(*_linear_channels(red, green, blue, depth)):
+        u, v, w = conversion(r, g, b)
+        append_first(u)
+        append_second(v)
+        append_third(w)
+
+    return array('d', first), array('d', second), array('d', third)
+
+
+def _lab_from_linear(r, g, b):
+    return _xyz_to_lab(*_linear_to_xyz(r, g, b))
+
+
+def rgb_to_xyz_many(red, green, blue, depth=24):
+    """Return arrays of the X, Y, and Z of the samples."""
+
+    return _convert_many(red, green, blue, depth, _linear_to_xyz)
+
+
+def rgb_to_lab_many(red, green, blue, depth=24):
+    """Return arrays of the CIELAB L*, a*, and b* of the samples."""
+
+    return _convert_many(red, green, blue, depth, _lab_from_linear)
+
+
+def rgb_to_oklab_many(red, green, blue, depth=24):
+    """Return arrays of the OKLab L, a, and b of the samples."""
+
+    return _convert_many(red, green, blue, depth, _linear_to_oklab)
+
+
+def _inverse_many(first, second, third, depth, conversion):
+    red = []
+    green = []
+    blue = []
+    append_red = red.append
+    append_green = green.append
+    append_blue = blue.append
+
+    for r, g, b in map(conversion, first, second, third, repeat(depth)):
+        append_red(r)
+        append_green(g)
+        append_blue(b)
+
+    return red, green, blue
+
+
+def xyz_to_rgb_many(x, y, z, depth=24):
+    """Return lists of the samples of buffers of X, Y, and Z."""
+
+    return _inverse_many(x, y, z, depth, xyz_to_rgb)
+
+
+def lab_to_rgb_many(l, a, b, depth=24):
+    """Return lists of the samples of buffers of CIELAB L*, a*, and b*."""
+
+    return _inverse_many(l, a, b, depth, lab_to_rgb)
+
+
+def oklab_to_rgb_many(l, a, b, depth=24):
+    """Return lists of the samples of buffers of OKLab L, a, and b."""
+
+    return _inverse_many(l, a, b, depth, oklab_to_rgb)
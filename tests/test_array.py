@@ -0,0 +1,207 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+from colorsys import rgb_to_hsv
+
+from color import Color, ColorArray
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestColorArray(unittest.TestCase):
+    def setUp(self):
+        self.colors = [Color(245, 16, 42), Color(135, 179, 240), Color.RED,
+                       Color.DODGER_BLUE]
+        self.array = ColorArray(self.colors)
+
+    def test_indexing(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertEqual(list(self.array), self.colors)
+        self.assertIsInstance(self.array[0], Color)
+        self.assertEqual(self.array[-1], Color.DODGER_BLUE)
+
+    def test_slice_is_view(self):
+        view = self.array[1:3]
+        self.assertEqual(list(view), self.colors[1:3])
+        view[0] = Color.BLACK
+        self.assertEqual(self.array[1], Color.BLACK)
+
+    def test_slice_assignment(self):
+        self.array[0:2] = [(7, 8, 9), Color.WHITE]
+        self.array[::-3] = [Color.BLACK, (1, 2, 3)]
+        self.assertEqual(list(self.array), [Color(1, 2, 3), Color.WHITE,
+                                            Color.RED, Color.BLACK])
+        with self.assertRaises(ValueError):
+            self.array[0:2] = [(7, 8, 9)]
+        with self.assertRaises(ValueError):
+            self.array[0:1] = [(256, 0, 0)]
+        self.assertEqual(self.array[0], Color(1, 2, 3))
+
+    def test_depth(self):
+        array = ColorArray([(1023, 0, 512)], 30)
+        self.assertEqual(array[0], Color(1023, 0, 512, 30))
+        self.assertEqual(ColorArray([(1, 2, 3)]).depth, 24)
+        self.assertEqual(self.array.nbytes, 12)
+        self.assertEqual(array.nbytes, 6)
+        self.assertRaises(ValueError, ColorArray, [(256, 0, 0)])
+        self.assertRaises(ValueError, ColorArray, [Color(1, 2, 3, 36)], 24)
+
+    def test_bulk_conversions(self):
+        self.assertEqual(self.array.to_hex(),
+                         [color.hex for color in self.colors])
+        self.assertEqual(self.array.to_rgb(),
+                         [color.rgb for color in self.colors])
+        self.assertEqual(self.array.to_hsv(),
+                         [rgb_to_hsv(*color.rgb) for color in self.colors])
+        self.assertRaises(TypeError, ColorArray([(1, 2, 3)], 30).to_hex)
+
+    def test_to_hex_output(self):
+        for array in (self.array, ColorArray([(1, 2, 3), (4095, 0, 9)], 36)):
+            expected = ''.join(string + '\n' for string in array.to_hex())
+            stream = io.StringIO()
+            array.to_hex(stream)
+            self.assertEqual(stream.getvalue(), expected)
+            buffer = bytearray()
+            array.to_hex(buffer)
+            self.assertEqual(buffer.decode(), expected)
+            self.assertEqual(Color.to_hex_many(array), array.to_hex())
+
+    def test_equality(self):
+        self.assertEqual(self.array, ColorArray(self.colors))
+        self.assertNotEqual(self.array, self.array[1:])
+
+
+class TestFromBuffer(unittest.TestCase):
+    def test_interleaved(self):
+        pixels = bytearray([255, 0, 0, 30, 144, 255])
+        array = ColorArray.frombuffer(pixels)
+        self.assertEqual(list(array), [Color.RED, Color.DODGER_BLUE])
+        pixels[0] = 0
+        self.assertEqual(array[0], Color.BLACK)
+        array[1] = Color.WHITE
+        self.assertEqual(pixels[3:], b'\xff\xff\xff')
+
+        array = ColorArray.frombuffer(b'\xff\0\0\x80\0\0\xff\x80',
+                                      'RGBA8888')
+        self.assertEqual(list(array), [Color.RED, Color.BLUE])
+        self.assertRaises(ValueError, ColorArray.frombuffer, b'\0\0')
+        self.assertRaises(ValueError, ColorArray.frombuffer, b'', 'RGB332')
+
+    def test_rgb565(self):
+        pixels = bytearray(struct.pack('<3H', 0xf800, 0x07e0, 0x0400))
+        array = ColorArray.frombuffer(pixels, 'RGB565', 'little')
+        self.assertEqual(list(array), [Color.RED, Color.LIME,
+                                       Color(0, 130, 0)])
+        self.assertEqual(array.to_hex(), ['#ff0000', '#00ff00', '#008200'])
+        self.assertEqual(list(array[1:]), list(array)[1:])
+        self.assertEqual(array.nbytes, 6)
+        array[0] = Color.BLUE
+        self.assertEqual(struct.unpack('<H', pixels[:2]), (0x001f,))
+        array[1:] = [Color.RED, (0, 0, 255)]
+        self.assertEqual(struct.unpack('<3H', pixels), (0x001f, 0xf800,
+                                                        0x001f))
+        with self.assertRaises(ValueError):
+            array[0:1] = []
+
+    def test_packed_decoding(self):
+        pixels = array('H', range(0, 65536, 257))
+        packed = ColorArray.frombuffer(pixels, 'RGB565')
+        decoded = ColorArray(list(packed))
+        calls = []
+        decode = type(packed)._decode
+
+        def counting(self, channel):
+            calls.append(channel)
+            return decode(self, channel)
+
+        type(packed)._decode = counting
+        try:
+            for operation in ('to_hex', 'to_ints', 'to_rgb', 'to_hsv',
+                              'to_lab_buffers'):
+                del calls[:]
+                self.assertEqual(getattr(packed, operation)(),
+                                 getattr(decoded, operation)(), operation)
+                self.assertEqual(sorted(calls), [0, 1, 2], operation)
+            del calls[:]
+            self.assertEqual(packed.to_depth(30), decoded.to_depth(30))
+            self.assertEqual(list(packed), list(decoded))
+            self.assertEqual(sorted(calls), [0, 0, 1, 1, 2, 2])
+        finally:
+            type(packed)._decode = decode
+
+    def test_rgb101010(self):
+        pixels = struct.pack('>2I', 1023 << 20 | 512 << 10 | 1, 0)
+        array = ColorArray.frombuffer(pixels, 'RGB101010', 'big')
+        self.assertEqual(list(array), [Color(1023, 512, 1, 30),
+                                       Color(0, 0, 0, 30)])
+        self.assertEqual(array.to_rgb(), [(1023, 512, 1), (0, 0, 0)])
+
+    def test_rgb101010_padding(self):
+        pixels = bytearray(struct.pack('=2I', 0xc0000000, 0x40000000))
+        array = ColorArray.frombuffer(pixels, 'RGB101010')
+        self.assertEqual(list(array), [Color(0, 0, 0, 30)] * 2)
+        array[0] = Color(0, 0, 1, 30)
+        array[1:] = [Color(1023, 0, 0, 30)]
+        self.assertEqual(struct.unpack('=2I', pixels),
+                         (0xc0000001, 0x7ff00000))
+        self.assertEqual(list(array), [Color(0, 0, 1, 30),
+                                       Color(1023, 0, 0, 30)])
+
+    def test_from_file(self):
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(bytes([255, 0, 0, 30, 144, 255]))
+        try:
+            for mmap in (True, False):
+                array = ColorArray.from_file(file.name, mmap=mmap)
+                self.assertEqual(list(array), [Color.RED, Color.DODGER_BLUE])
+                del array
+        finally:
+            os.remove(file.name)
+
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            pass
+        try:
+            self.assertEqual(len(ColorArray.from_file(file.name)), 0)
+        finally:
+            os.remove(file.name)
+
+
+class TestPackedIntegers(unittest.TestCase):
+    def setUp(self):
+        self.colors = [Color.RED, Color.DODGER_BLUE, Color(1, 2, 3)]
+        self.ints = [color.to_int() for color in self.colors]
+
+    def test_from_ints(self):
+        expected = ColorArray(self.colors)
+        for ints in (array('I', self.ints), array('i', self.ints),
+                     array('Q', self.ints), self.ints, iter(self.ints)):
+            self.assertEqual(ColorArray.from_ints(ints), expected)
+        self.assertEqual(Color.from_ints(array('I', [0xff1e90ff]))[0],
+                         Color.DODGER_BLUE)
+        self.assertEqual(len(ColorArray.from_ints(array('I'))), 0)
+
+    def test_to_ints(self):
+        colors = ColorArray(self.colors)
+        self.assertEqual(colors.to_ints(), array('I', self.ints))
+        self.assertEqual(list(colors.to_ints(0xff)),
+                         [0xff << 24 | value for value in self.ints])
+        self.assertEqual(Color.to_ints(self.colors), colors.to_ints())
+        self.assertEqual(colors.to_ints().typecode,
+                         colors.to_ints(0xff).typecode)
+
+    def test_30_bit(self):
+        colors = ColorArray(self.colors).to_depth(30)
+        ints = colors.to_ints(3)
+        self.assertEqual(list(ints), [3 << 30 | color.to_int()
+                                      for color in colors])
+        self.assertEqual(ColorArray.from_ints(ints, 30), colors)
+        self.assertEqual(ColorArray.frombuffer(ints, 'RGB101010').to_ints(),
+                         colors.to_ints())
+
+
+if __name__ == '__main__':
+    unittest.main()
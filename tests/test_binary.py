@@ -0,0 +1,64 @@
+import io
+import random
+import unittest
+
+from color import Color, ColorArray, binary
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.arrays = [ColorArray([Color(*(random.randrange(1 << depth // 3)
+                                           for _ in range(3)), depth)
+                                   for _ in range(100)], depth)
+                       for depth in (3, 12, 24, 30, 48)]
+
+    def test_single(self):
+        data = binary.dumps(Color.DODGER_BLUE)
+        self.assertEqual(data, b'CLR\x01\x02\x00\x18\x1e\x90\xff')
+        self.assertIs(type(binary.loads(data)), Color)
+        self.assertEqual(binary.loads(data), Color.DODGER_BLUE)
+        self.assertEqual(binary.loads(binary.dumps(Color(1023, 0, 1, 30))),
+                         Color(1023, 0, 1, 30))
+
+    def test_collections(self):
+        for colors in self.arrays:
+            for rle in (False, True):
+                data = binary.dumps(colors, rle, block_size=30)
+                self.assertEqual(binary.loads(data), colors)
+                self.assertEqual(binary.loads(binary.dumps(iter(colors), rle,
+                                                           block_size=7)),
+                                 colors)
+        self.assertEqual(binary.loads(binary.dumps([])), ColorArray())
+        self.assertEqual(len(binary.dumps(self.arrays[2])), 7 + 4 + 300 + 4)
+
+    def test_rle(self):
+        colors = [Color.RED] * 70000 + [Color.BLUE] * 3
+        data = binary.dumps(colors, rle=True, block_size=100000)
+        self.assertEqual(len(data), 7 + 4 + 3 * 5 + 4)
+        self.assertEqual(list(binary.loads(data)), colors)
+
+    def test_streaming(self):
+        file = io.BytesIO()
+        binary.dump(self.arrays[3], file, block_size=40)
+        file.seek(0)
+        blocks = list(binary.iter_load(file))
+        self.assertEqual([len(block) for block in blocks], [40, 40, 20])
+        self.assertEqual([color for block in blocks for color in block],
+                         list(self.arrays[3]))
+
+    def test_errors(self):
+        data = binary.dumps(self.arrays[0])
+        self.assertRaises(ValueError, binary.loads, data[:-1])
+        self.assertRaises(ValueError, binary.loads, b'PNG' + data[3:])
+        self.assertRaises(ValueError, binary.loads, data[:3] + b'\x02' +
+                          data[4:])
+        self.assertRaises(ValueError, binary.dumps,
+                          [Color.RED, Color(0, 0, 0, 12)])
+
+
+if __name__ == '__main__':
+    unittest.main()
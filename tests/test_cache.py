@@ -0,0 +1,90 @@
+import threading
+import unittest
+
+from color import Color, cache
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestDerivedCache(unittest.TestCase):
+    def tearDown(self):
+        cache.disable()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(cache.info())
+        self.assertEqual(Color.RED.hex, '#ff0000')
+
+    def test_hits_and_misses(self):
+        cache.enable(maxsize=8)
+        color = Color(30, 144, 255)
+        self.assertEqual((color.hue, color.saturation, color.value),
+                         color.hsv)
+        self.assertEqual(color.hex, '#1e90ff')
+        self.assertEqual(color.hex, '#1e90ff')
+        self.assertEqual(cache.info(), cache.CacheInfo(4, 2, 8, 2))
+
+    def test_depth_is_part_of_the_key(self):
+        cache.enable()
+        self.assertEqual(Color(1, 2, 3).hex, '#010203')
+        self.assertEqual(Color(1, 2, 3, 48).hex, '#000100020003')
+
+    def test_sample_types(self):
+        cache.enable()
+        self.assertEqual(Color(1, 2, 3).hex, '#010203')
+        self.assertRaises(TypeError, lambda: Color(1.0, 2, 3).hex)
+        self.assertIs(type(Color(3, 2, 1).hsv[2]), int)
+        self.assertIs(type(Color(3.0, 2, 1).hsv[2]), float)
+        self.assertIs(type(Color(3, 2, 1, 24.0).hsv[2]), int)
+        self.assertEqual(cache.info(), cache.CacheInfo(0, 2, 4096, 2))
+
+    def test_eviction(self):
+        cache.enable(maxsize=2)
+        for red in range(3):
+            Color(red, 0, 0).hex
+        Color(2, 0, 0).hex
+        Color(0, 0, 0).hex
+        self.assertEqual(cache.info(), cache.CacheInfo(1, 4, 2, 2))
+        cache.enable(maxsize=2)
+        self.assertEqual(cache.info().currsize, 2)
+        cache.enable(maxsize=1)
+        self.assertEqual(cache.info(), cache.CacheInfo(0, 0, 1, 0))
+        self.assertRaises(ValueError, cache.enable, 0)
+        Color(0, 0, 0).hex
+        cache.clear()
+        self.assertEqual(cache.info(), cache.CacheInfo(0, 0, 1, 0))
+
+    def test_hex_parsing(self):
+        cache.enable(maxsize=8)
+        self.assertIs(Color('#87b3f0'), Color('#87b3f0'))
+        self.assertEqual(Color('#87b3f0').hex, '#87b3f0')
+        self.assertEqual(cache.info(), cache.CacheInfo(2, 2, 8, 2))
+        Color.set_hex_cache_size(0)
+        self.assertIsNone(cache.info())
+        Color.set_hex_cache_size(8)
+        self.assertEqual(Color.hex_cache_info(), cache.info())
+
+    def test_threads(self):
+        cache.enable(maxsize=4)
+        colors = [Color(red, 0, 0) for red in range(16)]
+        errors = []
+
+        def convert():
+            try:
+                for _ in range(200):
+                    for color in colors:
+                        self.assertEqual(color.hex, '#{:02x}0000'.format(
+                            color.red))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
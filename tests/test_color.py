@@ -1,5 +1,11 @@
+import copy
+import io
+import pickle
+import subprocess
+import sys
 import unittest
 
+import color
 from color import Color
 
 
@@ -11,6 +17,168 @@ class TestStuff(unittest.TestCase):
     def test(self):
         pass #Hhhehehe. This test passes, because I told it to.
 
+
+class TestCore(unittest.TestCase):
+    def setUp(self):
+        self.color = Color(15, 0, 10, 12)
+
+    def test_access(self):
+        self.assertEqual((self.color.red, self.color.green, self.color.blue,
+                          self.color.depth), (15, 0, 10, 12))
+        self.assertEqual((self.color[0], self.color[-1], self.color[1:]),
+                         (15, 10, (0, 10)))
+        self.assertEqual(self.color[::-1], (10, 0, 15))
+        self.assertRaises(IndexError, lambda: self.color[3])
+        self.assertRaises(TypeError, lambda: self.color['red'])
+
+        red, green, blue = self.color
+        self.assertEqual((red, green, blue), (15, 0, 10))
+        self.assertEqual(list(self.color), [15, 0, 10])
+
+    def test_construction(self):
+        self.assertEqual(Color(1, 2, 3), Color._make((1, 2, 3, 24)))
+        self.assertRaises(ValueError, Color, 256, 0, 0)
+        self.assertRaises(ValueError, Color, 0, -1, 0)
+        self.assertRaises(ValueError, Color, 0, 0, 16, 12)
+        self.assertIsInstance(Color._make((1, 2, 3, 24)), Color)
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            color = pickle.loads(pickle.dumps(self.color, protocol))
+            self.assertEqual(color, self.color)
+            self.assertIs(type(color), Color)
+        self.assertEqual(copy.copy(self.color), self.color)
+        self.assertEqual(copy.deepcopy(Color.RED), Color.RED)
+
+
+class TestNamedColors(unittest.TestCase):
+    def test_constants_are_interned(self):
+        self.assertEqual(Color.DODGER_BLUE, Color(30, 144, 255))
+        self.assertIs(Color.RED, Color.RED)
+        self.assertIs(Color.GRAY, Color.GREY)
+        self.assertIs(Color.AQUA, Color.CYAN)
+
+    def test_from_name(self):
+        self.assertIs(Color.from_name('dodger blue'), Color.DODGER_BLUE)
+        self.assertIs(Color.from_name('DODGER_BLUE'), Color.DODGER_BLUE)
+        self.assertIs(Color.from_name('dodgerblue'), Color.DODGER_BLUE)
+        self.assertIs(Color.from_name('grey'), Color.GRAY)
+        self.assertRaises(ValueError, Color.from_name, 'blurple')
+
+    def test_name(self):
+        self.assertEqual(Color(30, 144, 255).name, 'DODGER_BLUE')
+        self.assertEqual(Color.GREY.name, 'GRAY')
+        self.assertIsNone(Color(30, 144, 254).name)
+        self.assertIsNone(Color(0, 0, 0, 30).name)
+
+
+class TestHexParsing(unittest.TestCase):
+    def tearDown(self):
+        Color.set_hex_cache_size(0)
+
+    def test_depths(self):
+        self.assertEqual(Color('45fe0b'), Color(69, 254, 11, 24))
+        self.assertEqual(Color('#87b3f0'), Color(135, 179, 240, 24))
+        self.assertEqual(Color('#fff'), Color(15, 15, 15, 12))
+        self.assertEqual(Color('#fffaaa000'), Color(4095, 2730, 0, 36))
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, 'number of characters'):
+            Color('#ffff')
+        with self.assertRaisesRegex(ValueError, "base 16: 'zz'"):
+            Color('#zz0000')
+
+    def test_cache(self):
+        self.assertIsNone(Color.hex_cache_info())
+        Color.set_hex_cache_size(2)
+        self.assertIs(Color('#87b3f0'), Color('#87b3f0'))
+        self.assertEqual(Color.hex_cache_info().hits, 1)
+        self.assertEqual(Color('#fff'), Color(15, 15, 15, 12))
+
+    def test_parse_hex_many(self):
+        for strings in (['#87b3f0', '45fe0b', '#000000'], ['#fff', '0a0'],
+                        ['#fffaaa000', '#000111222'], ['#ffff0000aaaa']):
+            self.assertEqual(list(Color.parse_hex_many(strings)),
+                             [Color(string) for string in strings])
+        self.assertEqual(len(Color.parse_hex_many([])), 0)
+
+    def test_parse_hex_many_errors(self):
+        with self.assertRaisesRegex(ValueError, "base 16: 'zz'"):
+            Color.parse_hex_many(['#000000', '#zz0000'])
+        with self.assertRaisesRegex(ValueError, 'number of characters'):
+            Color.parse_hex_many(['#000000', '#0000'])
+        with self.assertRaisesRegex(ValueError, 'same number of digits'):
+            Color.parse_hex_many(['#000000', '#000'])
+        with self.assertRaisesRegex(ValueError, 'same number of digits'):
+            Color.parse_hex_many([' 12345', '#fff'])
+        self.assertRaises(ValueError, Color.parse_hex_many, ['00#000'])
+
+    def test_parse_hex_many_like_color(self):
+        strings = [' 12345', '#1e90ff', '12345 ', '+12345']
+        self.assertEqual(list(Color.parse_hex_many(strings)),
+                         [Color(string) for string in strings])
+
+
+class TestHexFormatting(unittest.TestCase):
+    def test_hex(self):
+        self.assertEqual(Color(30, 144, 255).hex, '#1e90ff')
+        self.assertEqual(Color(0, 1, 2).hex, '#000102')
+        self.assertEqual(Color(15, 0, 10, 12).hex, '#f0a')
+        self.assertEqual(Color(4095, 0, 10, 36).hex, '#fff00000a')
+        self.assertEqual(Color(65535, 0, 10, 48).hex, '#ffff0000000a')
+        self.assertRaises(TypeError, lambda: Color(0, 0, 0, 30).hex)
+
+    def test_to_hex_many(self):
+        colors = [Color.RED, Color(15, 0, 10, 12), Color.DODGER_BLUE]
+        self.assertEqual(Color.to_hex_many(colors), ['#ff0000', '#f0a',
+                                                     '#1e90ff'])
+        stream = io.StringIO()
+        Color.to_hex_many(colors, stream, ';')
+        self.assertEqual(stream.getvalue(), '#ff0000;#f0a;#1e90ff;')
+        buffer = bytearray()
+        Color.to_hex_many(iter(colors), buffer)
+        self.assertEqual(buffer, b'#ff0000\n#f0a\n#1e90ff\n')
+
+
+class TestPackedIntegers(unittest.TestCase):
+    def test_to_int(self):
+        self.assertEqual(Color.DODGER_BLUE.to_int(), 0x1e90ff)
+        self.assertEqual(Color.DODGER_BLUE.to_int(0xff), 0xff1e90ff)
+        self.assertEqual(Color(1023, 512, 1, 30).to_int(),
+                         1023 << 20 | 512 << 10 | 1)
+        self.assertEqual(Color(15, 0, 10, 12).to_int(), 0xf0a)
+        self.assertRaises(ValueError, Color(0, 0, 0, 16).to_int)
+
+    def test_from_int(self):
+        self.assertEqual(Color.from_int(0x1e90ff), Color.DODGER_BLUE)
+        self.assertEqual(Color.from_int(0x801e90ff), Color.DODGER_BLUE)
+        self.assertEqual(Color.from_int(3 << 30 | 1023 << 20 | 1, 30),
+                         Color(1023, 0, 1, 30))
+        self.assertRaises(ValueError, Color.from_int, 0, 0)
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_modules(self):
+        modules = subprocess.run([sys.executable, '-c', (
+            'import sys, color\n'
+            'print(*sorted(name for name in sys.modules '
+            'if name.partition(".")[0] in ("color", "re")))')],
+            capture_output=True, text=True, check=True).stdout.split()
+        self.assertEqual(modules, ['color', 'color.cache', 'color.depth',
+                                   'color.hsv', 'color.spaces'])
+
+    def test_lazy_attributes(self):
+        from color.array import ColorArray
+        from color.scanner import scan
+
+        self.assertIs(color.ColorArray, ColorArray)
+        self.assertIs(color.scan, scan)
+        for name in color.__all__:
+            self.assertIn(name, dir(color))
+            self.assertTrue(hasattr(color, name), name)
+        self.assertRaises(AttributeError, getattr, color, 'Colour')
+
+
 # I like to think of myself as that cool kid who just got elected class
 # press president in second grade. No documentation! No comments! And no tests!
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from color import Color, ColorArray
+from color.composite import MODES, blend, blend_many
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestBlend(unittest.TestCase):
+    def test_modes(self):
+        gray = Color(128, 128, 128)
+        self.assertEqual(blend(Color.RED, Color.BLUE), Color.BLUE)
+        self.assertEqual(blend(Color.RED, Color.BLUE, opacity=0.5),
+                         Color(128, 0, 128))
+        self.assertEqual(blend(Color.WHITE, gray, 'multiply'), gray)
+        self.assertEqual(blend(Color.BLACK, gray, 'screen'), gray)
+        self.assertEqual(blend(Color(64, 192, 0), Color.WHITE, 'overlay'),
+                         Color(128, 255, 0))
+        self.assertEqual(blend(gray, Color(0, 64, 255), 'linear_light'),
+                         Color(0, 1, 255))
+        self.assertRaises(ValueError, blend, gray, gray, 'dissolve')
+        self.assertRaises(ValueError, blend, gray, gray, opacity=1.5)
+
+    def test_linear(self):
+        self.assertEqual(blend(Color.RED, Color.BLUE, opacity=0.5,
+                               linear=True), Color(188, 0, 188))
+        self.assertEqual(blend(Color.BLACK, Color.WHITE, opacity=0.5,
+                               linear=True),
+                         Color.from_xyz(*(value / 2
+                                          for value in Color.WHITE.xyz)))
+
+    def test_depth(self):
+        self.assertEqual(blend(Color(1023, 0, 0, 30), Color.BLUE, 'screen'),
+                         Color(1023, 0, 1023, 30))
+        self.assertEqual(Color.RED.blend(Color(1023, 1023, 0, 30),
+                                         'multiply'), Color.RED)
+
+
+class TestBlendMany(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.backdrops = ColorArray([
+            Color(*(random.randrange(256) for _ in range(3)))
+            for _ in range(10000)])
+        self.sources = ColorArray([
+            Color(*(random.randrange(256) for _ in range(3)))
+            for _ in range(10000)])
+
+    def test_matches_blend(self):
+        for mode in MODES:
+            for linear in (False, True):
+                expected = [blend(backdrop, source, mode, 0.75, linear)
+                            for backdrop, source in zip(self.backdrops,
+                                                        self.sources)]
+                # The collections are large enough to use a table, and their
+                # slices are not.
+                self.assertEqual(list(blend_many(
+                    self.backdrops, self.sources, mode, 0.75, linear)),
+                    expected, mode)
+                self.assertEqual(list(blend_many(
+                    self.backdrops[:50], self.sources[:50], mode, 0.75,
+                    linear)), expected[:50], mode)
+
+    def test_broadcast_and_opacities(self):
+        result = blend_many([Color.RED, Color.WHITE], Color.BLUE, 'multiply',
+                            [0.5, 1])
+        self.assertEqual(list(result), [Color(128, 0, 0), Color.BLUE])
+        self.assertEqual(blend_many(ColorArray(depth=30), Color.RED),
+                         ColorArray(depth=30))
+        self.assertRaises(ValueError, blend_many, [Color.RED], [])
+        self.assertRaises(ValueError, blend_many, [Color.RED], Color.RED,
+                          opacity=[0.5, 0.5])
+        self.assertRaises(ValueError, blend_many, [Color.RED], Color.RED,
+                          opacity=[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from color import Color
+from color.css import parse
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestFromCSS(unittest.TestCase):
+    def test_hex_and_keywords(self):
+        self.assertEqual(Color.from_css('#1e90ff'), Color(30, 144, 255))
+        self.assertEqual(Color.from_css('#1E90FF80'), Color(30, 144, 255))
+        self.assertEqual(Color.from_css('#abc'), Color(170, 187, 204))
+        self.assertEqual(Color.from_css('#abcd'), Color(170, 187, 204))
+        self.assertIs(Color.from_css(' DodgerBlue '), Color.DODGER_BLUE)
+        self.assertIs(Color.from_css('grey'), Color.GRAY)
+        self.assertEqual(Color.from_css('rebeccapurple'), Color(102, 51, 153))
+        self.assertIs(Color.from_css('transparent'), Color.BLACK)
+
+    def test_rgb(self):
+        for text in ('rgb(30, 144, 255)', 'rgba(30,144,255,0.5)',
+                     'RGB(30 144 255)', 'rgb(30 144 255 / 50%)',
+                     'rgb(11.7647% 56.4706% 100%)', 'rgba(30 144 255)'):
+            self.assertEqual(Color.from_css(text), Color(30, 144, 255), text)
+        self.assertEqual(Color.from_css('rgb(300 -20 none)'), Color(255, 0, 0))
+
+    def test_hsl_and_hwb(self):
+        for text in ('hsl(120, 100%, 25%)', 'hsla(120deg 100% 25% / .5)',
+                     'hsl(0.3333333turn 100 25)', 'hwb(120 0% 49.8%)',
+                     'hsl(133.3333grad 100% 25%)', 'hsl(-240 100% 25%)'):
+            self.assertEqual(Color.from_css(text), Color(0, 128, 0), text)
+        self.assertEqual(Color.from_css('hwb(0 60% 60%)'),
+                         Color(128, 128, 128))
+
+    def test_lab_and_oklab(self):
+        # The examples of CSS Color Module Level 4.
+        self.assertEqual(Color.from_css('lab(54.29 80.82 69.88)'), Color.RED)
+        self.assertEqual(Color.from_css('lch(52.2345% 72.2 56.2)'),
+                         Color(198, 93, 6))
+        self.assertEqual(Color.from_css('oklch(62.8% 0.2577 29.23)'),
+                         Color.RED)
+        self.assertEqual(Color.from_css('oklab(100% 0 0)'), Color.WHITE)
+        self.assertEqual(Color.from_css('oklab(0.5 40% -40%)'),
+                         Color.from_oklab(0.5, 0.16, -0.16))
+
+    def test_invalid(self):
+        for text in ('', '#ab', '#abcde', 'currentcolor', 'rgb(1, 2)',
+                     'rgb(1 2 3 4)', 'rgb(1, 2 3)', 'rgb(1deg 2 3)',
+                     'rgb(1 2 3 / 4deg)', 'hsl(1% 2% 3%)', 'rgb(1 2 3',
+                     'color(srgb 1 0 0)'):
+            self.assertRaises(ValueError, Color.from_css, text)
+
+    def test_cache(self):
+        parse.cache_clear()
+        self.assertIs(Color.from_css('#123456'), Color.from_css('#123456'))
+        self.assertEqual(parse.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
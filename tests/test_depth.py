@@ -0,0 +1,42 @@
+import unittest
+from fractions import Fraction
+
+from color import Color, ColorArray
+from color.depth import rescale, rescale_many, rescale_table
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestDepth(unittest.TestCase):
+    def test_rounding(self):
+        for source, target in ((30, 24), (24, 30), (12, 24), (48, 24)):
+            high = 2 ** (source // 3) - 1
+            target_high = 2 ** (target // 3) - 1
+            for value in range(0, high + 1, max(1, high // 500)):
+                exact = Fraction(value * target_high, high)
+                self.assertEqual(rescale(value, source, target),
+                                 int(exact + Fraction(1, 2)))
+
+    def test_color(self):
+        self.assertEqual(Color(1023, 512, 0, 30).to_depth(24),
+                         Color(255, 128, 0))
+        self.assertEqual(Color(15, 8, 0, 12).to_depth(24), Color(255, 136, 0))
+        self.assertEqual(Color.RED.to_depth(24), Color.RED)
+        self.assertRaises(ValueError, Color.RED.to_depth, 16)
+        self.assertRaises(ValueError, Color.RED.to_depth, 0)
+
+    def test_batch(self):
+        colors = [Color(value, 1023 - value, value // 2, 30)
+                  for value in range(1024)]
+        array = ColorArray(colors)
+        self.assertEqual(list(array.to_depth(24)),
+                         [color.to_depth(24) for color in colors])
+        self.assertIs(rescale_table(30, 24), rescale_table(30, 24))
+        self.assertIsNone(rescale_table(60, 24))
+        self.assertEqual(list(rescale_many([0, 2 ** 20 - 1], 60, 24)),
+                         [0, 255])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from color import Color, ColorArray, pairwise_delta_e
+from color.difference import (cie76, cie94, ciede2000, delta_e,
+                              iter_pairwise_delta_e)
+
+
+__author__ = 'Tyler Crompton'
+
+
+# Pairs from Sharma, Wu, and Dalal, "The CIEDE2000 Color-Difference Formula:
+# Implementation Notes, Supplementary Test Data, and Mathematical
+# Observations" (2005).
+SHARMA = (
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0011), 7.2195),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((50.0, 2.5, 0.0), (61.0, -5.0, 29.0), 22.8977),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+)
+
+
+class TestDeltaE(unittest.TestCase):
+    def test_ciede2000(self):
+        for lab1, lab2, expected in SHARMA:
+            self.assertAlmostEqual(ciede2000(lab1, lab2), expected, 4)
+            self.assertAlmostEqual(ciede2000(lab2, lab1), expected, 4)
+
+    def test_cie76_and_cie94(self):
+        self.assertEqual(cie76((50, 0, 0), (53, 4, 0)), 5.0)
+        self.assertAlmostEqual(cie94((50, 2.6772, -79.7751),
+                                     (50, 0, -82.7485)), 1.3950, 4)
+        self.assertEqual(cie94((50, 0, 0), (50, 0, 0)), 0.0)
+
+    def test_color(self):
+        self.assertEqual(Color.RED.delta_e(Color.RED), 0.0)
+        self.assertAlmostEqual(Color.RED.delta_e(Color.BLUE, 'cie76'),
+                               cie76(Color.RED.lab, Color.BLUE.lab))
+        self.assertEqual(delta_e(Color.RED, Color.BLUE),
+                         ciede2000(Color.RED.lab, Color.BLUE.lab))
+        self.assertRaises(ValueError, Color.RED.delta_e, Color.RED, 'cmc')
+
+    def test_pairwise(self):
+        colors1 = [Color.RED, Color.DODGER_BLUE, Color.PAPAYA_WHIP]
+        colors2 = ColorArray([Color.BLACK, Color.RED])
+        for method in ('cie76', 'cie94', 'ciede2000'):
+            matrix = pairwise_delta_e(colors1, colors2, method)
+            self.assertEqual(len(matrix), 3)
+            for color1, row in zip(colors1, matrix):
+                self.assertEqual(list(row), [color1.delta_e(color2, method)
+                                             for color2 in colors2])
+
+        blocks = list(iter_pairwise_delta_e(colors1, colors2, block_size=2))
+        self.assertEqual([len(block) for block in blocks], [2, 1])
+        self.assertEqual(list(pairwise_delta_e([(0, 0, 0)], [(1, 0, 0)])[0]),
+                         [Color(0, 0, 0).delta_e(Color(1, 0, 0))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import types
+import unittest
+
+from color import Color, ColorArray
+from color.dither import METHODS, bayer_matrix, dither, dither_rows
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestBayerMatrix(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(bayer_matrix(1), [[0.5]])
+        self.assertEqual(bayer_matrix(2), [[0.125, 0.625], [0.875, 0.375]])
+        matrix = bayer_matrix(8)
+        self.assertEqual(sorted(value * 64 - 0.5 for row in matrix
+                                for value in row), list(range(64)))
+
+    def test_errors(self):
+        for size in (0, 3, 6, -4):
+            self.assertRaises(ValueError, bayer_matrix, size)
+
+
+class TestDither(unittest.TestCase):
+    def setUp(self):
+        # A flat 30-bit gray that lies halfway between two 12-bit levels.
+        self.gray = Color(580, 580, 580, 30)
+        self.image = ColorArray([self.gray] * 32 * 32)
+
+    def test_mean(self):
+        for method in METHODS:
+            result = dither(self.image, 32, 12, method)
+            self.assertEqual(result.depth, 12)
+            self.assertEqual(set(result.red), {8, 9}, method)
+            self.assertAlmostEqual(sum(result.red) / len(result), 8.5,
+                                   delta=0.05, msg=method)
+
+    def test_rows(self):
+        for method in METHODS:
+            rows = dither_rows((self.image[start:start + 32]
+                                for start in range(0, 32 * 32, 32)), 12,
+                               method)
+            self.assertIsInstance(rows, types.GeneratorType)
+            rows = list(rows)
+            self.assertEqual(len(rows), 32)
+            self.assertEqual(sum(map(list, rows), []),
+                             list(dither(self.image, 32, 12, method)))
+
+    def test_iterables(self):
+        rows = [[Color.GRAY, Color.WHITE], [Color.BLACK, Color.RED]]
+        self.assertEqual([list(row) for row in dither_rows(rows, 24)],
+                         [[Color.GRAY, Color.WHITE],
+                          [Color.BLACK, Color.RED]])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, list, dither_rows([], 12, 'random'))
+        self.assertRaises(ValueError, list, dither_rows([], 12, 'bayer', 3))
+        self.assertRaises(ValueError, list, dither_rows(
+            [[Color.RED], [Color.RED, Color.BLUE]], 12))
+        self.assertRaises(ValueError, list, dither_rows(
+            [[Color.RED], [Color(0, 0, 0, 30)]], 12))
+        self.assertRaises(ValueError, dither, self.image, 33, 12)
+        self.assertRaises(ValueError, dither, self.image, 0, 12)
+        self.assertRaises(ValueError, dither, self.image, 32, 13)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import types
+import unittest
+
+from color import Color, ColorArray, gradient, gradient_array
+from color.gradients import SPACES
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestGradient(unittest.TestCase):
+    def test_rgb(self):
+        stops = gradient(Color.BLACK, Color.WHITE, 5)
+        self.assertIsInstance(stops, types.GeneratorType)
+        self.assertEqual(list(stops), [Color(0, 0, 0), Color(64, 64, 64),
+                                       Color(128, 128, 128),
+                                       Color(191, 191, 191),
+                                       Color(255, 255, 255)])
+        self.assertEqual(list(gradient(Color.RED, Color.BLUE, 1)),
+                         [Color.RED])
+
+    def test_spaces(self):
+        for space in SPACES:
+            stops = list(gradient(Color.RED, Color.BLUE, 9, space))
+            self.assertEqual((stops[0], stops[-1]), (Color.RED, Color.BLUE),
+                             space)
+        self.assertEqual(list(gradient(Color.RED, Color.BLUE, 3, 'hsv'))[1],
+                         Color.MAGENTA)
+        self.assertEqual(list(gradient(Color.GRAY, Color.RED, 3, 'hsv'))[1],
+                         Color(192, 96, 96))
+        self.assertRaises(ValueError, list, gradient(Color.RED, Color.BLUE,
+                                                     3, 'cmyk'))
+        self.assertRaises(ValueError, list, gradient(Color.RED, Color.BLUE,
+                                                     0))
+
+    def test_depth(self):
+        stops = list(gradient(Color(0, 0, 0, 30), Color.WHITE, 3))
+        self.assertEqual(stops, [Color(0, 0, 0, 30), Color(512, 512, 512, 30),
+                                 Color(1023, 1023, 1023, 30)])
+
+    def test_gradient_array(self):
+        for space in SPACES:
+            for start, stop, n in ((Color.RED, Color.BLUE, 50),
+                                   (Color.GRAY, Color.DODGER_BLUE, 7),
+                                   (Color(0, 100, 1023, 30), Color.LIME, 20),
+                                   (Color.RED, Color.RED, 1)):
+                stops = gradient_array(start, stop, n, space)
+                self.assertIsInstance(stops, ColorArray)
+                self.assertEqual(list(stops),
+                                 list(gradient(start, stop, n, space)), space)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import colorsys
+import itertools
+import unittest
+
+from color import Color, ColorArray
+from color.hsv import hsv_to_rgb_many, rgb_to_hsv_many
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestHSV(unittest.TestCase):
+    def setUp(self):
+        samples = range(0, 256, 15)
+        self.rgb = list(itertools.product(samples, samples, samples))
+
+    def test_agrees_with_colorsys(self):
+        hues, saturations, values = rgb_to_hsv_many(*zip(*self.rgb))
+        for rgb, hsv in zip(self.rgb, zip(hues, saturations, values)):
+            self.assertEqual(hsv, colorsys.rgb_to_hsv(*rgb))
+
+        hsv = [colorsys.rgb_to_hsv(*rgb) for rgb in self.rgb]
+        for triplet, rgb in zip(hsv, zip(*hsv_to_rgb_many(*zip(*hsv)))):
+            self.assertEqual(
+                rgb, tuple(map(round, colorsys.hsv_to_rgb(*triplet))))
+
+    def test_color_api(self):
+        colors = [Color(*rgb) for rgb in self.rgb]
+        hsv = Color.hsv_many(colors)
+        self.assertEqual(hsv, [color.hsv for color in colors])
+        self.assertEqual(Color.from_hsv_many(hsv), colors)
+        self.assertEqual(Color.hsv_many([]), [])
+
+    def test_color_array_api(self):
+        array = ColorArray(self.rgb)
+        self.assertEqual(array.to_hsv(), Color.hsv_many(self.rgb))
+        self.assertEqual(ColorArray.from_hsv(*array.to_hsv_buffers()), array)
+        self.assertEqual(Color.from_hsv_many([(0.5, 1.0, 1023)], 30),
+                         [Color(0, 1023, 1023, 30)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import color
+import color.array
+from color import Color, cache, instrument
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestInstrument(unittest.TestCase):
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+        cache.disable()
+
+    def test_calls(self):
+        with instrument.recording():
+            Color(30, 144, 255)
+            Color(30, 144, 255, 24)
+            Color((30, 144, 255))
+            Color((30, 144, 255), 24)
+            Color('#1e90ff').hex
+            Color('1e90ff').hsv
+            Color.RED.hue
+            Color.RED.saturation
+            Color.GREY.value
+            self.assertRaises(ValueError, Color, 256, 0, 0)
+            color.ColorArray([(1, 2, 3)])
+        stats = instrument.snapshot()
+        self.assertEqual({name: timing.count
+                          for name, timing in stats.calls.items()}, {
+            'Color.__new__[rgb]': 2,
+            'Color.__new__[rgb, depth]': 1,
+            'Color.__new__[sequence]': 1,
+            'Color.__new__[sequence, depth]': 1,
+            'Color.__new__[hex]': 2,
+            'Color.hex': 1,
+            'Color.hsv': 4,
+            'Color.hue': 1,
+            'Color.saturation': 1,
+            'Color.value': 1,
+            '_validate_sample': 7,
+        })
+        self.assertEqual(stats.constants, {'RED': 2, 'GREY': 1})
+        for timing in stats.calls.values():
+            self.assertGreater(timing.seconds, 0)
+            self.assertGreater(timing.mean, 0)
+
+    def test_caches(self):
+        cache.enable()
+        Color('#abcdef').hsv
+        with instrument.recording():
+            for _ in range(3):
+                Color('#abcdef').hsv
+            Color('#123456')
+        caches = instrument.snapshot().caches
+        self.assertEqual(caches['cache'], (6, 1))
+        self.assertEqual(caches['cache'].hit_rate, 6 / 7)
+        self.assertEqual(instrument.CacheStats(0, 0).hit_rate, 0.0)
+
+    def test_disabled(self):
+        originals = dict(Color.__dict__)
+        validate = color._validate_sample
+        instrument.enable()
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertIsNot(Color.__dict__['__new__'], originals['__new__'])
+        instrument.disable()
+        instrument.disable()
+        self.assertFalse(instrument.is_enabled())
+        self.assertEqual(dict(Color.__dict__), originals)
+        for name, value in originals.items():
+            self.assertIs(Color.__dict__[name], value, name)
+        self.assertIs(color._validate_sample, validate)
+        self.assertIs(color.array._validate_sample, validate)
+
+        instrument.reset()
+        Color(1, 2, 3).hsv
+        Color.RED
+        self.assertEqual(instrument.snapshot(), ({}, {}, {'css': (0, 0)}))
+
+    def test_recording(self):
+        with instrument.recording():
+            Color(1, 2, 3)
+        with instrument.recording(reset_stats=False):
+            Color(1, 2, 3)
+        self.assertFalse(instrument.is_enabled())
+        self.assertEqual(
+            instrument.snapshot().calls['Color.__new__[rgb]'].count, 2)
+
+        instrument.enable()
+        with instrument.recording():
+            pass
+        self.assertTrue(instrument.is_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import io
+import random
+import unittest
+
+from color import Color, ColorArray
+from color.lut import INTERPOLATIONS, LUT, dump, dumps, load, loads
+from color.pipeline import recolor
+
+
+__author__ = 'Tyler Crompton'
+
+
+CUBE = '''# A LUT that swaps red and blue.
+TITLE "Swap"
+
+LUT_3D_SIZE 2
+0 0 0
+0 0 1
+0 1 0
+0 1 1
+1 0 0
+1 0 1
+1 1 0
+1 1 1
+'''
+
+
+def invert(color):
+    return Color(*(255 - sample for sample in color.to_depth(24)))
+
+
+def darken(color):
+    return Color(*(sample * sample // 65535 for sample in color), 48)
+
+
+class TestLUT(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.colors = ColorArray([tuple(random.randrange(256)
+                                        for _ in range(3))
+                                  for _ in range(500)])
+
+    def test_identity(self):
+        for interpolation in INTERPOLATIONS:
+            lut = LUT.bake(lambda color: color, 5, interpolation, 48)
+            self.assertEqual(lut.apply(self.colors), self.colors)
+            self.assertEqual(lut.lookup(Color(1, 512, 1023, 30)),
+                             Color(1, 512, 1023, 30))
+
+    def test_linear(self):
+        for interpolation in INTERPOLATIONS:
+            lut = LUT.bake(invert, 3, interpolation)
+            self.assertEqual(list(lut.apply(self.colors)),
+                             list(map(invert, self.colors)))
+
+    def test_interpolations(self):
+        trilinear = LUT.bake(darken, 9, depth=48)
+        tetrahedral = LUT.bake(darken, 9, 'tetrahedral', 48)
+        for color in self.colors:
+            expected = darken(color.to_depth(48)).to_depth(24)
+            for lut in (trilinear, tetrahedral):
+                for actual, sample in zip(lut.lookup(color), expected):
+                    self.assertLessEqual(abs(actual - sample), 2)
+        gray = Color(100, 100, 100)
+        self.assertEqual(len(set(tetrahedral.lookup(gray))), 1)
+
+    def test_depth(self):
+        def normalize(color):
+            value = color.value or 1
+            return Color(*(sample * 255 // value for sample in color))
+
+        lut = LUT.bake(lambda color: Color(255 - color.red, 255 - color.green,
+                                           255 - color.blue), 5)
+        self.assertEqual(lut.lookup(Color.DODGER_BLUE), Color(225, 111, 0))
+        lut = LUT.bake(normalize, 18)
+        self.assertEqual(lut.lookup(Color(105, 45, 0)), Color(255, 109, 0))
+        lut = LUT.bake(lambda color: color.to_depth(12), 2, depth=12)
+        self.assertEqual(lut.lookup(Color(17, 34, 51)), Color(17, 34, 51))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, LUT, 1, [0.0], [0.0], [0.0])
+        self.assertRaises(ValueError, LUT, 2, [0.0] * 8, [0.0] * 8,
+                          [0.0] * 7)
+        self.assertRaises(ValueError, LUT, 2, [0.0] * 8, [0.0] * 8,
+                          [0.0] * 8, interpolation='cubic')
+        self.assertRaises(ValueError, LUT, 2, [0.0] * 8, [0.0] * 8,
+                          [0.0] * 8, domain_min=(1, 0, 0))
+        self.assertRaises(ValueError, LUT.bake, invert, 1)
+
+
+class TestCube(unittest.TestCase):
+    def test_load(self):
+        lut = load(io.StringIO(CUBE))
+        self.assertEqual((lut.size, lut.title), (2, 'Swap'))
+        self.assertEqual(lut.lookup(Color(10, 20, 30)), Color(30, 20, 10))
+
+    def test_domain(self):
+        lut = loads('DOMAIN_MIN 0 0 0\nDOMAIN_MAX 0.5 1 1\n' + CUBE)
+        self.assertEqual(lut.lookup(Color(64, 20, 30)), Color(30, 20, 128))
+        self.assertEqual(lut.lookup(Color(200, 20, 30)), Color(30, 20, 255))
+        lut = loads('LUT_3D_INPUT_RANGE 0 2\n' + CUBE)
+        self.assertEqual(lut.domain_max, (2.0, 2.0, 2.0))
+
+    def test_dump(self):
+        lut = LUT.bake(darken, 4, 'tetrahedral')
+        lut.title = 'Darken'
+        lut.domain_max = (1.0, 1.0, 2.0)
+        text = dumps(lut)
+        self.assertTrue(text.startswith('TITLE "Darken"\nLUT_3D_SIZE 4\n'))
+        copy = loads(text)
+        self.assertEqual((copy.size, copy.title, copy.domain_max),
+                         (4, 'Darken', (1.0, 1.0, 2.0)))
+        for table, expected in ((copy.red, lut.red), (copy.green, lut.green),
+                                (copy.blue, lut.blue)):
+            for value, other in zip(table, expected):
+                self.assertAlmostEqual(value, other, 6)
+        file = io.StringIO()
+        dump(copy, file)
+        self.assertEqual(file.getvalue(), text)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, loads, '0 0 0\n')
+        self.assertRaises(ValueError, loads, 'LUT_1D_SIZE 2\n0 0 0\n1 1 1\n')
+        self.assertRaises(ValueError, loads, CUBE + '0 0\n')
+        self.assertRaises(ValueError, loads, CUBE + '0 0 x\n')
+        self.assertRaises(ValueError, loads, CUBE + '0 0 0\n')
+        self.assertRaises(ValueError, loads, 'LUT_4D_SIZE 2\n' + CUBE)
+
+
+class TestPipeline(unittest.TestCase):
+    def test_recolor(self):
+        lut = LUT.bake(darken, 9, 'tetrahedral')
+        random.seed(0)
+        pixels = bytearray(random.randbytes(3 * 1000))
+        expected = lut.apply(ColorArray.frombuffer(bytes(pixels)))
+        recolor(pixels, lut, tile_size=300, processes=2)
+        self.assertEqual(ColorArray.frombuffer(pixels), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
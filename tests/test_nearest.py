@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from color import Color, ColorArray
+from color.depth import rescale
+from color.nearest import METRICS, _rgb24
+
+
+__author__ = 'Tyler Crompton'
+
+
+def _distance(a, b, metric):
+    metric = METRICS[metric]
+
+    return metric.distance(metric.transform(a.rgb), metric.transform(b.rgb))
+
+
+def _brute_force(color, metric):
+    named = [name for name in dir(Color) if name.isupper()]
+
+    return min(_distance(color, getattr(Color, name), metric)
+               for name in named)
+
+
+class TestNearestName(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.colors = [Color(random.randrange(256), random.randrange(256),
+                             random.randrange(256)) for _ in range(300)]
+
+    def test_exact_matches(self):
+        self.assertEqual(Color(30, 144, 255).nearest_name(), 'DODGER_BLUE')
+        self.assertEqual(Color(31, 144, 254).nearest_name(), 'DODGER_BLUE')
+        self.assertEqual(Color(1023, 0, 0, 30).nearest_name(), 'RED')
+
+    def test_agrees_with_brute_force(self):
+        for metric in METRICS:
+            names = Color.nearest_names(self.colors, metric)
+            for color, name in zip(self.colors, names):
+                self.assertEqual(
+                    _distance(color, getattr(Color, name), metric),
+                    _brute_force(color, metric))
+                self.assertEqual(color.nearest_name(metric), name)
+
+    def test_rescaling(self):
+        for depth in (3, 12, 30, 48):
+            for value in (0, 1, 2 ** (depth // 3) // 2, 2 ** (depth // 3) - 1):
+                expected = (rescale(value, depth, 24),) * 3
+                self.assertEqual(_rgb24(Color(value, value, value, depth)),
+                                 expected)
+        # This sample is just below the midpoint of 1 and 2 at 24 bits, which
+        # floating-point scaling rounds up.
+        value = 0x0101010101010101 + 0x0101010101010101 // 2
+        self.assertEqual(_rgb24(Color(value, 0, 0, 192)), (1, 0, 0))
+        self.assertEqual(Color(40, 0, 0, 16).nearest_name(), 'RED')
+
+    def test_bulk(self):
+        array = ColorArray(self.colors + self.colors)
+        self.assertEqual(Color.nearest_names(array),
+                         Color.nearest_names(self.colors) * 2)
+        self.assertRaises(ValueError, Color.BLACK.nearest_name, 'manhattan')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+from multiprocessing.shared_memory import SharedMemory
+
+from color import Color
+from color.pipeline import DepthReduction, HSVShift, PaletteMap, recolor
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestTransforms(unittest.TestCase):
+    def test_hsv_shift(self):
+        red, green, blue = HSVShift(hue=0.5, value=0.5)(b'\xff\x80',
+                                                        b'\x00\x80',
+                                                        b'\x00\x80')
+        self.assertEqual((red, green, blue), (b'\x00\x40', b'\x80\x40',
+                                              b'\x80\x40'))
+        self.assertRaises(ValueError, HSVShift, saturation=-1)
+        self.assertRaises(ValueError, HSVShift, value=-0.5)
+        self.assertEqual(HSVShift(saturation=0, value=0)(b'\xff', b'\x80',
+                                                         b'\x00'),
+                         (b'\x00', b'\x00', b'\x00'))
+
+    def test_palette_map(self):
+        transform = PaletteMap([Color.BLACK, Color.WHITE, (255, 0, 0)])
+        self.assertEqual(transform(b'\x10\xf0\xc0', b'\x20\xf0\x10',
+                                   b'\x00\xe0\x30'),
+                         (b'\x00\xff\xff', b'\x00\xff\x00', b'\x00\xff\x00'))
+        self.assertRaises(ValueError, PaletteMap, [])
+
+    def test_depth_reduction(self):
+        self.assertEqual(DepthReduction(3)(b'\x00\x7f\x80', b'\xff', b''),
+                         (b'\x00\x00\xff', b'\xff', b''))
+
+
+class TestRecolor(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.pixels = bytes(random.randrange(256) for _ in range(3 * 5000))
+
+    def test_processes(self):
+        for transform in (HSVShift(0.25, 0.5), PaletteMap([Color.RED]),
+                          DepthReduction(12)):
+            expected = bytearray(self.pixels)
+            recolor(expected, transform, processes=1)
+            self.assertNotEqual(expected, self.pixels)
+            pixels = bytearray(self.pixels)
+            statuses = []
+            status = recolor(pixels, transform, tile_size=1200, processes=2,
+                             progress=statuses.append)
+            self.assertEqual(pixels, expected)
+            self.assertEqual(status[:3], (5000, 5000, 5))
+            self.assertEqual([status.tiles for status in statuses],
+                             [1, 2, 3, 4, 5])
+            self.assertGreater(status.pixels_per_second, 0)
+
+    def test_shared_memory_and_alpha(self):
+        shared = SharedMemory(create=True, size=4 * 1000)
+        try:
+            shared.buf[:] = bytes([10, 20, 30, 40]) * 1000
+            recolor(shared, DepthReduction(6), 'RGBA8888', tile_size=300,
+                    processes=2)
+            self.assertEqual(bytes(shared.buf), bytes([0, 0, 0, 40]) * 1000)
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_errors(self):
+        transform = DepthReduction(12)
+        self.assertRaises(TypeError, recolor, self.pixels, transform)
+        self.assertRaises(ValueError, recolor, bytearray(4), transform)
+        self.assertRaises(ValueError, recolor, bytearray(3), transform, 'BGR')
+        self.assertRaises(ValueError, recolor, bytearray(3), transform,
+                          tile_size=0)
+        self.assertEqual(recolor(bytearray(), transform).pixels, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from array import array
+from time import perf_counter
+
+from color import Color, extract_palette
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestExtractPalette(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.centers = [(200, 30, 30), (20, 200, 40), (30, 30, 220)]
+        self.weights = [5, 3, 1]
+        pixels = []
+        for center, weight in zip(self.centers, self.weights):
+            for _ in range(weight * 200):
+                pixels.extend(sample + random.randint(-4, 4)
+                              for sample in center)
+        self.pixels = bytes(pixels)
+
+    def test_median_cut(self):
+        pixels = bytes((200, 30, 30) * 5 + (20, 200, 40) * 4)
+        self.assertEqual(extract_palette(pixels, 2),
+                         [Color(200, 30, 30), Color(20, 200, 40)])
+
+    def test_methods(self):
+        for method in ('octree', 'kmeans'):
+            palette = extract_palette(self.pixels, 3, method)
+            self.assertEqual(len(palette), 3, method)
+            for color, center in zip(palette, self.centers):
+                self.assertIsInstance(color, Color)
+                self.assertLessEqual(max(abs(a - b) for a, b in zip(
+                    color.rgb, center)), 4, method)
+
+    def test_buffer_layouts(self):
+        rgba = bytearray()
+        for index in range(0, len(self.pixels), 3):
+            rgba += self.pixels[index:index + 3] + b'\xff'
+        self.assertEqual(extract_palette(rgba, 3, layout='RGBA'),
+                         extract_palette(self.pixels, 3))
+        self.assertEqual(extract_palette(array('B', self.pixels), 3),
+                         extract_palette(memoryview(self.pixels), 3))
+        self.assertEqual(extract_palette(b'', 3), [])
+        self.assertRaises(ValueError, extract_palette, b'\0\0', 3)
+        self.assertRaises(ValueError, extract_palette, b'', 3, 'popularity')
+
+    def test_sampling_and_budget(self):
+        self.assertEqual(len(extract_palette(self.pixels, 3, sample=100)), 3)
+        self.assertEqual(
+            extract_palette(self.pixels, 3, 'kmeans', time_budget=0),
+            extract_palette(self.pixels, 1))
+        self.assertEqual(len(extract_palette(self.pixels, 2000, 'octree')),
+                         len(set(zip(*[iter(self.pixels)] * 3))))
+        self.assertEqual(len(extract_palette(self.pixels, 2000, 'octree',
+                                             time_budget=0)), 256)
+        self.assertLessEqual(
+            len(extract_palette(self.pixels, 3, 'octree', time_budget=0)), 3)
+
+    def test_time_budget(self):
+        # Without a budget, the octree and k-means take several times as long
+        # as the budget on these pixels.
+        pixels = random.getrandbits(8 * 3 * 65536).to_bytes(3 * 65536, 'big')
+        for method in ('median_cut', 'octree', 'kmeans'):
+            start = perf_counter()
+            palette = extract_palette(pixels, 8, method, time_budget=0.1)
+            self.assertLess(perf_counter() - start, 0.2, method)
+            self.assertTrue(palette, method)
+            self.assertLessEqual(len(palette), 8, method)
+
+
+if __name__ == '__main__':
+    unittest.main()
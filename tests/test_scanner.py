@@ -0,0 +1,58 @@
+import io
+import re
+import unittest
+
+from color import Color, scan
+
+
+__author__ = 'Tyler Crompton'
+
+
+class ShortReader(io.StringIO):
+    """A stream that returns at most five characters per read."""
+
+    def read(self, size=-1):
+        return super().read(5)
+
+
+class TestScan(unittest.TestCase):
+    def setUp(self):
+        self.text = ('body { color: #1e90ff; background: #FFF; }\n'
+                     '#add, &#123; #abcd #1234567 #000000000fff-x\n'
+                     'a{border-color:#000000000fff}') * 20
+
+    def expected(self):
+        return [(match.start(), Color(match.group())) for match in
+                re.finditer(r'#(?:1e90ff|FFF|add|000000000fff)(?![\w-])',
+                            self.text)]
+
+    def test_literals(self):
+        found = list(scan(io.StringIO(self.text)))
+        self.assertEqual(found, self.expected())
+        self.assertEqual(found[:3], [(14, Color(30, 144, 255)),
+                                     (35, Color('#FFF')),
+                                     (43, Color('#add'))])
+        self.assertEqual(list(scan(io.StringIO(''))), [])
+
+    def test_chunk_boundaries(self):
+        expected = self.expected()
+        for chunk_size in (15, 16, 17, 29, 64):
+            self.assertEqual(list(scan(io.StringIO(self.text), chunk_size)),
+                             expected, chunk_size)
+        self.assertRaises(ValueError, list, scan(io.StringIO(''), 14))
+
+    def test_short_reads(self):
+        text = 'aaaa #ff0000 bbbbbbbbbbbb #00ff00 cc #0000ff end'
+        self.assertEqual(list(scan(ShortReader(text))),
+                         list(scan(io.StringIO(text))))
+        self.assertEqual(len(list(scan(ShortReader(text)))), 3)
+        self.assertEqual(list(scan(ShortReader(self.text), 20)),
+                         self.expected())
+
+    def test_binary(self):
+        data = self.text.encode('ascii')
+        self.assertEqual(list(scan(io.BytesIO(data), 20)), self.expected())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import itertools
+import unittest
+
+from color import Color, ColorArray
+from color.spaces import linear_table
+
+
+__author__ = 'Tyler Crompton'
+
+
+class TestSpaces(unittest.TestCase):
+    def setUp(self):
+        samples = range(0, 256, 17)
+        self.colors = [Color(*rgb) for rgb in
+                       itertools.product(samples, samples, samples)]
+
+    def assertSequenceAlmostEqual(self, first, second, places=4):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places)
+
+    def test_reference_values(self):
+        self.assertSequenceAlmostEqual(Color.WHITE.xyz, (0.95047, 1.0, 1.08883))
+        self.assertSequenceAlmostEqual(Color.WHITE.lab, (100, 0, 0))
+        self.assertSequenceAlmostEqual(Color.RED.lab,
+                                       (53.2408, 80.0925, 67.2032))
+        self.assertSequenceAlmostEqual(Color.WHITE.oklab, (1, 0, 0))
+        self.assertSequenceAlmostEqual(Color.RED.oklab,
+                                       (0.62796, 0.22486, 0.12585))
+        self.assertSequenceAlmostEqual(Color(1023, 0, 0, 30).lab,
+                                       Color.RED.lab)
+
+    def test_linear_table(self):
+        table = linear_table(24)
+        self.assertIs(table, linear_table(24))
+        self.assertEqual((table[0], table[255]), (0.0, 1.0))
+        self.assertIsNone(linear_table(60))
+
+    def test_depth_not_multiple_of_three(self):
+        table = linear_table(16)
+        self.assertEqual(len(table), 41)
+        self.assertAlmostEqual(table[40], (40 / (2 ** (16 / 3) - 1) + 0.055) **
+                               2.4 / 1.055 ** 2.4)
+        color = Color(40, 0, 0, 16)
+        for space in ('xyz', 'lab', 'oklab'):
+            self.assertEqual(
+                tuple(next(zip(*getattr(ColorArray([color]),
+                                        'to_{}_buffers'.format(space))()))),
+                getattr(color, space))
+        self.assertGreater(color.lab[0], Color(39, 0, 0, 16).lab[0])
+
+    def test_round_trip(self):
+        for color in self.colors:
+            self.assertEqual(Color.from_xyz(*color.xyz), color)
+            self.assertEqual(Color.from_lab(*color.lab), color)
+            self.assertEqual(Color.from_oklab(*color.oklab), color)
+        self.assertEqual(Color.from_lab(100, 0, 0, 30), Color(1023, 1023, 1023,
+                                                               30))
+        self.assertEqual(Color.from_lab(50, 200, 0), Color(255, 0, 130))
+
+    def test_batch(self):
+        array = ColorArray(self.colors)
+        for space in ('xyz', 'lab', 'oklab'):
+            buffers = getattr(array, 'to_{}_buffers'.format(space))()
+            for color, coordinates in zip(self.colors, zip(*buffers)):
+                self.assertEqual(coordinates, getattr(color, space))
+            self.assertEqual(
+                getattr(ColorArray, 'from_{}'.format(space))(*buffers), array)
+
+
+if __name__ == '__main__':
+    unittest.main()